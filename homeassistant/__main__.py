@@ -137,6 +137,12 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--log-no-color", action="store_true", help="Disable color logs"
     )
+    parser.add_argument(
+        "--import-workers",
+        type=int,
+        default=1,
+        help="Number of threads used to import integrations on startup",
+    )
     parser.add_argument(
         "--script", nargs=argparse.REMAINDER, help="Run one of the embedded scripts"
     )
@@ -202,6 +208,7 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        import_workers=max(1, args.import_workers),
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
@@ -78,6 +78,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.import_profile import ImportProfile
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
@@ -208,7 +209,9 @@ async def async_setup_hass(
     runtime_config: RuntimeConfig,
 ) -> core.HomeAssistant | None:
     """Set up Home Assistant."""
-    hass = core.HomeAssistant(runtime_config.config_dir)
+    hass = core.HomeAssistant(
+        runtime_config.config_dir, import_workers=runtime_config.import_workers
+    )
 
     async_enable_logging(
         hass,
@@ -355,6 +358,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_cache_uname_processor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -852,10 +856,28 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, setup_started)
     watcher.async_start()
 
+    import_profile = ImportProfile(hass)
+    await import_profile.async_load()
+
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
 
+    # Import the integrations that were slowest to import on previous
+    # startups first, so they are ready by the time their stage is set up
+    hass.async_create_background_task(
+        import_profile.async_preimport(
+            (
+                integration
+                for domain, integration in integration_cache.items()
+                if domain in domains_to_setup
+            ),
+            hass.import_executor._max_workers,  # pylint: disable=protected-access
+        ),
+        "preimport integrations",
+        eager_start=True,
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -948,7 +970,17 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    import_profile.async_update(
+        domains_to_setup,
+        hass.data[loader.DATA_IMPORT_TIMES],
+        async_get_setup_timings(hass),
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Slowest integrations to start (predicted vs actual): %s",
+            import_profile.async_report(),
+        )
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
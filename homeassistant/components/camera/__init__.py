@@ -84,6 +84,7 @@ from .const import (  # noqa: F401
 )
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
+from .still_stream import StillStreamHub
 
 if TYPE_CHECKING:
     from functools import cached_property
@@ -519,6 +520,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self._still_stream_hubs: dict[float, StillStreamHub] = {}
 
     @property
     def entity_picture(self) -> str:
@@ -668,10 +670,19 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        Clients asking for the same interval share the images fetched.
+        """
+        if (hub := self._still_stream_hubs.get(interval)) is None:
+            hub = self._still_stream_hubs[interval] = StillStreamHub(
+                self.hass, self.async_camera_image, self.content_type, interval
+            )
+        try:
+            return await hub.async_handle(request)
+        finally:
+            if not hub.has_subscribers and self._still_stream_hubs.get(interval) is hub:
+                del self._still_stream_hubs[interval]
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -0,0 +1,161 @@
+"""MJPEG streams of camera images shared between clients."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import time
+
+from aiohttp import web
+
+from homeassistant.const import CONTENT_TYPE_MULTIPART
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Subscriber:
+    """Client of a still stream, holding the next frame to send."""
+
+    __slots__ = ("_frame", "_event", "_closed", "dropped")
+
+    def __init__(self) -> None:
+        """Initialize the subscriber."""
+        self._frame: bytes | None = None
+        self._event = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+
+    @callback
+    def put(self, frame: bytes) -> None:
+        """Replace the frame to send, dropping the frame not sent yet."""
+        if self._frame is not None:
+            self.dropped += 1
+        self._frame = frame
+        self._event.set()
+
+    @callback
+    def close(self) -> None:
+        """End the stream after the frame to send."""
+        self._closed = True
+        self._event.set()
+
+    async def async_next(self) -> bytes | None:
+        """Wait for the next frame, None if the stream ended."""
+        while (frame := self._frame) is None:
+            if self._closed:
+                return None
+            self._event.clear()
+            await self._event.wait()
+        self._frame = None
+        return frame
+
+
+class StillStreamHub:
+    """MJPEG stream of the images of a camera sent to all of its clients.
+
+    The images are fetched once per interval for all clients, and every
+    frame is rendered once and the same bytes are written to each client.
+    A client that can't keep up skips to the latest frame instead of
+    holding up the other clients.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        content_type: str,
+        interval: float,
+    ) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._image_cb = image_cb
+        self._content_type = content_type
+        self._interval = interval
+        self._subscribers: set[_Subscriber] = set()
+        self._frame: bytes | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.fetches = 0
+        self.dropped = 0
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Return if clients are receiving the stream."""
+        return bool(self._subscribers)
+
+    async def async_handle(self, request: web.Request) -> web.StreamResponse:
+        """Send the stream to a client."""
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+        await response.prepare(request)
+        await self.async_send_frames(response.write)
+        return response
+
+    async def async_send_frames(
+        self, write: Callable[[bytes], Awaitable[None]]
+    ) -> None:
+        """Write the frames of the stream until it ends."""
+        subscriber = _Subscriber()
+        self._subscribers.add(subscriber)
+        if self._frame is not None:
+            subscriber.put(self._frame)
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._async_fetch_images(), "camera still stream"
+            )
+        first = True
+        try:
+            while (frame := await subscriber.async_next()) is not None:
+                await write(frame)
+                # Chrome always shows the n-1 frame:
+                # https://issues.chromium.org/issues/41199053
+                # https://issues.chromium.org/issues/40791855
+                # We send the first frame twice to ensure it shows
+                if first:
+                    await write(frame)
+                    first = False
+        finally:
+            self._subscribers.discard(subscriber)
+            self.dropped += subscriber.dropped
+
+    def _render_frame(self, img_bytes: bytes) -> bytes:
+        """Return the multipart frame of an image."""
+        return b"".join(
+            (
+                b"--frameboundary\r\nContent-Type: ",
+                self._content_type.encode("utf-8"),
+                f"\r\nContent-Length: {len(img_bytes)}\r\n\r\n".encode(),
+                img_bytes,
+                b"\r\n",
+            )
+        )
+
+    async def _async_fetch_images(self) -> None:
+        """Fetch the images and send them to the clients until all left."""
+        last_image = None
+        try:
+            while self._subscribers:
+                last_fetch = time.monotonic()
+                self.fetches += 1
+                img_bytes = await self._image_cb()
+                if not img_bytes:
+                    break
+
+                if img_bytes != last_image:
+                    last_image = img_bytes
+                    self._frame = self._render_frame(img_bytes)
+                    for subscriber in self._subscribers:
+                        subscriber.put(self._frame)
+
+                next_fetch = last_fetch + self._interval
+                now = time.monotonic()
+                if next_fetch > now:
+                    await asyncio.sleep(next_fetch - now)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error fetching image for still stream")
+        finally:
+            self._task = None
+            self._frame = None
+            for subscriber in self._subscribers:
+                subscriber.close()
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict
 from collections.abc import Awaitable, Callable
-from datetime import timedelta
+from datetime import datetime, timedelta
 import functools
 from itertools import chain
 from types import ModuleType
@@ -266,12 +266,45 @@ async def ws_get_fossil_energy_consumption(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
-    statistic_ids = set(msg["energy_statistic_ids"])
-    statistic_ids.add(msg["co2_statistic_id"])
+    # Every open energy dashboard asks for the same consumption, share the
+    # result until the statistics change
+    result = await recorder.get_instance(hass).statistics_result_cache.async_get(
+        (
+            "fossil_energy_consumption",
+            start_time,
+            end_time,
+            frozenset(msg["energy_statistic_ids"]),
+            msg["co2_statistic_id"],
+            msg["period"],
+        ),
+        False,
+        functools.partial(
+            _get_fossil_energy_consumption,
+            hass,
+            start_time,
+            end_time,
+            msg["energy_statistic_ids"],
+            msg["co2_statistic_id"],
+            msg["period"],
+        ),
+    )
+    connection.send_result(msg["id"], result)
+
+
+def _get_fossil_energy_consumption(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime,
+    energy_statistic_ids: list[str],
+    co2_statistic_id: str,
+    period: str,
+) -> dict[str, float]:
+    """Calculate amount of fossil based energy in the executor."""
+    statistic_ids = set(energy_statistic_ids)
+    statistic_ids.add(co2_statistic_id)
 
     # Fetch energy + CO2 statistics
-    statistics = await recorder.get_instance(hass).async_add_executor_job(
-        recorder.statistics.statistics_during_period,
+    statistics = recorder.statistics.statistics_during_period(
         hass,
         start_time,
         end_time,
@@ -330,13 +363,13 @@ async def ws_get_fossil_energy_consumption(
         return result
 
     merged_energy_statistics = _combine_change_statistics(
-        statistics, msg["energy_statistic_ids"]
+        statistics, energy_statistic_ids
     )
     indexed_co2_statistics = cast(
         dict[float, float],
         {
             period["start"]: period["mean"]
-            for period in statistics.get(msg["co2_statistic_id"], {})
+            for period in statistics.get(co2_statistic_id, {})
         },
     )
 
@@ -346,7 +379,8 @@ async def ws_get_fossil_energy_consumption(
         for start, delta in merged_energy_statistics.items()
     ]
 
-    if msg["period"] == "hour":
+    reduced_fossil_energy: list[dict[str, Any]]
+    if period == "hour":
         reduced_fossil_energy = [
             {
                 "start": dt_util.utc_from_timestamp(period["start"]).isoformat(),
@@ -355,7 +389,7 @@ async def ws_get_fossil_energy_consumption(
             for period in fossil_energy
         ]
 
-    elif msg["period"] == "day":
+    elif period == "day":
         _same_day_ts, _day_start_end_ts = recorder.statistics.reduce_day_ts_factory()
         reduced_fossil_energy = _reduce_deltas(
             fossil_energy,
@@ -375,5 +409,4 @@ async def ws_get_fossil_energy_consumption(
             timedelta(days=1),
         )
 
-    result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
-    connection.send_result(msg["id"], result)
+    return {period["start"]: period["delta"] for period in reduced_fossil_energy}
@@ -5,3 +5,8 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Chunked history responses fetch windows sized to return about this many
+# states, the first window covers HISTORY_CHUNK_INITIAL_WINDOW
+HISTORY_CHUNK_STATES = 10000
+HISTORY_CHUNK_INITIAL_WINDOW = 3600
@@ -39,7 +39,12 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_INITIAL_WINDOW,
+    HISTORY_CHUNK_STATES,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -104,6 +109,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -156,6 +162,21 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if msg["chunked"]:
+        await _async_send_history_chunks(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time or dt_util.utcnow(),
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -172,6 +193,111 @@ async def ws_get_history_during_period(
     )
 
 
+def _generate_history_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    complete: bool,
+) -> tuple[int, bytes | None]:
+    """Fetch a window of history and convert it to a json event in the executor.
+
+    Returns the number of states in the window and the message, or None
+    if the window is empty and there is more to come.
+    """
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    count = sum(len(state_list) for state_list in states.values())
+    if not count and not complete:
+        return count, None
+    return count, json_bytes(
+        messages.event_message(
+            msg_id,
+            {
+                "states": states,
+                "start_time": start_time.timestamp(),
+                "end_time": end_time.timestamp(),
+                "complete": complete,
+            },
+        )
+    )
+
+
+async def _async_send_history_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Send history as a series of events covering consecutive windows.
+
+    Only one window of states is held in memory at a time. The windows
+    are resized to return about HISTORY_CHUNK_STATES states each, and the
+    last event is marked complete. The client can stop the response by
+    unsubscribing.
+    """
+    instance = get_instance(hass)
+    connection.subscriptions[msg_id] = callback(lambda: None)
+    connection.send_result(msg_id)
+    window = timedelta(seconds=HISTORY_CHUNK_INITIAL_WINDOW)
+    window_start = start_time
+    # The queries exclude both ends of the window, so the following windows
+    # start just before the end of the previous one to include states
+    # recorded exactly at the boundary.
+    query_start = start_time
+    try:
+        while msg_id in connection.subscriptions:
+            window_end = min(window_start + window, end_time)
+            complete = window_end == end_time
+            count, payload = await instance.async_add_executor_job(
+                _generate_history_chunk,
+                hass,
+                msg_id,
+                query_start,
+                window_end,
+                entity_ids,
+                include_start_time_state and window_start == start_time,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                complete,
+            )
+            if payload and msg_id in connection.subscriptions:
+                connection.send_message(payload)
+            if complete:
+                return
+            window = max(
+                window * min(4.0, max(0.25, HISTORY_CHUNK_STATES / max(count, 1))),
+                timedelta(seconds=1),
+            )
+            window_start = window_end
+            query_start = window_end - timedelta(microseconds=1)
+    finally:
+        # The response is over, whether complete or failed
+        connection.subscriptions.pop(msg_id, None)
+
+
 def _generate_stream_message(
     states: MutableMapping[str, list[dict[str, Any]]],
     start_day: dt,
@@ -38,28 +38,39 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    Platform,
 )
 from homeassistant.core import Event, HomeAssistant, State, callback
-from homeassistant.helpers import event as event_helper, state as state_helper
+from homeassistant.helpers import (
+    discovery,
+    event as event_helper,
+    state as state_helper,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
     BATCH_TIMEOUT,
+    BUFFER_DIR,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
     CODE_INVALID_INPUTS,
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
     CONF_API_VERSION,
+    CONF_BATCH_SIZE,
+    CONF_BATCH_TIMEOUT,
+    CONF_BATCHING,
     CONF_BUCKET,
+    CONF_BUFFER_SIZE,
     CONF_COMPONENT_CONFIG,
     CONF_COMPONENT_CONFIG_DOMAIN,
     CONF_COMPONENT_CONFIG_GLOB,
@@ -70,14 +81,19 @@ from .const import (
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
     CONF_PRECISION,
+    CONF_QUEUE_SIZE,
     CONF_RETRY_COUNT,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
     CONF_TAGS_ATTRIBUTES,
     CONNECTION_ERROR,
     DEFAULT_API_VERSION,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BATCH_TIMEOUT,
+    DEFAULT_BUFFER_SIZE,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
+    DEFAULT_QUEUE_SIZE,
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
@@ -99,9 +115,11 @@ from .const import (
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
+    V1_PRECISION,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .writer import InfluxBatchWriter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -162,6 +180,21 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
     }
 )
 
+_BATCHING_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_BATCH_SIZE, default=DEFAULT_BATCH_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_BATCH_TIMEOUT, default=DEFAULT_BATCH_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_QUEUE_SIZE, default=DEFAULT_QUEUE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_BUFFER_SIZE, default=DEFAULT_BUFFER_SIZE): cv.positive_int,
+    }
+)
+
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
@@ -186,6 +219,7 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
         vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
             {cv.string: _CUSTOMIZE_ENTITY_SCHEMA}
         ),
+        vol.Optional(CONF_BATCHING): _BATCHING_SCHEMA,
     }
 )
 
@@ -201,8 +235,8 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
-    """Build event to json converter and add to config."""
+def _generate_state_to_json(conf: dict) -> Callable[[State], dict[str, Any] | None]:
+    """Build state to json converter, the json has no time set."""
     entity_filter = convert_include_exclude_filter(conf)
     tags = conf.get(CONF_TAGS)
     tags_attributes: list[str] = conf[CONF_TAGS_ATTRIBUTES]
@@ -216,14 +250,14 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
-    def event_to_json(event: Event) -> dict[str, Any] | None:
-        """Convert event into json in format Influx expects."""
-        state: State | None = event.data.get(EVENT_NEW_STATE)
-        if (
-            state is None
-            or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE, None)
-            or not entity_filter(state.entity_id)
-        ):
+    def state_to_json(state: State) -> dict[str, Any] | None:
+        """Convert state into json in format Influx expects."""
+        if state.state in (
+            STATE_UNKNOWN,
+            "",
+            STATE_UNAVAILABLE,
+            None,
+        ) or not entity_filter(state.entity_id):
             return None
 
         try:
@@ -272,7 +306,6 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
                 CONF_DOMAIN: state.domain,
                 CONF_ENTITY_ID: state.object_id,
             },
-            INFLUX_CONF_TIME: event.time_fired,
             INFLUX_CONF_FIELDS: {},
         }
         if _include_state:
@@ -318,6 +351,21 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
 
         return json
 
+    return state_to_json
+
+
+def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
+    """Build event to json converter and add to config."""
+    state_to_json = _generate_state_to_json(conf)
+
+    def event_to_json(event: Event) -> dict[str, Any] | None:
+        """Convert event into json in format Influx expects."""
+        state: State | None = event.data.get(EVENT_NEW_STATE)
+        if state is None or (json := state_to_json(state)) is None:
+            return None
+        json[INFLUX_CONF_TIME] = event.time_fired
+        return json
+
     return event_to_json
 
 
@@ -327,6 +375,7 @@ class InfluxClient:
 
     data_repositories: list[str]
     write: Callable[[str], None]
+    write_lines: Callable[[str], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -339,6 +388,8 @@ def get_influx_connection(  # noqa: C901
         CONF_TIMEOUT: TIMEOUT,
     }
     precision = conf.get(CONF_PRECISION)
+    # Batches of line protocol are large enough to be worth compressing
+    batching = CONF_BATCHING in conf
 
     if conf[CONF_API_VERSION] == API_VERSION_2:
         kwargs[CONF_TIMEOUT] = TIMEOUT * 1000
@@ -348,11 +399,17 @@ def get_influx_connection(  # noqa: C901
         kwargs[CONF_VERIFY_SSL] = conf[CONF_VERIFY_SSL]
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
+        if batching:
+            kwargs["enable_gzip"] = True
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
+        # Batches are written synchronously so failed writes can be buffered
+        lines_write_api = (
+            influx.write_api(write_options=SYNCHRONOUS) if batching else None
+        )
 
         def write_v2(json):
             """Write data to V2 influx."""
@@ -370,6 +427,23 @@ def get_influx_connection(  # noqa: C901
                     raise ValueError(WRITE_ERROR % (json, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
+        def write_lines_v2(lines):
+            """Write line protocol to V2 influx and wait for the result."""
+            data = {"bucket": bucket, "record": lines}
+
+            if precision is not None:
+                data["write_precision"] = precision
+
+            assert lines_write_api is not None
+            try:
+                lines_write_api.write(**data)
+            except (urllib3.exceptions.HTTPError, OSError) as exc:
+                raise ConnectionError(CONNECTION_ERROR % exc) from exc
+            except ApiException as exc:
+                if exc.status == CODE_INVALID_INPUTS:
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
+                raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
+
         def query_v2(query, _=None):
             """Query V2 influx."""
             try:
@@ -400,7 +474,7 @@ def get_influx_connection(  # noqa: C901
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(buckets, write_v2, write_lines_v2, query_v2, close_v2)
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -429,12 +503,27 @@ def get_influx_connection(  # noqa: C901
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
+    if batching:
+        kwargs["gzip"] = True
+
     influx = InfluxDBClient(**kwargs)
 
     def write_v1(json):
         """Write data to V1 influx."""
+        _write_points_v1(json, time_precision=precision)
+
+    def write_lines_v1(lines):
+        """Write line protocol to V1 influx."""
+        _write_points_v1(
+            lines,
+            time_precision=V1_PRECISION.get(precision),
+            protocol="line",
+        )
+
+    def _write_points_v1(points, **kwargs):
+        """Write points to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(points, **kwargs)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -443,7 +532,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (points, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -472,7 +561,7 @@ def get_influx_connection(  # noqa: C901
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(databases, write_v1, write_lines_v1, query_v1, close_v1)
 
 
 def _retry_setup(hass: HomeAssistant, config: ConfigType) -> None:
@@ -491,10 +580,25 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
-    max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
-    instance.start()
+    instance: InfluxThread | InfluxBatchWriter
+    if (batching := conf.get(CONF_BATCHING)) is not None:
+        instance = hass.data[DOMAIN] = InfluxBatchWriter(
+            hass,
+            influx,
+            _generate_state_to_json(conf),
+            conf.get(CONF_PRECISION),
+            batching,
+            hass.config.path(STORAGE_DIR, BUFFER_DIR),
+        )
+        instance.start()
+        discovery.load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    else:
+        event_to_json = _generate_event_to_json(conf)
+        max_tries = conf.get(CONF_RETRY_COUNT)
+        instance = hass.data[DOMAIN] = InfluxThread(
+            hass, influx, event_to_json, max_tries
+        )
+        instance.start()
 
     def shutdown(event):
         """Shut down the thread."""
@@ -33,6 +33,11 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_BATCHING = "batching"
+CONF_BATCH_SIZE = "batch_size"
+CONF_BATCH_TIMEOUT = "batch_timeout"
+CONF_QUEUE_SIZE = "queue_size"
+CONF_BUFFER_SIZE = "buffer_size"
 
 CONF_QUERIES = "queries"
 CONF_QUERIES_FLUX = "queries_flux"
@@ -59,6 +64,10 @@ DEFAULT_RANGE_START = "-15m"
 DEFAULT_RANGE_STOP = "now()"
 DEFAULT_FUNCTION_FLUX = "|> limit(n: 1)"
 DEFAULT_MEASUREMENT_ATTR = "unit_of_measurement"
+DEFAULT_BATCH_SIZE = 5000
+DEFAULT_BATCH_TIMEOUT = 1
+DEFAULT_QUEUE_SIZE = 50000
+DEFAULT_BUFFER_SIZE = 100  # MiB
 
 INFLUX_CONF_MEASUREMENT = "measurement"
 INFLUX_CONF_TAGS = "tags"
@@ -78,6 +87,7 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+BUFFER_DIR = "influxdb_buffer"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -86,6 +96,9 @@ CODE_INVALID_INPUTS = 400
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=10)
 
+# Precisions of the V1 API, named like those of the V2 API in the config
+V1_PRECISION = {"ms": "ms", "s": "s", "us": "u", "ns": "n"}
+
 RE_DIGIT_TAIL = re.compile(r"^[^\.]*\d+\.?\d+[^\.]*$")
 RE_DECIMAL = re.compile(r"[^\d.]+")
 
@@ -120,6 +133,10 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+QUEUE_FULL_MESSAGE = "Queue is full, dropping events until InfluxDB catches up."
+BUFFERING_MESSAGE = "%s Buffering events on disk until it can be reached again."
+BUFFER_FULL_MESSAGE = "Buffer on disk is full, dropped %d old events."
+RESUMED_BUFFER_MESSAGE = "Resumed, writing %d buffered events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
@@ -0,0 +1,93 @@
+"""Encode states to the InfluxDB line protocol."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+from functools import lru_cache
+import math
+from typing import Any
+
+from homeassistant.core import State
+from homeassistant.util import dt as dt_util
+
+from .const import INFLUX_CONF_FIELDS, INFLUX_CONF_MEASUREMENT, INFLUX_CONF_TAGS
+
+_EPOCH = dt_util.utc_from_timestamp(0)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Divisor and multiplier of a timestamp in microseconds for each precision
+_PRECISION_SCALE = {
+    None: (1, 1000),
+    "ns": (1, 1000),
+    "us": (1, 1),
+    "ms": (1000, 1),
+    "s": (1_000_000, 1),
+}
+
+
+@lru_cache(maxsize=4096)
+def _escape_key(value: str) -> str:
+    """Escape a measurement, tag key, tag value or field key.
+
+    The same few names and tag values are written over and over again.
+    """
+    return (
+        value.replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _field_value(value: Any) -> str | None:
+    """Return a field value in line protocol, None if it can't be written."""
+    if isinstance(value, float):
+        return repr(value) if math.isfinite(value) else None
+    if isinstance(value, str):
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{escaped}"'
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, int):
+        return f"{value}i"
+    if value is None:
+        return None
+    return repr(float(value))
+
+
+def generate_state_to_line(
+    state_to_json: Callable[[State], dict[str, Any] | None], precision: str | None
+) -> Callable[[State], str | None]:
+    """Build a state to line protocol encoder.
+
+    Produces the same line the InfluxDB clients write for the json of the
+    state, without building the intermediate point objects of the clients.
+    """
+    divisor, multiplier = _PRECISION_SCALE[precision]
+
+    def state_to_line(state: State) -> str | None:
+        """Encode a state, None if it isn't written."""
+        if (json := state_to_json(state)) is None:
+            return None
+
+        tags = json[INFLUX_CONF_TAGS]
+        tag_text = "".join(
+            f",{_escape_key(key)}={_escape_key(str(value))}"
+            for key in sorted(tags)
+            if key and (value := tags[key]) is not None and value != ""
+        )
+        fields = json[INFLUX_CONF_FIELDS]
+        field_text = ",".join(
+            f"{_escape_key(key)}={value}"
+            for key in sorted(fields)
+            if key and (value := _field_value(fields[key])) is not None
+        )
+        timestamp = (state.last_updated - _EPOCH) // _MICROSECOND
+        return (
+            f"{_escape_key(str(json[INFLUX_CONF_MEASUREMENT]))}{tag_text}"
+            f" {field_text} {timestamp // divisor * multiplier}"
+        )
+
+    return state_to_line
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import datetime
 import logging
 from typing import Final
@@ -11,6 +13,8 @@ import voluptuous as vol
 from homeassistant.components.sensor import (
     PLATFORM_SCHEMA as SENSOR_PLATFORM_SCHEMA,
     SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.const import (
     CONF_API_VERSION,
@@ -20,6 +24,7 @@ from homeassistant.const import (
     CONF_UNIT_OF_MEASUREMENT,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_STOP,
+    EntityCategory,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import PlatformNotReady, TemplateError
@@ -50,6 +55,7 @@ from .const import (
     DEFAULT_GROUP_FUNCTION,
     DEFAULT_RANGE_START,
     DEFAULT_RANGE_STOP,
+    DOMAIN,
     INFLUX_CONF_VALUE,
     INFLUX_CONF_VALUE_V2,
     LANGUAGE_FLUX,
@@ -65,12 +71,45 @@ from .const import (
     RENDERING_WHERE_MESSAGE,
     RUNNING_QUERY_MESSAGE,
 )
+from .writer import InfluxBatchWriter
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL: Final = datetime.timedelta(seconds=60)
 
 
+@dataclass(frozen=True, kw_only=True)
+class InfluxWriterSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor of the batching writer."""
+
+    value_fn: Callable[[InfluxBatchWriter], int]
+
+
+WRITER_SENSORS: tuple[InfluxWriterSensorEntityDescription, ...] = (
+    InfluxWriterSensorEntityDescription(
+        key="queue_depth",
+        name="InfluxDB queue depth",
+        native_unit_of_measurement="events",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda writer: writer.queue.qsize(),
+    ),
+    InfluxWriterSensorEntityDescription(
+        key="buffered_events",
+        name="InfluxDB buffered events",
+        native_unit_of_measurement="events",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda writer: writer.buffer.events,
+    ),
+    InfluxWriterSensorEntityDescription(
+        key="dropped_events",
+        name="InfluxDB dropped events",
+        native_unit_of_measurement="events",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda writer: writer.dropped,
+    ),
+)
+
+
 def _merge_connection_config_into_query(conf, query):
     """Merge connection details into each configured query."""
     for key in conf:
@@ -162,6 +201,13 @@ def setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the InfluxDB component."""
+    if discovery_info is not None:
+        writer: InfluxBatchWriter = hass.data[DOMAIN]
+        add_entities(
+            InfluxWriterSensor(writer, description) for description in WRITER_SENSORS
+        )
+        return
+
     try:
         influx = get_influx_connection(config, test_read=True)
     except ConnectionError as exc:
@@ -257,6 +303,27 @@ class InfluxSensor(SensorEntity):
         self._state = value
 
 
+class InfluxWriterSensor(SensorEntity):
+    """Sensor of the state of the batching writer."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: InfluxWriterSensorEntityDescription
+
+    def __init__(
+        self,
+        writer: InfluxBatchWriter,
+        description: InfluxWriterSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self._writer = writer
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> int:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self._writer)
+
+
 class InfluxFluxSensorData:
     """Class for handling the data retrieval from Influx with Flux query."""
 
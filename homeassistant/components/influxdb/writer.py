@@ -0,0 +1,290 @@
+"""Batching writer of states to InfluxDB."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from contextlib import suppress
+import gzip
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any
+import zlib
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
+
+from .const import (
+    BUFFER_FULL_MESSAGE,
+    BUFFERING_MESSAGE,
+    CONF_BATCH_SIZE,
+    CONF_BATCH_TIMEOUT,
+    CONF_BUFFER_SIZE,
+    CONF_QUEUE_SIZE,
+    DOMAIN,
+    EVENT_NEW_STATE,
+    QUEUE_FULL_MESSAGE,
+    RESUMED_BUFFER_MESSAGE,
+    RETRY_DELAY,
+    WROTE_MESSAGE,
+)
+from .line_protocol import generate_state_to_line
+
+_LOGGER = logging.getLogger(__name__)
+
+BUFFER_SUFFIX = ".lp.gz"
+
+
+class WriteBuffer:
+    """Batches of line protocol waiting on disk until they can be written.
+
+    Every batch is a compressed file named after its sequence number and the
+    number of events in it. When the buffer is full the oldest batches are
+    dropped to make room for the new ones.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the buffer."""
+        self.path = path
+        self.max_size = max_size
+        self.size = 0
+        self.events = 0
+        self.dropped = 0
+        # File name, size and number of events of each batch, oldest first
+        self._batches: deque[tuple[str, int, int]] = deque()
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        """Return the number of batches in the buffer."""
+        return len(self._batches)
+
+    def load(self) -> None:
+        """Pick up the batches left by a previous run."""
+        try:
+            names = sorted(
+                name for name in os.listdir(self.path) if name.endswith(BUFFER_SUFFIX)
+            )
+        except FileNotFoundError:
+            return
+        for name in names:
+            try:
+                sequence, events = name.removesuffix(BUFFER_SUFFIX).split("-")
+                self._sequence = int(sequence)
+                batch = (name, os.path.getsize(self._file(name)), int(events))
+            except (ValueError, OSError):
+                _LOGGER.warning("Ignoring unexpected file %s in the buffer", name)
+                continue
+            self._batches.append(batch)
+            self.size += batch[1]
+            self.events += batch[2]
+
+    def append(self, lines: str, events: int) -> None:
+        """Add a batch, dropping the oldest batches if the buffer is full."""
+        data = gzip.compress(lines.encode("utf-8"), compresslevel=1)
+        if len(data) > self.max_size:
+            self.dropped += events
+            _LOGGER.warning(BUFFER_FULL_MESSAGE, events)
+            return
+        dropped = 0
+        while self.size + len(data) > self.max_size:
+            dropped += self._batches[0][2]
+            self.pop()
+        if dropped:
+            self.dropped += dropped
+            _LOGGER.warning(BUFFER_FULL_MESSAGE, dropped)
+
+        self._sequence += 1
+        name = f"{self._sequence:016d}-{events}{BUFFER_SUFFIX}"
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(self._file(name), "wb") as file:
+                file.write(data)
+        except OSError as err:
+            self.dropped += events
+            _LOGGER.error("Could not buffer %d events: %s", events, err)
+            return
+        self._batches.append((name, len(data), events))
+        self.size += len(data)
+        self.events += events
+
+    def peek(self) -> tuple[str, int] | None:
+        """Return the lines and number of events of the oldest batch."""
+        while self._batches:
+            name, _, events = self._batches[0]
+            try:
+                with open(self._file(name), "rb") as file:
+                    return gzip.decompress(file.read()).decode("utf-8"), events
+            except (OSError, EOFError, UnicodeDecodeError, zlib.error) as err:
+                _LOGGER.error("Dropping unreadable buffered batch %s: %s", name, err)
+                self.dropped += events
+                self.pop()
+        return None
+
+    def pop(self) -> None:
+        """Remove the oldest batch."""
+        name, size, events = self._batches.popleft()
+        self.size -= size
+        self.events -= events
+        with suppress(FileNotFoundError):
+            os.unlink(self._file(name))
+
+    def _file(self, name: str) -> str:
+        """Return the path of a batch file."""
+        return os.path.join(self.path, name)
+
+
+class InfluxBatchWriter(threading.Thread):
+    """A threaded writer of batches of line protocol.
+
+    States are queued by the event listener, a full queue drops new states
+    instead of growing without bounds. Batches that can't be written while
+    InfluxDB is unreachable are buffered on disk and written in order once
+    it can be reached again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        influx: Any,
+        state_to_json: Callable[[State], dict[str, Any] | None],
+        precision: str | None,
+        batching: dict[str, Any],
+        buffer_path: str,
+    ) -> None:
+        """Initialize the writer."""
+        threading.Thread.__init__(self, name=DOMAIN)
+        self.queue: queue.Queue[threading.Event | State | None] = queue.Queue(
+            batching[CONF_QUEUE_SIZE]
+        )
+        self.influx = influx
+        self.state_to_line = generate_state_to_line(state_to_json, precision)
+        self.batch_size: int = batching[CONF_BATCH_SIZE]
+        self.batch_timeout: float = batching[CONF_BATCH_TIMEOUT]
+        self.buffer = WriteBuffer(buffer_path, batching[CONF_BUFFER_SIZE] * 1024**2)
+        self.queue_dropped = 0
+        self.rejected = 0
+        self.shutdown = False
+        self._queue_full = False
+        self._write_error: ConnectionError | None = None
+        self._retry_at = 0.0
+        self._waiters: list[threading.Event] = []
+        hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of events that were not written."""
+        return self.queue_dropped + self.buffer.dropped + self.rejected
+
+    @callback
+    def _event_listener(self, event: Event) -> None:
+        """Queue the new state of a change for Influx."""
+        if (state := event.data[EVENT_NEW_STATE]) is None:
+            return
+        try:
+            self.queue.put_nowait(state)
+        except queue.Full:
+            self.queue_dropped += 1
+            if not self._queue_full:
+                self._queue_full = True
+                _LOGGER.warning(QUEUE_FULL_MESSAGE)
+
+    def _get_lines(self, wait: bool) -> list[str]:
+        """Return the lines of the next batch.
+
+        Waits for the first state and up to the batch timeout for the rest
+        of the batch, unless buffered batches are to be written.
+        """
+        lines: list[str] = []
+        deadline: float | None = None
+        with suppress(queue.Empty):
+            while len(lines) < self.batch_size:
+                if not wait:
+                    item = self.queue.get_nowait()
+                elif deadline is None:
+                    # Wake up to retry writing the buffered batches
+                    timeout = (
+                        max(self._retry_at - time.monotonic(), 0)
+                        if self.buffer
+                        else None
+                    )
+                    item = self.queue.get(timeout=timeout)
+                elif (timeout := deadline - time.monotonic()) > 0:
+                    item = self.queue.get(timeout=timeout)
+                else:
+                    break
+
+                if item is None:
+                    self.shutdown = True
+                    break
+                if isinstance(item, threading.Event):
+                    # Waiters are released once the batch is handled
+                    self._waiters.append(item)
+                    break
+                if deadline is None:
+                    deadline = time.monotonic() + self.batch_timeout
+                if (line := self.state_to_line(item)) is not None:
+                    lines.append(line)
+
+        if self._queue_full and self.queue.empty():
+            self._queue_full = False
+        return lines
+
+    def _write(self, lines: str, events: int) -> bool:
+        """Write a batch, return False if InfluxDB can't be reached."""
+        try:
+            self.influx.write_lines(lines)
+        except ValueError as err:
+            _LOGGER.error(err)
+            self.rejected += events
+        except ConnectionError as err:
+            if self._write_error is None:
+                _LOGGER.error(BUFFERING_MESSAGE, err)
+            self._write_error = err
+            self._retry_at = time.monotonic() + RETRY_DELAY
+            return False
+        else:
+            _LOGGER.debug(WROTE_MESSAGE, events)
+        if self._write_error is not None:
+            _LOGGER.warning(RESUMED_BUFFER_MESSAGE, self.buffer.events)
+            self._write_error = None
+        return True
+
+    def _write_or_buffer(self, lines: list[str]) -> None:
+        """Write a batch or buffer it behind the batches waiting on disk."""
+        payload = "\n".join(lines)
+        if self.buffer or not self._write(payload, len(lines)):
+            self.buffer.append(payload, len(lines))
+
+    def _write_buffered(self) -> None:
+        """Write the oldest buffered batch."""
+        if (batch := self.buffer.peek()) is not None and self._write(*batch):
+            self.buffer.pop()
+
+    def run(self) -> None:
+        """Process the queued states."""
+        self.buffer.load()
+        while not self.shutdown:
+            write_buffered = bool(self.buffer) and time.monotonic() >= self._retry_at
+            if lines := self._get_lines(wait=not write_buffered):
+                self._write_or_buffer(lines)
+            if write_buffered:
+                self._write_buffered()
+            if not self.buffer or time.monotonic() < self._retry_at:
+                for waiter in self._waiters:
+                    waiter.set()
+                self._waiters.clear()
+
+        for waiter in self._waiters:
+            waiter.set()
+
+    def block_till_done(self) -> None:
+        """Block till all queued states are written or buffered.
+
+        Currently only used for testing.
+        """
+        event = threading.Event()
+        self.queue.put(event)
+        event.wait()
@@ -156,6 +156,11 @@ class EventProcessor:
                     instance.event_type_manager.get_many(self.event_types, session)
                 )
             )
+            context_origins_since: float | None = None
+            if self.entity_ids or self.device_ids:
+                context_origins_since = (
+                    instance.context_origins_manager.get_indexed_since(session)
+                )
             stmt = statement_for_request(
                 start_day,
                 end_day,
@@ -165,6 +170,7 @@ class EventProcessor:
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                context_origins_since,
             )
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
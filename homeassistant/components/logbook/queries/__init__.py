@@ -26,10 +26,19 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    context_origins_since: float | None = None,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    The origins of the contexts of entity and device rows are looked up in
+    the context origins table when it covers the whole requested period,
+    which starts at context_origins_since.
+    """
     start_day = start_day_dt.timestamp()
     end_day = end_day_dt.timestamp()
+    use_context_origins = (
+        context_origins_since is not None and context_origins_since <= start_day
+    )
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
@@ -56,6 +65,7 @@ def statement_for_request(
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
             [json_dumps(device_id) for device_id in device_ids],
+            use_context_origins,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -66,6 +76,7 @@ def statement_for_request(
             event_type_ids,
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
+            use_context_origins,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
@@ -75,4 +86,5 @@ def statement_for_request(
         end_day,
         event_type_ids,
         [json_dumps(device_id) for device_id in device_ids],
+        use_context_origins,
     )
@@ -8,7 +8,7 @@ import sqlalchemy
 from sqlalchemy import select
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import CTE, Select
 
 from homeassistant.components.recorder.db_schema import (
     EVENTS_CONTEXT_ID_BIN_INDEX,
@@ -17,6 +17,7 @@ from homeassistant.components.recorder.db_schema import (
     SHARED_ATTRS_JSON,
     SHARED_DATA_OR_LEGACY_EVENT_DATA,
     STATES_CONTEXT_ID_BIN_INDEX,
+    ContextOrigins,
     EventData,
     Events,
     EventTypes,
@@ -142,6 +143,34 @@ def select_states_context_only() -> Select:
     )
 
 
+def select_context_origins(context_ids: CTE) -> tuple[Select, Select]:
+    """Generate the events and states selects for the origin rows of contexts.
+
+    The origin of each context is looked up in the context origins table
+    so only the first row of every context is returned instead of every
+    event and state that shares the context.
+    """
+    origins = (
+        select()
+        .select_from(context_ids)
+        .join(
+            ContextOrigins,
+            context_ids.c.context_id_bin == ContextOrigins.context_id_bin,
+        )
+    )
+    return (
+        origins.add_columns(*EVENT_ROWS_NO_STATES, CONTEXT_ONLY)
+        .join(Events, ContextOrigins.event_id == Events.event_id)
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+        .outerjoin(EventData, (Events.data_id == EventData.data_id)),
+        origins.add_columns(
+            *EVENT_COLUMNS_FOR_STATE_SELECT, *STATE_CONTEXT_ONLY_COLUMNS, CONTEXT_ONLY
+        )
+        .join(States, ContextOrigins.state_id == States.state_id)
+        .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id)),
+    )
+
+
 def select_events_without_states(
     start_day: float, end_day: float, event_type_ids: tuple[int, ...]
 ) -> Select:
@@ -22,6 +22,7 @@ from homeassistant.components.recorder.db_schema import (
 from .common import (
     apply_events_context_hints,
     apply_states_context_hints,
+    select_context_origins,
     select_events_context_id_subquery,
     select_events_context_only,
     select_events_without_states,
@@ -75,13 +76,43 @@ def _apply_devices_context_union(
     )
 
 
+def _apply_devices_context_origins_union(
+    sel: Select,
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    json_quotable_device_ids: list[str],
+) -> CompoundSelect:
+    """Generate a CTE to find the device context ids and a query to find their origin."""
+    devices_cte: CTE = _select_device_id_context_ids_sub_query(
+        start_day,
+        end_day,
+        event_type_ids,
+        json_quotable_device_ids,
+    ).cte()
+    return sel.union_all(*select_context_origins(devices_cte))
+
+
 def devices_stmt(
     start_day: float,
     end_day: float,
     event_type_ids: tuple[int, ...],
     json_quotable_device_ids: list[str],
+    use_context_origins: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple devices."""
+    if use_context_origins:
+        return lambda_stmt(
+            lambda: _apply_devices_context_origins_union(
+                select_events_without_states(start_day, end_day, event_type_ids).where(
+                    apply_event_device_id_matchers(json_quotable_device_ids)
+                ),
+                start_day,
+                end_day,
+                event_type_ids,
+                json_quotable_device_ids,
+            ).order_by(Events.time_fired_ts)
+        )
     stmt = lambda_stmt(
         lambda: _apply_devices_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
@@ -25,6 +25,7 @@ from .common import (
     apply_events_context_hints,
     apply_states_context_hints,
     apply_states_filters,
+    select_context_origins,
     select_events_context_id_subquery,
     select_events_context_only,
     select_events_without_states,
@@ -93,14 +94,50 @@ def _apply_entities_context_union(
     )
 
 
+def _apply_entities_context_origins_union(
+    sel: Select,
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    states_metadata_ids: Collection[int],
+    json_quoted_entity_ids: list[str],
+) -> CompoundSelect:
+    """Generate a CTE to find the entity context ids and a query to find their origin."""
+    entities_cte: CTE = _select_entities_context_ids_sub_query(
+        start_day,
+        end_day,
+        event_type_ids,
+        states_metadata_ids,
+        json_quoted_entity_ids,
+    ).cte()
+    return sel.union_all(
+        states_select_for_entity_ids(start_day, end_day, states_metadata_ids),
+        *select_context_origins(entities_cte),
+    )
+
+
 def entities_stmt(
     start_day: float,
     end_day: float,
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
+    use_context_origins: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
+    if use_context_origins:
+        return lambda_stmt(
+            lambda: _apply_entities_context_origins_union(
+                select_events_without_states(start_day, end_day, event_type_ids).where(
+                    apply_event_entity_id_matchers(json_quoted_entity_ids)
+                ),
+                start_day,
+                end_day,
+                event_type_ids,
+                states_metadata_ids,
+                json_quoted_entity_ids,
+            ).order_by(Events.time_fired_ts)
+        )
     return lambda_stmt(
         lambda: _apply_entities_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
@@ -20,6 +20,7 @@ from homeassistant.components.recorder.db_schema import (
 from .common import (
     apply_events_context_hints,
     apply_states_context_hints,
+    select_context_origins,
     select_events_context_id_subquery,
     select_events_context_only,
     select_events_without_states,
@@ -101,6 +102,30 @@ def _apply_entities_devices_context_union(
     )
 
 
+def _apply_entities_devices_context_origins_union(
+    sel: Select,
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    states_metadata_ids: Collection[int],
+    json_quoted_entity_ids: list[str],
+    json_quoted_device_ids: list[str],
+) -> CompoundSelect:
+    """Generate a CTE to find the entity and device context ids and a query to find their origin."""
+    devices_entities_cte: CTE = _select_entities_device_id_context_ids_sub_query(
+        start_day,
+        end_day,
+        event_type_ids,
+        states_metadata_ids,
+        json_quoted_entity_ids,
+        json_quoted_device_ids,
+    ).cte()
+    return sel.union_all(
+        states_select_for_entity_ids(start_day, end_day, states_metadata_ids),
+        *select_context_origins(devices_entities_cte),
+    )
+
+
 def entities_devices_stmt(
     start_day: float,
     end_day: float,
@@ -108,8 +133,25 @@ def entities_devices_stmt(
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    use_context_origins: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
+    if use_context_origins:
+        return lambda_stmt(
+            lambda: _apply_entities_devices_context_origins_union(
+                select_events_without_states(start_day, end_day, event_type_ids).where(
+                    _apply_event_entity_id_device_id_matchers(
+                        json_quoted_entity_ids, json_quoted_device_ids
+                    )
+                ),
+                start_day,
+                end_day,
+                event_type_ids,
+                states_metadata_ids,
+                json_quoted_entity_ids,
+                json_quoted_device_ids,
+            ).order_by(Events.time_fired_ts)
+        )
     stmt = lambda_stmt(
         lambda: _apply_entities_devices_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
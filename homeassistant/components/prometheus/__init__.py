@@ -4,13 +4,16 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from contextlib import suppress
+import gzip
 import logging
 import string
 from typing import Any, TypeVar, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
+from prometheus_client.exposition import choose_encoder, gzip_accepted
 from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.openmetrics import exposition as openmetrics
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -26,7 +29,7 @@ from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
 )
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES, ATTR_HUMIDITY
 from homeassistant.components.light import ATTR_BRIGHTNESS
 from homeassistant.components.sensor import SensorDeviceClass
@@ -62,11 +65,16 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import CachedMetric, ExpositionCache
+
 _MetricBaseT = TypeVar("_MetricBaseT", bound=MetricWrapperBase)
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
 
+# Size of the pieces the exposition is written to the response in
+STREAM_CHUNK_SIZE = 64 * 1024
+
 DOMAIN = "prometheus"
 CONF_FILTER = "filter"
 CONF_REQUIRES_AUTH = "requires_auth"
@@ -76,6 +84,7 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_PRERENDER = "prerender"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -89,6 +98,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_FILTER, default={}): entityfilter.FILTER_SCHEMA,
                 vol.Optional(CONF_PROM_NAMESPACE, default=DEFAULT_NAMESPACE): cv.string,
                 vol.Optional(CONF_REQUIRES_AUTH, default=True): cv.boolean,
+                vol.Optional(CONF_PRERENDER, default=False): cv.boolean,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
@@ -109,9 +119,10 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
+    exposition_cache = ExpositionCache() if conf[CONF_PRERENDER] else None
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], exposition_cache))
+
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
     climate_units = hass.config.units.temperature_unit
@@ -130,6 +141,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         component_config,
         override_metric,
         default_metric,
+        exposition_cache,
     )
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
@@ -156,6 +168,7 @@ class PrometheusMetrics:
         component_config: EntityValues,
         override_metric: str | None,
         default_metric: str | None,
+        exposition_cache: ExpositionCache | None = None,
     ) -> None:
         """Initialize Prometheus Metrics."""
         self._component_config = component_config
@@ -177,8 +190,10 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
-        self._metrics: dict[str, MetricWrapperBase] = {}
+        self._metrics: dict[str, MetricWrapperBase | CachedMetric] = {}
         self._climate_units = climate_units
+        # The metrics are rendered by the cache instead of prometheus_client
+        self._exposition_cache = exposition_cache
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
         """Handle new messages from the bus."""
@@ -258,7 +273,10 @@ class PrometheusMetrics:
         self, entity_id: str, friendly_name: str | None = None
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
-        for metric in self._metrics.values():
+        if self._exposition_cache is not None:
+            self._exposition_cache.remove_entity(entity_id, friendly_name)
+            return
+        for metric in cast(dict[str, MetricWrapperBase], self._metrics).values():
             for sample in cast(list[prometheus_client.Metric], metric.collect())[
                 0
             ].samples:
@@ -304,6 +322,14 @@ class PrometheusMetrics:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
+            if self._exposition_cache is not None:
+                self._metrics[metric] = self._exposition_cache.metric(
+                    full_metric_name,
+                    documentation,
+                    labels,
+                    factory is prometheus_client.Counter,
+                )
+                return cast(_MetricBaseT, self._metrics[metric])
             self._metrics[metric] = factory(
                 full_metric_name,
                 documentation,
@@ -723,15 +749,47 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(
+        self, requires_auth: bool, exposition_cache: ExpositionCache | None = None
+    ) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._exposition_cache = exposition_cache
 
-    async def get(self, request: web.Request) -> web.Response:
+    async def get(self, request: web.Request) -> web.StreamResponse:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
-
-        return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+        hass = request.app[KEY_HASS]
+        encoder, content_type = choose_encoder(request.headers.get(hdrs.ACCEPT, ""))
+        open_metrics = encoder is openmetrics.generate_latest
+        compress = gzip_accepted(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        encode_entities = (
+            self._exposition_cache.async_snapshot(open_metrics)
+            if self._exposition_cache is not None
+            else None
         )
+
+        def _generate_body() -> bytes:
+            body = encoder(prometheus_client.REGISTRY)
+            if encode_entities is not None:
+                if open_metrics:
+                    body = (
+                        body.removesuffix(b"# EOF\n") + encode_entities() + b"# EOF\n"
+                    )
+                else:
+                    body += encode_entities()
+            return gzip.compress(body, compresslevel=6) if compress else body
+
+        body = await hass.async_add_executor_job(_generate_body)
+        response = web.StreamResponse()
+        if open_metrics:
+            response.headers[hdrs.CONTENT_TYPE] = content_type
+        else:
+            response.content_type = CONTENT_TYPE_TEXT_PLAIN
+        if compress:
+            response.headers[hdrs.CONTENT_ENCODING] = "gzip"
+        await response.prepare(request)
+        for start in range(0, len(body), STREAM_CHUNK_SIZE):
+            await response.write(body[start : start + STREAM_CHUNK_SIZE])
+        await response.write_eof()
+        return response
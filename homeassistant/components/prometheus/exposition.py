@@ -0,0 +1,246 @@
+"""Pre-rendered exposition of the Prometheus entity metrics."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import threading
+import time
+from typing import Any
+
+from prometheus_client.utils import floatToGoString
+
+from homeassistant.core import callback
+
+
+def _escape(value: str) -> str:
+    """Escape a label value or help text."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+class _CachedChild:
+    """Sample of a labelset of a pre-rendered metric."""
+
+    __slots__ = ("metric", "entity_id", "labelvalues", "label_text", "value", "created")
+
+    def __init__(
+        self, metric: CachedMetric, labelvalues: tuple[str, ...], label_text: str
+    ) -> None:
+        """Initialize the sample."""
+        self.metric = metric
+        self.entity_id = labelvalues[0]
+        self.labelvalues = labelvalues
+        self.label_text = label_text
+        self.value = 0.0
+        self.created = time.time()
+
+    def set(self, value: float) -> None:
+        """Set the value of a gauge."""
+        with self.metric.lock:
+            self.value = float(value)
+            self.metric.mark_changed(self.entity_id)
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the value of a counter."""
+        with self.metric.lock:
+            self.value += amount
+            self.metric.mark_changed(self.entity_id)
+
+
+class CachedMetric:
+    """Metric of entities rendered to exposition lines once per change.
+
+    Implements the part of the prometheus_client metric API used to record
+    the entity metrics. The lines of each entity are kept and only the
+    entities that changed since the last scrape are rendered again.
+
+    The metrics are recorded by the bus listeners in the executor while
+    the scrapes render them in the event loop, so all changes are made
+    holding the lock of the cache.
+    """
+
+    def __init__(
+        self,
+        cache: ExpositionCache,
+        name: str,
+        documentation: str,
+        labelnames: list[str],
+        counter: bool,
+    ) -> None:
+        """Initialize the metric, the first label must be the entity id."""
+        self._cache = cache
+        self.lock: threading.Lock = cache.lock
+        self._labelnames = labelnames
+        self._sorted_labels = sorted(range(len(labelnames)), key=labelnames.__getitem__)
+        self._friendly_name_idx = labelnames.index("friendly_name")
+        self._counter = counter
+        self._children: dict[tuple[str, ...], _CachedChild] = {}
+        self._entity_children: dict[str, list[_CachedChild]] = {}
+        # Rendered samples, created samples and OpenMetrics lines per entity
+        self._lines: dict[str, tuple[str, str, str]] = {}
+        self._changed: set[str] = set()
+        help_text = _escape(documentation)
+        if counter:
+            name = name.removesuffix("_total")
+            self._sample_name = f"{name}_total"
+            self._text_header = (
+                f"# HELP {name}_total {help_text}\n# TYPE {name}_total counter\n"
+            )
+            self._created_header = (
+                f"# HELP {name}_created {help_text}\n# TYPE {name}_created gauge\n"
+            )
+            self._openmetrics_header = (
+                f"# HELP {name} {help_text}\n# TYPE {name} counter\n"
+            )
+        else:
+            self._sample_name = name
+            self._text_header = f"# HELP {name} {help_text}\n# TYPE {name} gauge\n"
+            self._created_header = ""
+            self._openmetrics_header = self._text_header
+        self._name = name
+
+    def labels(self, **labels: Any) -> _CachedChild:
+        """Return the sample of a labelset."""
+        labelvalues = tuple(str(labels[name]) for name in self._labelnames)
+        if (child := self._children.get(labelvalues)) is not None:
+            return child
+        label_text = ",".join(
+            f'{self._labelnames[idx]}="{_escape(labelvalues[idx])}"'
+            for idx in self._sorted_labels
+        )
+        with self.lock:
+            if (child := self._children.get(labelvalues)) is None:
+                child = self._children[labelvalues] = _CachedChild(
+                    self, labelvalues, f"{{{label_text}}}"
+                )
+                self._entity_children.setdefault(child.entity_id, []).append(child)
+        return child
+
+    def mark_changed(self, entity_id: str) -> None:
+        """Mark the lines of an entity to be rendered again.
+
+        Must be called holding the lock.
+        """
+        self._changed.add(entity_id)
+        self._cache.generation += 1
+
+    def remove_entity(self, entity_id: str, friendly_name: str | None) -> None:
+        """Remove the samples of an entity, only those with the name if given."""
+        with self.lock:
+            if (children := self._entity_children.get(entity_id)) is None:
+                return
+            keep: list[_CachedChild] = []
+            for child in children:
+                if (
+                    friendly_name
+                    and child.labelvalues[self._friendly_name_idx] != friendly_name
+                ):
+                    keep.append(child)
+                else:
+                    del self._children[child.labelvalues]
+            if keep:
+                self._entity_children[entity_id] = keep
+            else:
+                del self._entity_children[entity_id]
+            self.mark_changed(entity_id)
+
+    def _render(self, entity_id: str) -> None:
+        """Render the lines of an entity."""
+        if (children := self._entity_children.get(entity_id)) is None:
+            self._lines.pop(entity_id, None)
+            return
+        name = self._sample_name
+        samples = [
+            f"{name}{child.label_text} {floatToGoString(child.value)}\n"  # type: ignore[no-untyped-call]
+            for child in children
+        ]
+        if not self._counter:
+            lines = "".join(samples)
+            self._lines[entity_id] = (lines, "", lines)
+            return
+        created = [
+            f"{self._name}_created{child.label_text} "
+            f"{floatToGoString(child.created)}\n"  # type: ignore[no-untyped-call]
+            for child in children
+        ]
+        self._lines[entity_id] = (
+            "".join(samples),
+            "".join(created),
+            "".join(
+                f"{sample}{created_sample}"
+                for sample, created_sample in zip(samples, created, strict=True)
+            ),
+        )
+
+    def chunks(self, open_metrics: bool) -> list[str]:
+        """Render the changed entities and return the lines of the metric.
+
+        Must be called holding the lock.
+        """
+        if self._changed:
+            changed, self._changed = self._changed, set()
+            for entity_id in changed:
+                self._render(entity_id)
+        lines = self._lines.values()
+        if open_metrics:
+            return [self._openmetrics_header, *(entity[2] for entity in lines)]
+        if not self._counter:
+            return [self._text_header, *(entity[0] for entity in lines)]
+        return [
+            self._text_header,
+            *(entity[0] for entity in lines),
+            self._created_header,
+            *(entity[1] for entity in lines),
+        ]
+
+
+class ExpositionCache:
+    """Exposition of the entity metrics, kept rendered between scrapes."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        # Held to change or render the samples
+        self.lock = threading.Lock()
+        # Increased on every change of a sample
+        self.generation = 0
+        self._metrics: list[CachedMetric] = []
+        self._encoded: dict[bool, tuple[int, bytes]] = {}
+
+    def metric(
+        self, name: str, documentation: str, labelnames: list[str], counter: bool
+    ) -> CachedMetric:
+        """Create a metric."""
+        metric = CachedMetric(self, name, documentation, labelnames, counter)
+        self._metrics.append(metric)
+        return metric
+
+    def remove_entity(self, entity_id: str, friendly_name: str | None) -> None:
+        """Remove the samples of an entity from all metrics."""
+        for metric in self._metrics:
+            metric.remove_entity(entity_id, friendly_name)
+
+    @callback
+    def async_snapshot(self, open_metrics: bool) -> Callable[[], bytes]:
+        """Render the changed entities and return a job encoding the exposition.
+
+        The job only uses the rendered lines, so it can run in the executor
+        while the metrics keep changing.
+        """
+        with self.lock:
+            generation = self.generation
+            if (encoded := self._encoded.get(open_metrics)) is not None and encoded[
+                0
+            ] == generation:
+                body = encoded[1]
+                return lambda: body
+            chunks = [
+                chunk
+                for metric in self._metrics
+                for chunk in metric.chunks(open_metrics)
+            ]
+
+        def encode() -> bytes:
+            body = "".join(chunks).encode("utf-8")
+            self._encoded[open_metrics] = (generation, body)
+            return body
+
+        return encode
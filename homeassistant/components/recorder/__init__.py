@@ -31,6 +31,7 @@ from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
     DATA_INSTANCE,
     DOMAIN,
+    INTEGRATION_PLATFORM_ASYNC_SETUP,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD,
     SQLITE_URL_PREFIX,
@@ -50,16 +51,23 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_BULK_WRITE = False
+DEFAULT_HISTORY_CACHE_MAX_MEMORY = 0
+DEFAULT_QUERY_WORKERS = 0
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
+CONF_DB_READ_URL = "db_read_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_WRITE = "bulk_write"
+CONF_HISTORY_CACHE_MAX_MEMORY = "history_cache_max_memory"
+CONF_QUERY_WORKERS = "query_workers"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -100,9 +108,20 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_BULK_WRITE, default=DEFAULT_BULK_WRITE
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_HISTORY_CACHE_MAX_MEMORY,
+                        default=DEFAULT_HISTORY_CACHE_MAX_MEMORY,
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_QUERY_WORKERS, default=DEFAULT_QUERY_WORKERS
+                    ): cv.positive_int,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -140,11 +159,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_write = conf[CONF_BULK_WRITE]
+    # Configured in MiB
+    history_cache_max_memory = conf[CONF_HISTORY_CACHE_MAX_MEMORY] * 1024 * 1024
+    query_workers = conf[CONF_QUERY_WORKERS]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
+    db_read_url = conf.get(CONF_DB_READ_URL)
     exclude = conf[CONF_EXCLUDE]
     exclude_event_types: set[str] = set(exclude.get(CONF_EVENT_TYPES, []))
     if EVENT_STATE_CHANGED in exclude_event_types:
@@ -161,6 +185,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_write=bulk_write,
+        history_cache_max_memory=history_cache_max_memory,
+        db_read_url=db_read_url,
+        query_workers=query_workers,
     )
     instance.async_initialize()
     instance.async_register()
@@ -184,6 +212,8 @@ async def _async_setup_integration_platform(
         hass: HomeAssistant, domain: str, platform: Any
     ) -> None:
         """Process a recorder platform."""
+        if async_setup := getattr(platform, INTEGRATION_PLATFORM_ASYNC_SETUP, None):
+            async_setup(hass)
         # If the platform has a compile_statistics method, we need to
         # add it to the recorder queue to be processed.
         if any(
@@ -0,0 +1,256 @@
+"""Write rows from the event session with multi-row INSERT statements."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+# Tables that are referenced by events and states, in the order
+# they need to be written so their ids can be resolved.
+_LOOKUP_TABLES: tuple[type[Base], ...] = (
+    StatesMeta,
+    EventTypes,
+    StateAttributes,
+    EventData,
+)
+
+# Columns that are unique for every row in a single INSERT so the
+# generated ids can be matched back to the objects. The table managers
+# never have two pending rows with the same shared data, events that need
+# their ids are written with at most one row per context, and states are
+# written in generations that contain at most one row per entity.
+_UNIQUE_KEYS: dict[type[Base], tuple[str, ...]] = {
+    StatesMeta: ("entity_id",),
+    EventTypes: ("event_type",),
+    StateAttributes: ("shared_attrs",),
+    EventData: ("shared_data",),
+    Events: ("context_id_bin",),
+    States: ("metadata_id", "entity_id"),
+}
+
+# Relationship attribute, foreign key column and primary
+# key of the related row for each table we bulk insert.
+_EVENTS_RELATIONSHIPS = (
+    ("event_type_rel", "event_type_id", "event_type_id"),
+    ("event_data_rel", "data_id", "data_id"),
+)
+_STATES_RELATIONSHIPS = (
+    ("states_meta_rel", "metadata_id", "metadata_id"),
+    ("state_attributes", "attributes_id", "attributes_id"),
+    ("old_state", "old_state_id", "state_id"),
+)
+_NO_RELATIONSHIPS: tuple[tuple[str, str, str], ...] = ()
+
+
+def _table(model: type[Base]) -> Table:
+    """Return the table for a model."""
+    table = model.__table__
+    assert isinstance(table, Table)
+    return table
+
+
+def _columns(model: type[Base]) -> tuple[tuple[str, ...], str]:
+    """Return the non primary key column names and the primary key name."""
+    table = _table(model)
+    (primary_key,) = table.primary_key.columns
+    return (
+        tuple(column.key for column in table.columns if not column.primary_key),
+        primary_key.key,
+    )
+
+
+_MODELS: tuple[type[Base], ...] = (*_LOOKUP_TABLES, Events, States)
+_COLUMNS = {model: _columns(model) for model in _MODELS}
+
+
+def _rows(
+    objs: list[Any],
+    keys: tuple[str, ...],
+    relationships: tuple[tuple[str, str, str], ...],
+) -> list[dict[str, Any]]:
+    """Convert pending objects to parameter sets for an executemany.
+
+    Every parameter set must contain the same keys so columns that
+    were never set on the object are passed as None.
+    """
+    rows: list[dict[str, Any]] = []
+    for obj in objs:
+        values = obj.__dict__
+        row = {key: values.get(key) for key in keys}
+        for relationship, foreign_key, primary_key in relationships:
+            if (related := values.get(relationship)) is not None:
+                row[foreign_key] = related.__dict__[primary_key]
+        rows.append(row)
+    return rows
+
+
+class BulkWriter:
+    """Buffer new rows for the event session and write them in bulk.
+
+    The objects are never added to the SQLAlchemy session, which avoids
+    the ORM unit of work. Instead, each table is written with a single
+    executemany at commit time and the generated primary keys are
+    assigned back to the objects so the table managers can move them
+    from pending to their id maps exactly as they do after an ORM flush.
+
+    The database engine must support RETURNING for executemany to
+    resolve the ids of new rows.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk writer."""
+        self._pending: dict[type[Base], list[Any]] = {model: [] for model in _MODELS}
+
+    def add(self, obj: Base) -> None:
+        """Add an object to be written at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending[type(obj)].append(obj)
+
+    def clear(self) -> None:
+        """Discard all pending objects once written or no longer needed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for objs in self._pending.values():
+            objs.clear()
+
+    def write(self, session: Session) -> int:
+        """Write all pending objects and return the number of rows inserted.
+
+        The caller is responsible for committing the session and calling
+        clear once it is committed. If the write or the commit fails, the
+        session must be rolled back and rollback called before the write
+        is retried.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        pending = self._pending
+        written = 0
+        for model in _LOOKUP_TABLES:
+            if objs := pending[model]:
+                self._insert_returning_ids(session, model, objs, _NO_RELATIONSHIPS)
+                written += len(objs)
+        if events := pending[Events]:
+            self._insert_events(session, events)
+            written += len(events)
+        if states := pending[States]:
+            self._insert_states(session, states)
+            written += len(states)
+        return written
+
+    def rollback(self) -> None:
+        """Forget the ids assigned by a write that was rolled back.
+
+        The rows referencing the pending objects resolve their ids again
+        from the related objects when the write is retried.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for model, objs in self._pending.items():
+            _, primary_key = _COLUMNS[model]
+            for obj in objs:
+                setattr(obj, primary_key, None)
+
+    def _insert_events(self, session: Session, events: list[Events]) -> None:
+        """Insert events, resolving the ids of the first event of each context.
+
+        The first event of a context may be the origin of the context, so
+        its id is needed for the context origins table. Other events are
+        written without RETURNING as nothing references them.
+        """
+        first_of_context: list[Events] = []
+        others: list[Events] = []
+        context_ids: set[bytes] = set()
+        for event in events:
+            context_id_bin = event.__dict__.get("context_id_bin")
+            if context_id_bin is None or context_id_bin in context_ids:
+                others.append(event)
+            else:
+                context_ids.add(context_id_bin)
+                first_of_context.append(event)
+        if first_of_context:
+            self._insert_returning_ids(
+                session, Events, first_of_context, _EVENTS_RELATIONSHIPS
+            )
+        if others:
+            keys, _ = _COLUMNS[Events]
+            session.execute(
+                insert(_table(Events)), _rows(others, keys, _EVENTS_RELATIONSHIPS)
+            )
+
+    def _insert_states(self, session: Session, states: list[States]) -> None:
+        """Insert states in generations so old_state_id can be resolved.
+
+        A state can only be inserted once the state it replaces has an id,
+        so any state for an entity that already has a row in the current
+        statement is deferred to the next one. The number of statements is
+        bounded by the most changes a single entity had in the commit
+        interval.
+        """
+        while states:
+            ready: list[States] = []
+            deferred: list[States] = []
+            entities: set[tuple[Any, ...]] = set()
+            for state in states:
+                values = state.__dict__
+                entity = (
+                    values.get("metadata_id"),
+                    values.get("states_meta_rel"),
+                    values.get("entity_id"),
+                )
+                if entity in entities:
+                    deferred.append(state)
+                else:
+                    entities.add(entity)
+                    ready.append(state)
+            self._insert_returning_ids(session, States, ready, _STATES_RELATIONSHIPS)
+            states = deferred
+
+    def _insert_returning_ids(
+        self,
+        session: Session,
+        model: type[Base],
+        objs: list[Any],
+        relationships: tuple[tuple[str, str, str], ...],
+    ) -> None:
+        """Insert objects and assign the generated primary keys to them.
+
+        The ids are matched back by unique key instead of relying on the
+        order of the RETURNING rows so the engine can batch the rows into
+        multi-row VALUES statements.
+        """
+        keys, primary_key = _COLUMNS[model]
+        unique_keys = _UNIQUE_KEYS[model]
+        table = _table(model)
+        rows = _rows(objs, keys, relationships)
+        ids_by_key = {
+            tuple(row[1:]): row[0]
+            for row in session.execute(
+                insert(table).returning(
+                    table.c[primary_key], *(table.c[key] for key in unique_keys)
+                ),
+                rows,
+            )
+        }
+        for obj, row in zip(objs, rows, strict=True):
+            setattr(
+                obj, primary_key, ids_by_key[tuple(row[key] for key in unique_keys)]
+            )
@@ -53,12 +53,15 @@ STATISTICS_ROWS_SCHEMA_VERSION = 23
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
+CONTEXT_ORIGINS_SCHEMA_VERSION = 43
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
 INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
+# Called from the event loop when the recorder platform is added
+INTEGRATION_PLATFORM_ASYNC_SETUP = "async_setup"
 
 INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD = {
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
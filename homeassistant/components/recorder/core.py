@@ -42,6 +42,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .bulk_writer import BulkWriter
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -74,8 +75,10 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBInterruptibleThreadPoolExecutor, ExecutorJobTimer
+from .history.cache import HistoryCache
 from .migration import (
+    ContextOriginsMigration,
     EntityIDMigration,
     EventsContextIDMigration,
     EventTypeIDMigration,
@@ -84,6 +87,9 @@ from .migration import (
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
+from .query_workers import QueryWorkers
+from .statistics_cache import StatisticsResultCache
+from .table_managers.context_origins import ContextOriginsManager
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -105,6 +111,7 @@ from .tasks import (
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
+    RebuildStatisticsRollupsTask,
     RecorderTask,
     StatisticsTask,
     StopTask,
@@ -156,6 +163,41 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
 
+def _engine_kwargs(db_url: str) -> dict[str, Any]:
+    """Return the arguments to create an engine for a database url."""
+    kwargs: dict[str, Any] = {}
+    if db_url == SQLITE_URL_PREFIX or ":memory:" in db_url:
+        kwargs["connect_args"] = {"check_same_thread": False}
+        kwargs["poolclass"] = MutexPool
+        MutexPool.pool_lock = threading.RLock()
+        kwargs["pool_reset_on_return"] = None
+    elif db_url.startswith(SQLITE_URL_PREFIX):
+        kwargs["poolclass"] = RecorderPool
+    elif db_url.startswith(
+        (
+            MARIADB_URL_PREFIX,
+            MARIADB_PYMYSQL_URL_PREFIX,
+            MYSQLDB_URL_PREFIX,
+            MYSQLDB_PYMYSQL_URL_PREFIX,
+        )
+    ):
+        kwargs["connect_args"] = {"charset": "utf8mb4"}
+        if db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+            # If they have configured MySQLDB but don't have
+            # the MySQLDB module installed this will throw
+            # an ImportError which we suppress here since
+            # sqlalchemy will give them a better error when
+            # it tried to import it below.
+            with contextlib.suppress(ImportError):
+                kwargs["connect_args"]["conv"] = build_mysqldb_conv()
+
+    # Disable extended logging for non SQLite databases
+    if not db_url.startswith(SQLITE_URL_PREFIX):
+        kwargs["echo"] = False
+
+    return kwargs
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -173,6 +215,10 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        bulk_write: bool = False,
+        history_cache_max_memory: int = 0,
+        db_read_url: str | None = None,
+        query_workers: int = 0,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -187,6 +233,13 @@ class Recorder(threading.Thread):
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
+        # Optional database, usually a replica, used for reads
+        # from the database executor
+        self.db_read_url = db_read_url
+        # Number of processes answering statistics queries,
+        # queries are answered in the executor when zero
+        self.query_worker_count = query_workers
+        self.query_workers: QueryWorkers | None = None
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.database_engine: DatabaseEngine | None = None
@@ -199,6 +252,7 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -211,6 +265,15 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Opt-in multi-row INSERT write path, only enabled once
+        # we know the database engine supports it
+        self.bulk_write = bulk_write
+        self._bulk_writer: BulkWriter | None = None
+        # Recent states kept in memory to answer history queries
+        # without the database, disabled when the size is zero
+        self.history_cache: HistoryCache | None = (
+            HistoryCache(history_cache_max_memory) if history_cache_max_memory else None
+        )
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -219,16 +282,21 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.context_origins_manager = ContextOriginsManager(self)
+        self.statistics_result_cache = StatisticsResultCache(self)
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self.migration_is_live = False
+        self.statistics_rollups_valid = True
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self.executor_job_timer = ExecutorJobTimer()
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -274,10 +342,28 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for reading.
+
+        The session is bound to the read database when one is configured,
+        except in the recorder thread which always needs to see its own
+        writes.
+        """
+        if self._get_read_session is None or threading.get_ident() == self.thread_id:
+            return self.get_session()
+        return self._get_read_session()
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
 
+    def queue_statistics_rollups_rebuild(self) -> None:
+        """Stop using the statistics rollups until they have been rebuilt."""
+        if not self.statistics_rollups_valid:
+            return
+        self.statistics_rollups_valid = False
+        self.queue_task(RebuildStatisticsRollupsTask())
+
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
@@ -293,8 +379,9 @@ class Recorder(threading.Thread):
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
-        if self.engine and hasattr(self.engine.pool, "shutdown"):
-            self.engine.pool.shutdown()
+        for engine in (self.engine, self.read_engine):
+            if engine and hasattr(engine.pool, "shutdown"):
+                engine.pool.shutdown()
 
     @callback
     def async_initialize(self) -> None:
@@ -361,7 +448,13 @@ class Recorder(threading.Thread):
         self, target: Callable[..., T], *args: Any
     ) -> asyncio.Future[T]:
         """Add an executor job from within the event loop."""
-        return self.hass.loop.run_in_executor(self._db_executor, target, *args)
+        return self.hass.loop.run_in_executor(
+            self._db_executor,
+            self.executor_job_timer.run,
+            time.monotonic(),
+            target,
+            *args,
+        )
 
     def _stop_executor(self) -> None:
         """Stop the executor."""
@@ -703,10 +796,13 @@ class Recorder(threading.Thread):
             self.is_running = False
             self._shutdown()
 
-    def _add_to_session(self, session: Session, obj: object) -> None:
+    def _add_to_session(self, session: Session, obj: Base) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if self._bulk_writer:
+            self._bulk_writer.add(obj)
+        else:
+            session.add(obj)
 
     def _run(self) -> None:
         """Start processing events to save."""
@@ -822,6 +918,17 @@ class Recorder(threading.Thread):
                     ):
                         self.queue_task(EntityIDPostMigrationTask())
 
+            migrator = ContextOriginsMigration(
+                session, schema_version, migration_changes
+            )
+            if migrator.needs_migrate():
+                self.queue_task(migrator.task())
+            else:
+                _LOGGER.debug(
+                    "Activating context_origins manager as all contexts are indexed"
+                )
+                self.context_origins_manager.active = True
+
             if self.schema_version > LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION:
                 with contextlib.suppress(SQLAlchemyError):
                     # If the index of event_ids on the states table is still present
@@ -1052,6 +1159,7 @@ class Recorder(threading.Thread):
 
         if not event.data:
             self._add_to_session(session, dbevent)
+            self.context_origins_manager.add_pending(dbevent.context_id_bin, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1077,6 +1185,7 @@ class Recorder(threading.Thread):
             dbevent.event_data_rel = dbevent_data
 
         self._add_to_session(session, dbevent)
+        self.context_origins_manager.add_pending(dbevent.context_id_bin, dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
@@ -1150,6 +1259,14 @@ class Recorder(threading.Thread):
             dbstate.state_attributes = dbstate_attributes
 
         self._add_to_session(session, dbstate)
+        self.context_origins_manager.add_pending(dbstate.context_id_bin, dbstate)
+        if self.history_cache:
+            self.history_cache.add(
+                entity_id,
+                dbstate.state,
+                cast(float, dbstate.last_updated_ts),
+                dbstate.last_changed_ts,
+            )
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1177,6 +1294,12 @@ class Recorder(threading.Thread):
                     err,
                     self.db_retry_wait,
                 )
+                if self._bulk_writer:
+                    assert self.event_session is not None
+                    # The rows written before the error must not be written
+                    # again by the retry, and their ids are no longer valid
+                    self.event_session.rollback()
+                    self._bulk_writer.rollback()
                 if tries == self.db_max_retries:
                     raise
 
@@ -1188,7 +1311,16 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        context_origins_manager = self.context_origins_manager
+        if self._bulk_writer:
+            self._bulk_writer.write(session)
+        elif context_origins_manager.has_pending:
+            # The ids of the new rows are needed for the context origins
+            session.flush()
+        context_origins_manager.write_pending(session)
         session.commit()
+        if self._bulk_writer:
+            self._bulk_writer.clear()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -1199,6 +1331,7 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        self.context_origins_manager.post_commit_pending()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1226,6 +1359,12 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.context_origins_manager.reset()
+        if self._bulk_writer:
+            self._bulk_writer.clear()
+        # Uncommitted states may have been added to the history cache
+        if self.history_cache:
+            self.history_cache.clear()
 
         if not self.event_session:
             return
@@ -1268,6 +1407,10 @@ class Recorder(threading.Thread):
         """Migrate entity_ids if needed."""
         return migration.migrate_entity_ids(self)
 
+    def _migrate_context_origins(self) -> bool:
+        """Index the origins of recorded contexts if needed."""
+        return migration.migrate_context_origins(self)
+
     def _post_migrate_entity_ids(self) -> bool:
         """Post migrate entity_ids if needed."""
         return migration.post_migrate_entity_ids(self)
@@ -1372,37 +1515,8 @@ class Recorder(threading.Thread):
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
-        kwargs: dict[str, Any] = {}
         self._completed_first_database_setup = False
-
-        if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
-            kwargs["connect_args"] = {"check_same_thread": False}
-            kwargs["poolclass"] = MutexPool
-            MutexPool.pool_lock = threading.RLock()
-            kwargs["pool_reset_on_return"] = None
-        elif self.db_url.startswith(SQLITE_URL_PREFIX):
-            kwargs["poolclass"] = RecorderPool
-        elif self.db_url.startswith(
-            (
-                MARIADB_URL_PREFIX,
-                MARIADB_PYMYSQL_URL_PREFIX,
-                MYSQLDB_URL_PREFIX,
-                MYSQLDB_PYMYSQL_URL_PREFIX,
-            )
-        ):
-            kwargs["connect_args"] = {"charset": "utf8mb4"}
-            if self.db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
-                # If they have configured MySQLDB but don't have
-                # the MySQLDB module installed this will throw
-                # an ImportError which we suppress here since
-                # sqlalchemy will give them a better error when
-                # it tried to import it below.
-                with contextlib.suppress(ImportError):
-                    kwargs["connect_args"]["conv"] = build_mysqldb_conv()
-
-        # Disable extended logging for non SQLite databases
-        if not self.db_url.startswith(SQLITE_URL_PREFIX):
-            kwargs["echo"] = False
+        kwargs = _engine_kwargs(self.db_url)
 
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
@@ -1413,13 +1527,88 @@ class Recorder(threading.Thread):
 
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        self._setup_read_connection()
+        self._setup_query_workers()
+        self._setup_bulk_writer()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_connection(self) -> None:
+        """Connect to the read database if one is configured."""
+        assert self.engine is not None
+        self.read_engine = None
+        self._get_read_session = None
+        if not (db_read_url := self.db_read_url):
+            return
+        read_engine = create_engine(
+            db_read_url, **_engine_kwargs(db_read_url), future=True
+        )
+        if read_engine.dialect.name != self.engine.dialect.name:
+            _LOGGER.error(
+                "The read database uses %s while the recorder database uses %s, "
+                "reading from the recorder database instead",
+                read_engine.dialect.name,
+                self.engine.dialect.name,
+            )
+            read_engine.dispose()
+            return
+        sqlalchemy_event.listen(read_engine, "connect", self._setup_read_db_connection)
+        self.read_engine = read_engine
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=read_engine, future=True)
+        )
+        _LOGGER.debug("Connected to recorder read database")
+
+    def _setup_read_db_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read database."""
+        assert self.read_engine is not None
+        setup_connection_for_dialect(
+            self, self.read_engine.dialect.name, dbapi_connection, False
+        )
+
+    def _setup_query_workers(self) -> None:
+        """Start the query worker pool if requested."""
+        if not self.query_worker_count:
+            return
+        db_url = self.db_read_url or self.db_url
+        if db_url == SQLITE_URL_PREFIX or ":memory:" in db_url:
+            _LOGGER.warning(
+                "Query workers cannot open an in-memory SQLite database, "
+                "answering queries in the executor instead"
+            )
+            return
+        self.query_workers = QueryWorkers(db_url, self.query_worker_count)
+
+    def _setup_bulk_writer(self) -> None:
+        """Enable the bulk write path if requested and supported by the engine."""
+        assert self.engine is not None
+        self._bulk_writer = None
+        if not self.bulk_write:
+            return
+        # New rows need their ids to link old states and to populate
+        # the table manager caches, which requires RETURNING for executemany
+        if not self.engine.dialect.insert_executemany_returning:
+            _LOGGER.warning(
+                "Bulk write is not supported by the %s database engine, "
+                "falling back to writing rows individually",
+                self.engine.dialect.name,
+            )
+            return
+        self._bulk_writer = BulkWriter()
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
             self.engine.dispose()
             self.engine = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
+        if self.query_workers:
+            self.query_workers.shutdown()
+            self.query_workers = None
+        self._get_read_session = None
         self._get_session = None
 
     def _setup_run(self) -> None:
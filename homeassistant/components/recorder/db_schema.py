@@ -68,7 +68,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 42
+SCHEMA_VERSION = 44
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,7 +84,11 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_WEEKLY = "statistics_weekly"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 TABLE_MIGRATION_CHANGES = "migration_changes"
+TABLE_CONTEXT_ORIGINS = "context_origins"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -107,6 +111,10 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_CONTEXT_ORIGINS,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_WEEKLY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -120,6 +128,7 @@ LAST_UPDATED_INDEX_TS = "ix_states_last_updated_ts"
 METADATA_ID_LAST_UPDATED_INDEX_TS = "ix_states_metadata_id_last_updated_ts"
 EVENTS_CONTEXT_ID_BIN_INDEX = "ix_events_context_id_bin"
 STATES_CONTEXT_ID_BIN_INDEX = "ix_states_context_id_bin"
+CONTEXT_ORIGINS_CONTEXT_ID_BIN_INDEX = "ix_context_origins_context_id_bin"
 LEGACY_STATES_EVENT_ID_INDEX = "ix_states_event_id"
 LEGACY_STATES_ENTITY_ID_LAST_UPDATED_INDEX = "ix_states_entity_id_last_updated_ts"
 CONTEXT_ID_BIN_MAX_LENGTH = 16
@@ -632,6 +641,42 @@ class StatesMeta(Base):
         )
 
 
+class ContextOrigins(Base):
+    """The first event or state recorded for each context.
+
+    The logbook resolves the origin of a context from this table instead
+    of joining every event and state that share the context.
+    """
+
+    __table_args__ = (
+        Index(
+            CONTEXT_ORIGINS_CONTEXT_ID_BIN_INDEX,
+            "context_id_bin",
+            unique=True,
+            mysql_length=CONTEXT_ID_BIN_MAX_LENGTH,
+            mariadb_length=CONTEXT_ID_BIN_MAX_LENGTH,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_CONTEXT_ORIGINS
+    context_origin_id: Mapped[int] = mapped_column(
+        Integer, Identity(), primary_key=True
+    )
+    context_id_bin: Mapped[bytes | None] = mapped_column(CONTEXT_BINARY_TYPE)
+    time_fired_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    event_id: Mapped[int | None] = mapped_column(Integer)
+    state_id: Mapped[int | None] = mapped_column(Integer)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.ContextOrigins("
+            f"id={self.context_origin_id}, event_id={self.event_id}, "
+            f"state_id={self.state_id}, time_fired_ts={self.time_fired_ts}"
+            ")>"
+        )
+
+
 class StatisticsBase:
     """Statistics base class."""
 
@@ -725,6 +770,64 @@ class StatisticsShortTerm(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsRollupBase(StatisticsBase):
+    """Long term statistics reduced to a local calendar period.
+
+    The rows are maintained from the hourly statistics, mean_weight is the
+    number of hourly means the mean of the period was computed from.
+    """
+
+    mean_weight: Mapped[int | None] = mapped_column(Integer)
+
+
+class StatisticsDaily(Base, StatisticsRollupBase):
+    """Long term statistics per local day."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsWeekly(Base, StatisticsRollupBase):
+    """Long term statistics per local week."""
+
+    duration = timedelta(days=7)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_weekly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_WEEKLY
+
+
+class StatisticsMonthly(Base, StatisticsRollupBase):
+    """Long term statistics per local month."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class StatisticsMeta(Base):
     """Statistics meta data."""
 
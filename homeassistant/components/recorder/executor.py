@@ -4,12 +4,17 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from concurrent.futures.thread import _threads_queues, _worker
+from dataclasses import asdict, dataclass
+from functools import partial
 import threading
-from typing import Any
+import time
+from typing import Any, TypeVar
 import weakref
 
 from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
+_T = TypeVar("_T")
+
 
 def _worker_with_shutdown_hook(
     shutdown_hook: Callable[[], None], *args: Any, **kwargs: Any
@@ -63,3 +68,52 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+@dataclass(slots=True)
+class ExecutorJobStats:
+    """Queue wait and run times of a type of database executor job."""
+
+    count: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    run_time: float = 0.0
+
+
+class ExecutorJobTimer:
+    """Time database executor jobs by the function they run.
+
+    Jobs are timed from when they are queued until a worker starts them,
+    which shows how long queries wait for a free database connection, and
+    while they run.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self._lock = threading.Lock()
+        self._stats: dict[str, ExecutorJobStats] = {}
+
+    def run(self, queued: float, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a job that was queued at the queued monotonic time."""
+        started = time.monotonic()
+        try:
+            return target(*args)
+        finally:
+            run_time = time.monotonic() - started
+            wait_time = started - queued
+            func: Any = target
+            while isinstance(func, partial):
+                func = func.func
+            name = getattr(func, "__name__", None) or type(func).__name__
+            with self._lock:
+                if (stats := self._stats.get(name)) is None:
+                    stats = self._stats[name] = ExecutorJobStats()
+                stats.count += 1
+                stats.wait_time += wait_time
+                stats.max_wait_time = max(stats.max_wait_time, wait_time)
+                stats.run_time += run_time
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """Return the stats of every type of job."""
+        with self._lock:
+            return {name: asdict(stats) for name, stats in self._stats.items()}
@@ -0,0 +1,334 @@
+"""In-memory cache of recently recorded states for history queries."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+import logging
+import sys
+import threading
+import time
+from typing import NamedTuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Two timestamps stored as doubles and the index of the interned state
+ROW_SIZE = 2 * 8 + 4
+
+# When the cache is full, evict the oldest part of the covered period
+# until the cache is below this fraction of its maximum size
+EVICT_TO_FRACTION = 0.75
+EVICT_PERIOD_FRACTION = 0.25
+
+
+class CachedStateRow(NamedTuple):
+    """A state row served from the cache.
+
+    The fields mirror the columns selected by the history queries
+    when attributes are not requested.
+    """
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+
+
+class _EntityHistory:
+    """Columnar history of a single entity ordered by last_updated."""
+
+    __slots__ = ("last_updated", "last_changed", "state_ids")
+
+    def __init__(self) -> None:
+        """Initialize the entity history."""
+        self.last_updated = array("d")
+        self.last_changed = array("d")
+        self.state_ids = array("I")
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.last_updated)
+
+    def append(
+        self, last_updated_ts: float, last_changed_ts: float, state_id: int
+    ) -> None:
+        """Add a row, keeping the rows ordered by last_updated."""
+        last_updated = self.last_updated
+        if not last_updated or last_updated[-1] <= last_updated_ts:
+            last_updated.append(last_updated_ts)
+            self.last_changed.append(last_changed_ts)
+            self.state_ids.append(state_id)
+            return
+        idx = bisect_right(last_updated, last_updated_ts)
+        last_updated.insert(idx, last_updated_ts)
+        self.last_changed.insert(idx, last_changed_ts)
+        self.state_ids.insert(idx, state_id)
+
+    def trim_before(self, cutoff_ts: float, keep_start_state: bool = True) -> int:
+        """Remove rows before the cutoff.
+
+        The state in effect at the cutoff is kept unless keep_start_state
+        is False. Returns the number of removed rows.
+        """
+        idx = bisect_left(self.last_updated, cutoff_ts)
+        if keep_start_state:
+            idx -= 1
+        if idx <= 0:
+            return 0
+        del self.last_updated[:idx]
+        del self.last_changed[:idx]
+        del self.state_ids[:idx]
+        return idx
+
+
+class HistoryCache:
+    """Cache recently recorded states in a per-entity columnar ring.
+
+    Rows are added by the recorder thread as states are recorded and read
+    by the database executor threads that run history queries. The cache
+    holds every state recorded since complete_since, so any query window
+    starting after that point can be answered without the database.
+
+    When the estimated memory exceeds max_memory, the oldest part of the
+    covered period is evicted and complete_since moves forward. The last
+    state before complete_since is kept for each entity so the state at the
+    start of a window can still be resolved.
+    """
+
+    def __init__(self, max_memory: int) -> None:
+        """Initialize the cache with a maximum memory size in bytes."""
+        self.max_memory = max_memory
+        self._lock = threading.Lock()
+        self._entities: dict[str, _EntityHistory] = {}
+        self._state_ids: dict[str | None, int] = {}
+        self._states: list[str | None] = []
+        self._memory = 0
+        self._newest_ts = self.complete_since = time.time()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def memory(self) -> int:
+        """Return the estimated memory used by the cached rows."""
+        return self._memory
+
+    def add(
+        self,
+        entity_id: str,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+    ) -> None:
+        """Add a recorded state.
+
+        This call must be made from the recorder thread.
+        """
+        with self._lock:
+            if (state_id := self._state_ids.get(state)) is None:
+                state_id = self._intern(state)
+            if (history := self._entities.get(entity_id)) is None:
+                history = self._entities[entity_id] = _EntityHistory()
+            history.append(
+                last_updated_ts,
+                last_updated_ts if last_changed_ts is None else last_changed_ts,
+                state_id,
+            )
+            self._memory += ROW_SIZE
+            if last_updated_ts > self._newest_ts:
+                self._newest_ts = last_updated_ts
+            if self._memory > self.max_memory:
+                self._evict()
+
+    def _intern(self, state: str | None) -> int:
+        """Intern a state string and return its id."""
+        state_id = self._state_ids[state] = len(self._states)
+        self._states.append(None if state is None else sys.intern(state))
+        self._memory += sys.getsizeof(state)
+        return state_id
+
+    def _evict(self) -> None:
+        """Evict the oldest rows until the cache is below its target size."""
+        target = self.max_memory * EVICT_TO_FRACTION
+        while self._memory > target:
+            if (newest_ts := self._newest_ts) <= self.complete_since:
+                _LOGGER.debug("History cache cannot fit the latest states, clearing")
+                self._clear(newest_ts)
+                return
+            cutoff_ts = min(
+                newest_ts,
+                self.complete_since
+                + (newest_ts - self.complete_since) * EVICT_PERIOD_FRACTION,
+            )
+            for history in self._entities.values():
+                self._memory -= history.trim_before(cutoff_ts) * ROW_SIZE
+            self.complete_since = cutoff_ts
+            # The states only used by the evicted rows count towards
+            # the memory until they are dropped
+            self._compact_states()
+
+    def _compact_states(self) -> None:
+        """Drop interned states that are no longer referenced by any row."""
+        states = self._states
+        used = sorted(
+            {idx for history in self._entities.values() for idx in history.state_ids}
+        )
+        if len(used) == len(states):
+            return
+        remap = {old_id: new_id for new_id, old_id in enumerate(used)}
+        for history in self._entities.values():
+            history.state_ids = array("I", [remap[idx] for idx in history.state_ids])
+        self._states = [states[idx] for idx in used]
+        self._state_ids = {state: new_id for new_id, state in enumerate(self._states)}
+        self._memory = sum(
+            len(history) for history in self._entities.values()
+        ) * ROW_SIZE + sum(sys.getsizeof(state) for state in self._states)
+
+    def clear(self) -> None:
+        """Remove all rows and start covering from now."""
+        with self._lock:
+            self._clear(time.time())
+
+    def _clear(self, complete_since: float) -> None:
+        """Remove all rows and start covering from complete_since."""
+        self._entities.clear()
+        self._state_ids.clear()
+        self._states.clear()
+        self._memory = 0
+        self._newest_ts = self.complete_since = complete_since
+
+    def evict_before(self, purge_before_ts: float) -> None:
+        """Evict rows that were purged from the database."""
+        with self._lock:
+            for history in self._entities.values():
+                self._memory -= (
+                    history.trim_before(purge_before_ts, keep_start_state=False)
+                    * ROW_SIZE
+                )
+            if purge_before_ts > self.complete_since:
+                self.complete_since = purge_before_ts
+            self._compact_states()
+
+    def get_rows(
+        self,
+        entity_id_to_metadata_id: dict[str, int | None],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        include_start_time_state: bool,
+        run_start_ts: float | None,
+        significant_changes_only: bool,
+        significant_metadata_ids: Iterable[int],
+        include_last_changed: bool,
+        limit: int | None = None,
+    ) -> list[CachedStateRow] | None:
+        """Return the rows the history queries would select, or None on a miss.
+
+        The rows are grouped by metadata_id and ordered by last_updated. A
+        window can only be answered when it starts after complete_since and,
+        if the state at the start time is requested, every entity has a
+        cached state before the start time.
+        """
+        with self._lock:
+            rows = self._get_rows(
+                entity_id_to_metadata_id,
+                start_time_ts,
+                end_time_ts,
+                include_start_time_state,
+                run_start_ts,
+                significant_changes_only,
+                set(significant_metadata_ids),
+                include_last_changed,
+                limit,
+            )
+            if rows is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return rows
+
+    def _get_rows(
+        self,
+        entity_id_to_metadata_id: dict[str, int | None],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        include_start_time_state: bool,
+        run_start_ts: float | None,
+        significant_changes_only: bool,
+        significant_metadata_ids: set[int],
+        include_last_changed: bool,
+        limit: int | None,
+    ) -> list[CachedStateRow] | None:
+        """Return the rows for get_rows with the lock held."""
+        if start_time_ts < self.complete_since:
+            return None
+        states = self._states
+        # The start time state is only bounded by the run start
+        # when more than one entity is requested
+        start_state_min_ts = (
+            run_start_ts
+            if run_start_ts is not None
+            and sum(
+                metadata_id is not None
+                for metadata_id in entity_id_to_metadata_id.values()
+            )
+            > 1
+            else None
+        )
+        start_time_last_changed = 0 if include_last_changed else None
+        rows: list[CachedStateRow] = []
+        for entity_id, metadata_id in entity_id_to_metadata_id.items():
+            if metadata_id is None:
+                continue
+            if (history := self._entities.get(entity_id)) is None:
+                if include_start_time_state:
+                    return None
+                continue
+            last_updated = history.last_updated
+            last_changed = history.last_changed
+            state_ids = history.state_ids
+            if include_start_time_state:
+                if (start_idx := bisect_left(last_updated, start_time_ts) - 1) < 0:
+                    return None
+                if (
+                    start_state_min_ts is None
+                    or last_updated[start_idx] >= start_state_min_ts
+                ):
+                    rows.append(
+                        CachedStateRow(
+                            metadata_id,
+                            states[state_ids[start_idx]],
+                            0,
+                            start_time_last_changed,
+                        )
+                    )
+            end_idx = (
+                bisect_left(last_updated, end_time_ts)
+                if end_time_ts
+                else len(last_updated)
+            )
+            only_changes = (
+                significant_changes_only and metadata_id not in significant_metadata_ids
+            )
+            added = 0
+            for idx in range(bisect_right(last_updated, start_time_ts), end_idx):
+                last_updated_ts = last_updated[idx]
+                last_changed_ts = last_changed[idx]
+                if only_changes and last_changed_ts != last_updated_ts:
+                    continue
+                rows.append(
+                    CachedStateRow(
+                        metadata_id,
+                        states[state_ids[idx]],
+                        last_updated_ts,
+                        (
+                            last_changed_ts
+                            if include_last_changed
+                            and last_changed_ts != last_updated_ts
+                            else None
+                        ),
+                    )
+                )
+                added += 1
+                if limit and added == limit:
+                    break
+        return rows
@@ -236,6 +236,27 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    if no_attributes and instance.history_cache:
+        cached_rows = instance.history_cache.get_rows(
+            entity_id_to_metadata_id,
+            start_time_ts,
+            end_time_ts,
+            include_start_time_state,
+            run_start_ts,
+            significant_changes_only,
+            metadata_ids_in_significant_domains,
+            not significant_changes_only,
+        )
+        if cached_rows is not None:
+            return _sorted_states_to_dict(
+                cast(list[Row], cached_rows),
+                start_time_ts if include_start_time_state else None,
+                entity_ids,
+                entity_id_to_metadata_id,
+                minimal_response,
+                compressed_state_format,
+                no_attributes=no_attributes,
+            )
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
@@ -393,6 +414,30 @@ def state_changes_during_period(
             include_start_time_state = False
         start_time_ts = dt_util.utc_to_timestamp(start_time)
         end_time_ts = datetime_to_timestamp_or_none(end_time)
+        if no_attributes and instance.history_cache:
+            cached_rows = instance.history_cache.get_rows(
+                entity_id_to_metadata_id,
+                start_time_ts,
+                end_time_ts,
+                include_start_time_state,
+                run_start_ts,
+                True,
+                (),
+                False,
+                limit,
+            )
+            if cached_rows is not None:
+                return cast(
+                    MutableMapping[str, list[State]],
+                    _sorted_states_to_dict(
+                        cast(list[Row], cached_rows),
+                        start_time_ts if include_start_time_state else None,
+                        entity_ids,
+                        entity_id_to_metadata_id,
+                        descending=descending,
+                        no_attributes=no_attributes,
+                    ),
+                )
         stmt = lambda_stmt(
             lambda: _state_changed_during_period_stmt(
                 start_time_ts,
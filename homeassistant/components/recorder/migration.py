@@ -13,8 +13,9 @@ from typing import TYPE_CHECKING, cast
 from uuid import UUID
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text, update
+from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, insert, text, update
 from sqlalchemy.engine import CursorResult, Engine
+from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import (
     DatabaseError,
     IntegrityError,
@@ -50,6 +51,7 @@ from .auto_repairs.statistics.schema import (
 )
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
+    CONTEXT_ORIGINS_SCHEMA_VERSION,
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
     SupportedDialect,
@@ -65,6 +67,7 @@ from .db_schema import (
     STATISTICS_TABLES,
     TABLE_STATES,
     Base,
+    ContextOrigins,
     Events,
     EventTypes,
     MigrationChanges,
@@ -72,22 +75,32 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
+    StatisticsWeekly,
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
 from .queries import (
     batch_cleanup_entity_ids,
+    delete_context_origins_by_context_ids,
     delete_duplicate_short_term_statistics_row,
     delete_duplicate_statistics_row,
+    find_context_origins,
     find_entity_ids_to_migrate,
     find_event_type_to_migrate,
+    find_events_by_context_ids,
     find_events_context_ids_to_migrate,
+    find_events_context_origins_to_migrate,
+    find_states_by_context_ids,
     find_states_context_ids_to_migrate,
+    find_states_context_origins_to_migrate,
     find_unmigrated_short_term_statistics_rows,
     find_unmigrated_statistics_rows,
+    has_context_origins_to_migrate,
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
@@ -96,9 +109,10 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import get_start_time, rebuild_statistics_rollups_with_session
 from .tasks import (
     CommitTask,
+    ContextOriginsMigrationTask,
     EntityIDMigrationTask,
     EventsContextIDMigrationTask,
     EventTypeIDMigrationTask,
@@ -1080,6 +1094,22 @@ def _apply_update(  # noqa: C901
         _migrate_statistics_columns_to_timestamp_removing_duplicates(
             hass, instance, session_maker, engine
         )
+    elif new_version == 43:
+        # The table may already have been created by create_all when connecting.
+        # The origins of the recorded contexts are indexed by the
+        # ContextOriginsMigration after the schema migration.
+        cast(Table, ContextOrigins.__table__).create(engine, checkfirst=True)
+    elif new_version == 44:
+        for rollup_table in (StatisticsDaily, StatisticsWeekly, StatisticsMonthly):
+            # The tables may already have been created by create_all when connecting
+            cast(Table, rollup_table.__table__).create(engine, checkfirst=True)
+        _LOGGER.warning(
+            "Rolling up statistics into days, weeks and months. Note: this can "
+            "take several minutes on large databases and slow computers. Please "
+            "be patient!"
+        )
+        with session_scope(session=session_maker()) as session:
+            rebuild_statistics_rollups_with_session(session)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -1682,6 +1712,103 @@ def migrate_entity_ids(instance: Recorder) -> bool:
     return is_done
 
 
+@retryable_database_job("index the origins of recorded contexts")
+def migrate_context_origins(instance: Recorder) -> bool:
+    """Index the first event or state of the recorded contexts.
+
+    The events and then the states are walked in the order they were
+    recorded. Contexts that were already indexed by the recorder while
+    the migration was running are indexed again if an older row is
+    found.
+    """
+    session_maker = instance.get_session
+    manager = instance.context_origins_manager
+    _LOGGER.debug("Migrating context origins")
+    with session_scope(session=session_maker()) as session:
+        if (event_id := manager.migrated_event_id) is not None:
+            if rows := session.execute(
+                find_events_context_origins_to_migrate(event_id, instance.max_bind_vars)
+            ).all():
+                _index_context_origins(session, rows)
+                manager.migrated_event_id = rows[-1][0]
+            else:
+                manager.migrated_event_id = None
+        elif (state_id := manager.migrated_state_id) is not None:
+            if rows := session.execute(
+                find_states_context_origins_to_migrate(state_id, instance.max_bind_vars)
+            ).all():
+                _index_context_origins(session, rows)
+                manager.migrated_state_id = rows[-1][0]
+            else:
+                manager.migrated_state_id = None
+
+        # If there is more work to do return False
+        # so that we can be called again
+        if is_done := manager.migrated_state_id is None:
+            _mark_migration_done(session, ContextOriginsMigration)
+
+    if is_done:
+        manager.active = True
+
+    _LOGGER.debug("Migrating context origins done=%s", is_done)
+    return is_done
+
+
+def _index_context_origins(session: Session, rows: Iterable[Row]) -> None:
+    """Index the origins of the contexts of a batch of rows.
+
+    Contexts are only indexed again if a row of the batch is older than
+    the indexed origin.
+    """
+    firsts: dict[bytes, float] = {}
+    for _, context_id_bin, time_fired_ts in rows:
+        if time_fired_ts is not None and (
+            context_id_bin not in firsts or time_fired_ts < firsts[context_id_bin]
+        ):
+            firsts[context_id_bin] = time_fired_ts
+    indexed: dict[bytes, float | None] = dict(
+        session.execute(find_context_origins(list(firsts))).tuples().all()
+    )
+    if not (
+        context_id_bins := [
+            context_id_bin
+            for context_id_bin, time_fired_ts in firsts.items()
+            if context_id_bin not in indexed
+            or (origin_ts := indexed[context_id_bin]) is None
+            or time_fired_ts < origin_ts
+        ]
+    ):
+        return
+    # The origin is the oldest row of the context in either table.
+    # Events win ties since they are recorded before the states they
+    # change.
+    origins: dict[bytes, tuple[float, bool, int]] = {}
+    for is_state, stmt in (
+        (False, find_events_by_context_ids(context_id_bins)),
+        (True, find_states_by_context_ids(context_id_bins)),
+    ):
+        for row_id, context_id_bin, time_fired_ts in session.execute(stmt):
+            if time_fired_ts is None:
+                continue
+            origin = (time_fired_ts, is_state, row_id)
+            if context_id_bin not in origins or origin < origins[context_id_bin]:
+                origins[context_id_bin] = origin
+    session.execute(delete_context_origins_by_context_ids(context_id_bins))
+    if origins:
+        session.execute(
+            insert(ContextOrigins),
+            [
+                {
+                    "context_id_bin": context_id_bin,
+                    "time_fired_ts": time_fired_ts,
+                    "event_id": None if is_state else row_id,
+                    "state_id": row_id if is_state else None,
+                }
+                for context_id_bin, (time_fired_ts, is_state, row_id) in origins.items()
+            ],
+        )
+
+
 @retryable_database_job("post migrate states entity_ids to states_meta")
 def post_migrate_entity_ids(instance: Recorder) -> bool:
     """Remove old entity_id strings from states.
@@ -1875,6 +2002,18 @@ class EntityIDMigration(BaseRunTimeMigration):
         return has_entity_ids_to_migrate()
 
 
+class ContextOriginsMigration(BaseRunTimeMigration):
+    """Migration to index the origins of the recorded contexts."""
+
+    required_schema_version = CONTEXT_ORIGINS_SCHEMA_VERSION
+    migration_id = "context_origins_migration"
+    task = ContextOriginsMigrationTask
+
+    def needs_migrate_query(self) -> StatementLambdaElement:
+        """Check if there are contexts to index."""
+        return has_context_origins_to_migrate()
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
@@ -7,8 +7,9 @@ from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.orm.session import Session
 
 from .db_schema import Events, States, StatesMeta
@@ -18,6 +19,7 @@ from .queries import (
     attributes_ids_exist_in_states_with_fast_in_distinct,
     data_ids_exist_in_events,
     data_ids_exist_in_events_with_fast_in_distinct,
+    delete_context_origins_rows,
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
@@ -103,6 +105,10 @@ def purge_old_data(
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
+        # Context origins are deleted with a single range delete on the
+        # time_fired_ts index since nothing references them
+        _purge_context_origins(session, purge_before)
+
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
@@ -568,6 +574,15 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
+def _purge_context_origins(session: Session, purge_before: datetime) -> None:
+    """Delete context origins older than purge_before."""
+    deleted_rows = cast(
+        CursorResult,
+        session.execute(delete_context_origins_rows(purge_before.timestamp())),
+    )
+    _LOGGER.debug("Deleted %s context origins", deleted_rows.rowcount)
+
+
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
@@ -10,6 +10,7 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
 from .db_schema import (
+    ContextOrigins,
     EventData,
     Events,
     EventTypes,
@@ -580,6 +581,15 @@ def delete_statistics_runs_rows(
     )
 
 
+def delete_context_origins_rows(purge_before: float) -> StatementLambdaElement:
+    """Delete context_origins rows older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(ContextOrigins)
+        .where(ContextOrigins.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_statistics_short_term_rows(
     short_term_statistics: Iterable[int],
 ) -> StatementLambdaElement:
@@ -813,6 +823,92 @@ def find_states_context_ids_to_migrate(max_bind_vars: int) -> StatementLambdaEle
     )
 
 
+def has_context_origins_to_migrate() -> StatementLambdaElement:
+    """Check if there are recorded contexts to index."""
+    return lambda_stmt(
+        lambda: union_all(
+            select(Events.event_id)
+            .filter(Events.context_id_bin.is_not(None))
+            .limit(1)
+            .subquery()
+            .select(),
+            select(States.state_id)
+            .filter(States.context_id_bin.is_not(None))
+            .limit(1)
+            .subquery()
+            .select(),
+        )
+    )
+
+
+def find_events_context_origins_to_migrate(
+    event_id: int, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find the contexts of the events recorded after event_id."""
+    return lambda_stmt(
+        lambda: select(Events.event_id, Events.context_id_bin, Events.time_fired_ts)
+        .filter(Events.event_id > event_id)
+        .filter(Events.context_id_bin.is_not(None))
+        .order_by(Events.event_id)
+        .limit(max_bind_vars)
+    )
+
+
+def find_states_context_origins_to_migrate(
+    state_id: int, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find the contexts of the states recorded after state_id."""
+    return lambda_stmt(
+        lambda: select(States.state_id, States.context_id_bin, States.last_updated_ts)
+        .filter(States.state_id > state_id)
+        .filter(States.context_id_bin.is_not(None))
+        .order_by(States.state_id)
+        .limit(max_bind_vars)
+    )
+
+
+def find_context_origins(context_id_bins: Iterable[bytes]) -> StatementLambdaElement:
+    """Find the indexed origins of contexts."""
+    return lambda_stmt(
+        lambda: select(
+            ContextOrigins.context_id_bin, ContextOrigins.time_fired_ts
+        ).filter(ContextOrigins.context_id_bin.in_(context_id_bins))
+    )
+
+
+def find_events_by_context_ids(
+    context_id_bins: Iterable[bytes],
+) -> StatementLambdaElement:
+    """Find the events of contexts."""
+    return lambda_stmt(
+        lambda: select(
+            Events.event_id, Events.context_id_bin, Events.time_fired_ts
+        ).filter(Events.context_id_bin.in_(context_id_bins))
+    )
+
+
+def find_states_by_context_ids(
+    context_id_bins: Iterable[bytes],
+) -> StatementLambdaElement:
+    """Find the states of contexts."""
+    return lambda_stmt(
+        lambda: select(
+            States.state_id, States.context_id_bin, States.last_updated_ts
+        ).filter(States.context_id_bin.in_(context_id_bins))
+    )
+
+
+def delete_context_origins_by_context_ids(
+    context_id_bins: Iterable[bytes],
+) -> StatementLambdaElement:
+    """Delete the origins of contexts."""
+    return lambda_stmt(
+        lambda: delete(ContextOrigins)
+        .where(ContextOrigins.context_id_bin.in_(context_id_bins))
+        .execution_options(synchronize_session=False)
+    )
+
+
 def get_migration_changes() -> StatementLambdaElement:
     """Query the database for previous migration changes."""
     return lambda_stmt(
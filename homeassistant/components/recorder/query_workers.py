@@ -0,0 +1,106 @@
+"""Worker processes answering read-only statistics queries."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import logging
+import multiprocessing
+from typing import Any, TypeVar
+
+from sqlalchemy import create_engine, event as sqlalchemy_event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.orm import Session
+
+from .const import SQLITE_URL_PREFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Statements making every transaction of a connection read-only,
+# SQLite databases are opened read-only instead
+_READ_ONLY_STATEMENTS = {
+    "mysql": "SET SESSION TRANSACTION READ ONLY",
+    "postgresql": "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY",
+}
+
+# The engine of the worker process, set up by the pool initializer
+_worker_engine: Engine | None = None
+
+
+def _read_only_db_url(db_url: str) -> str:
+    """Return the url to open a SQLite database read-only."""
+    url = make_url(db_url)
+    return url.set(
+        database=f"file:{url.database}", query={"mode": "ro", "uri": "true"}
+    ).render_as_string(hide_password=False)
+
+
+def _set_connection_read_only(
+    dbapi_connection: DBAPIConnection, connection_record: Any
+) -> None:
+    """Make all transactions of a connection read-only."""
+    assert _worker_engine is not None
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(_READ_ONLY_STATEMENTS[_worker_engine.dialect.name])
+    finally:
+        cursor.close()
+
+
+def _initialize_worker(db_url: str) -> None:
+    """Connect a worker process to the database."""
+    global _worker_engine  # noqa: PLW0603
+    if db_url.startswith(SQLITE_URL_PREFIX):
+        _worker_engine = create_engine(_read_only_db_url(db_url), future=True)
+        return
+    connect_args = {"charset": "utf8mb4"} if db_url.startswith("mysql") else {}
+    _worker_engine = create_engine(db_url, connect_args=connect_args, future=True)
+    sqlalchemy_event.listen(_worker_engine, "connect", _set_connection_read_only)
+
+
+@contextmanager
+def query_worker_session() -> Generator[Session, None, None]:
+    """Provide a session of the worker process database connection.
+
+    Only available in functions run by QueryWorkers.run.
+    """
+    assert _worker_engine is not None, "Not called from a query worker"
+    with Session(_worker_engine, future=True) as session:
+        yield session
+
+
+class QueryWorkers:
+    """Pool of processes running read-only queries on their own connections.
+
+    Turning statistics rows into results holds the GIL for as long as it
+    takes, which stalls the event loop and every other executor job while
+    large requests are answered. Worker processes run the query and build
+    the serialized result, so only the bytes of the result cross back.
+    """
+
+    def __init__(self, db_url: str, workers: int) -> None:
+        """Initialize the pool, processes are started on the first query."""
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            # Forking a process with running threads is not safe
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(db_url,),
+        )
+
+    def run(self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a function in a worker process and wait for its result.
+
+        The function and its arguments must be picklable. Must not be called
+        from the event loop.
+        """
+        return self._executor.submit(target, *args).result()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        _LOGGER.debug("Stopping query workers")
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
@@ -11,9 +11,21 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -58,8 +70,13 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMeta,
+    StatisticsMonthly,
+    StatisticsRollupBase,
     StatisticsRuns,
     StatisticsShortTerm,
+    StatisticsWeekly,
 )
 from .models import (
     StatisticData,
@@ -70,6 +87,7 @@ from .models import (
     process_timestamp,
 )
 from .util import (
+    chunked_or_all,
     execute,
     execute_stmt_lambda_element,
     filter_unique_constraint_integrity_error,
@@ -440,6 +458,10 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    if summary:
+        session.flush()
+        _update_statistics_rollups(session, list(summary), start_time_ts, end_time_ts)
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -1091,6 +1113,235 @@ def _reduce_statistics_per_month(
     )
 
 
+_STATISTICS_ROLLUP_REDUCERS: dict[
+    str,
+    tuple[
+        Callable[
+            [],
+            tuple[
+                Callable[[float, float], bool],
+                Callable[[float], tuple[float, float]],
+            ],
+        ],
+        Callable[
+            [
+                dict[str, list[StatisticsRow]],
+                set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+            ],
+            dict[str, list[StatisticsRow]],
+        ],
+    ],
+] = {
+    "day": (reduce_day_ts_factory, _reduce_statistics_per_day),
+    "week": (reduce_week_ts_factory, _reduce_statistics_per_week),
+    "month": (reduce_month_ts_factory, _reduce_statistics_per_month),
+}
+
+STATISTICS_ROLLUP_TABLES: dict[str, type[StatisticsRollupBase]] = {
+    "day": StatisticsDaily,
+    "week": StatisticsWeekly,
+    "month": StatisticsMonthly,
+}
+
+# Number of statistics whose rollups are updated together
+STATISTICS_ROLLUP_BATCH_SIZE = 100
+
+
+@dataclasses.dataclass(slots=True)
+class _StatisticsRollup:
+    """A period of statistics being rolled up."""
+
+    start_ts: float
+    mean_total: float = 0
+    mean_weight: int = 0
+    min: float | None = None
+    max: float | None = None
+    last_reset_ts: float | None = None
+    state: float | None = None
+    sum: float | None = None
+
+    def as_row(self, metadata_id: int) -> dict[str, Any]:
+        """Return the rollup as a row for the rollup tables."""
+        return {
+            "metadata_id": metadata_id,
+            "created_ts": time.time(),
+            "start_ts": self.start_ts,
+            "mean": (self.mean_total / self.mean_weight if self.mean_weight else None),
+            "mean_weight": self.mean_weight,
+            "min": self.min,
+            "max": self.max,
+            "last_reset_ts": self.last_reset_ts,
+            "state": self.state,
+            "sum": self.sum,
+        }
+
+
+def _rollup_statistics(
+    rows: Iterable[Sequence[Any]],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> list[_StatisticsRollup]:
+    """Roll up rows of a single statistic ordered by start_ts into periods.
+
+    This matches _reduce_statistics, the mean is weighted by the number of
+    hourly means so periods can be rolled up again into longer periods.
+    """
+    rollups: list[_StatisticsRollup] = []
+    period_end = 0.0
+    rollup: _StatisticsRollup | None = None
+    for start_ts, _mean, _min, _max, last_reset_ts, state, _sum, weight in rows:
+        if rollup is None or start_ts >= period_end:
+            period_start, period_end = period_start_end(start_ts)
+            rollup = _StatisticsRollup(period_start)
+            rollups.append(rollup)
+        if _mean is not None and weight:
+            rollup.mean_total += _mean * weight
+            rollup.mean_weight += weight
+        if _min is not None and (rollup.min is None or _min < rollup.min):
+            rollup.min = _min
+        if _max is not None and (rollup.max is None or _max > rollup.max):
+            rollup.max = _max
+        rollup.last_reset_ts = last_reset_ts
+        rollup.state = state
+        rollup.sum = _sum
+    return rollups
+
+
+def _rollup_period_range(
+    period_start_end: Callable[[float], tuple[float, float]],
+    start_ts: float,
+    end_ts: float | None,
+) -> tuple[float, float | None]:
+    """Return the start and end of the periods that overlap start_ts - end_ts."""
+    range_start = period_start_end(start_ts)[0]
+    if end_ts is None:
+        return range_start, None
+    period_start, period_end = period_start_end(end_ts)
+    return range_start, period_start if period_start == end_ts else period_end
+
+
+def _update_statistics_rollup_table(
+    session: Session,
+    table: type[StatisticsRollupBase],
+    source: type[StatisticsBase],
+    metadata_ids: Collection[int],
+    range_start: float,
+    range_end: float | None,
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> None:
+    """Replace the rollups of the periods in the range from the source table."""
+    weight = StatisticsDaily.mean_weight if source is StatisticsDaily else literal(1)
+    query = select(
+        source.metadata_id,
+        source.start_ts,
+        source.mean,
+        source.min,
+        source.max,
+        source.last_reset_ts,
+        source.state,
+        source.sum,
+        weight,
+    ).where(
+        source.metadata_id.in_(metadata_ids),
+        source.start_ts >= range_start,
+    )
+    delete_stmt = delete(table).where(
+        table.metadata_id.in_(metadata_ids), table.start_ts >= range_start
+    )
+    if range_end is not None:
+        query = query.where(source.start_ts < range_end)
+        delete_stmt = delete_stmt.where(table.start_ts < range_end)
+    rows = session.execute(query.order_by(source.metadata_id, source.start_ts)).all()
+    session.execute(delete_stmt.execution_options(synchronize_session=False))
+    new_rows = [
+        rollup.as_row(metadata_id)
+        for metadata_id, group in groupby(rows, itemgetter(0))
+        for rollup in _rollup_statistics((row[1:] for row in group), period_start_end)
+    ]
+    if new_rows:
+        session.execute(insert(table), new_rows)
+
+
+def _update_statistics_rollups(
+    session: Session,
+    metadata_ids: Collection[int],
+    start_ts: float,
+    end_ts: float | None,
+) -> None:
+    """Update the rollups of the periods that overlap start_ts - end_ts.
+
+    Days are rolled up from the hourly statistics, weeks and months are
+    rolled up from the days. Periods are aligned to the local time zone.
+    """
+    _, day_start_end = reduce_day_ts_factory()
+    _, week_start_end = reduce_week_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    day_start, day_end = _rollup_period_range(day_start_end, start_ts, end_ts)
+    # Without an end, every hourly statistic after start_ts is loaded
+    # so only roll up one statistic at a time
+    batch_size = 1 if end_ts is None else STATISTICS_ROLLUP_BATCH_SIZE
+    for ids in chunked_or_all(metadata_ids, batch_size):
+        _update_statistics_rollup_table(
+            session,
+            StatisticsDaily,
+            Statistics,
+            ids,
+            day_start,
+            day_end,
+            day_start_end,
+        )
+        rollups_from_days: tuple[
+            tuple[type[StatisticsRollupBase], Callable[[float], tuple[float, float]]],
+            ...,
+        ] = (
+            (StatisticsWeekly, week_start_end),
+            (StatisticsMonthly, month_start_end),
+        )
+        for table, period_start_end in rollups_from_days:
+            range_start, range_end = _rollup_period_range(
+                period_start_end, day_start, day_end
+            )
+            _update_statistics_rollup_table(
+                session,
+                table,
+                StatisticsDaily,
+                ids,
+                range_start,
+                range_end,
+                period_start_end,
+            )
+
+
+def rebuild_statistics_rollups_with_session(session: Session) -> None:
+    """Rebuild the rollups of every statistic from the hourly statistics."""
+    metadata_ids = [
+        metadata_id for (metadata_id,) in session.execute(select(StatisticsMeta.id))
+    ]
+    for metadata_id in metadata_ids:
+        _update_statistics_rollups(session, [metadata_id], 0, None)
+        session.commit()
+
+
+@retryable_database_job("rebuild statistics rollups")
+def rebuild_statistics_rollups(instance: Recorder) -> bool:
+    """Rebuild the rollups of every statistic from the hourly statistics."""
+    with session_scope(session=instance.get_session()) as session:
+        rebuild_statistics_rollups_with_session(session)
+    instance.statistics_rollups_valid = True
+    return True
+
+
+def _statistics_rollups_aligned(
+    result: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> bool:
+    """Return if the rollups start at the periods of the current time zone."""
+    return all(
+        period_start_end(row["start"])[0] == row["start"]
+        for rows in result.values()
+        for row in rows
+    )
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1643,6 +1894,59 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_rollups_usable(instance: Recorder) -> bool:
+    """Return if the statistics rollups are complete."""
+    return instance.statistics_rollups_valid and not instance.migration_in_progress
+
+
+def _statistics_during_period_from_rollups(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    table: type[StatisticsRollupBase],
+    period: Literal["day", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return statistic data points for a period from the rollup tables.
+
+    Returns None if the rollups are not aligned with the periods of the
+    current time zone, and schedules a rebuild of the rollups.
+    """
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return {}
+    result = _sorted_statistics_to_dict(
+        hass,
+        session,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        table,
+        start_time,
+        units,
+        types,
+    )
+    reduce_factory, reduce = _STATISTICS_ROLLUP_REDUCERS[period]
+    if not _statistics_rollups_aligned(result, reduce_factory()[1]):
+        _LOGGER.debug("Statistics rollups do not match the time zone, rebuilding")
+        get_instance(hass).queue_statistics_rollups_rebuild()
+        return None
+    # Each row is already a full period, reducing it only sets the end
+    # of periods that are not of the nominal length like months
+    return reduce(result, types)
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1713,37 +2017,51 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    result: dict[str, list[StatisticsRow]] | None = None
+    match period:
+        # The periods of the rollup tables, matched so the type of period is narrowed
+        case "day" | "week" | "month" if _statistics_rollups_usable(get_instance(hass)):
+            result = _statistics_during_period_from_rollups(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                metadata_ids,
+                metadata,
+                STATISTICS_ROLLUP_TABLES[period],
+                period,
+                units,
+                types,
+            )
+            if result == {}:
+                return {}
 
-    if not stats:
-        return {}
+    if result is None:
+        result = statistics_during_period_from_table(
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            get_state_units(hass, metadata),
+            table,
+            units,
+            types,
+        )
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        session,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        start_time,
-        units,
-        types,
-    )
+        if not result:
+            return {}
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -1754,6 +2072,35 @@ def _statistics_during_period_with_session(
     return result
 
 
+def statistics_during_period_from_table(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    state_units: dict[str, str | None],
+    table: type[Statistics | StatisticsShortTerm],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return the rows of a statistics table during UTC period start_time - end_time.
+
+    Does not need Home Assistant, so it can be called from the query workers.
+    """
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return {}
+    return _statistics_rows_to_dict(
+        stats, statistic_ids, metadata, state_units, table, units, types
+    )
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -2052,6 +2399,46 @@ def _sorted_statistics_to_dict(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Convert SQL results into JSON friendly data structure."""
+    return _statistics_rows_to_dict(
+        stats,
+        statistic_ids,
+        _metadata,
+        get_state_units(hass, _metadata) if convert_units else None,
+        table,
+        units,
+        types,
+    )
+
+
+def get_state_units(
+    hass: HomeAssistant, metadata: dict[str, tuple[int, StatisticMetaData]]
+) -> dict[str, str | None]:
+    """Return the unit of the state of each statistic.
+
+    The unit of the statistic is used if there is no state.
+    """
+    state_units: dict[str, str | None] = {}
+    for statistic_id, (_, metadata_by_id) in metadata.items():
+        state_unit = metadata_by_id["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        state_units[statistic_id] = state_unit
+    return state_units
+
+
+def _statistics_rows_to_dict(
+    stats: Sequence[Row[Any]],
+    statistic_ids: set[str] | None,
+    _metadata: dict[str, tuple[int, StatisticMetaData]],
+    state_units: dict[str, str | None] | None,
+    table: type[StatisticsBase],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Convert SQL results into JSON friendly data structure.
+
+    Units are converted to the display units if the state units are given.
+    """
     assert stats, "stats must not be empty"  # Guard against implementation error
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
     metadata = dict(_metadata.values())
@@ -2090,11 +2477,10 @@ def _sorted_statistics_to_dict(
     for meta_id, stats_list in stats_by_meta_id.items():
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
-        if convert_units:
-            state_unit = unit = metadata_by_id["unit_of_measurement"]
-            if state := hass.states.get(statistic_id):
-                state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(unit, state_unit, units)
+        if state_units is not None:
+            convert = _get_statistic_to_display_unit_converter(
+                metadata_by_id["unit_of_measurement"], state_units[statistic_id], units
+            )
         else:
             convert = None
 
@@ -2353,6 +2739,7 @@ def import_statistics(
     table: type[StatisticsBase],
 ) -> bool:
     """Process an import_statistics job."""
+    statistics = list(statistics)
 
     with session_scope(
         session=instance.get_session(),
@@ -2360,9 +2747,27 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        if not _import_statistics_with_session(
             instance, session, metadata, statistics, table
-        )
+        ):
+            return False
+
+    if table is Statistics and statistics:
+        # The rollups are updated once the imported statistics are committed
+        # so a duplicated statistic does not fail the rollup update
+        with session_scope(session=instance.get_session()) as session:
+            if metadata_with_id := instance.statistics_meta_manager.get(
+                session, metadata["statistic_id"]
+            ):
+                starts = [stat["start"] for stat in statistics]
+                _update_statistics_rollups(
+                    session,
+                    [metadata_with_id[0]],
+                    min(starts).timestamp(),
+                    (max(starts) + table.duration).timestamp(),
+                )
+
+    return True
 
 
 @retryable_database_job("adjust_statistics")
@@ -2403,6 +2808,12 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        _update_statistics_rollups(
+            session,
+            [metadata[statistic_id][0]],
+            start_time.replace(minute=0).timestamp(),
+            None,
+        )
 
     return True
 
@@ -2464,6 +2875,7 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            *STATISTICS_ROLLUP_TABLES.values(),
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -0,0 +1,145 @@
+"""Cache of computed statistics results shared between requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable, Sized
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from lru import LRU
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+_T = TypeVar("_T")
+# If the result is computed from short term statistics, the time zone and the key
+_ResultKey = tuple[bool, str, Hashable]
+
+# Number of computed results to keep, a few per open dashboard
+CACHE_SIZE = 64
+# Total size of the results to keep in bytes, results larger than
+# MAX_RESULT_BYTES are computed for every request
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+MAX_RESULT_BYTES = CACHE_MAX_BYTES // 4
+# Estimated size of a row of a result that is not serialized
+ROW_BYTES = 64
+
+
+def _result_size(result: Any) -> int:
+    """Return the estimated size of a result in bytes."""
+    if isinstance(result, (bytes, str)):
+        return len(result)
+    if isinstance(result, Sized):
+        return len(result) * ROW_BYTES
+    return ROW_BYTES
+
+
+class StatisticsResultCache:
+    """Share computed statistics results until the statistics change.
+
+    Results are tagged with the generation of the statistics they were
+    computed from. The recorder thread bumps the generation after statistics
+    are compiled, imported, adjusted, purged or otherwise changed, which
+    drops every result computed from the old statistics.
+
+    Requests for a result that is still being computed wait for the same
+    computation instead of starting their own. The least recently used
+    results are dropped when the cache holds more than CACHE_SIZE results
+    or CACHE_MAX_BYTES of results.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the statistics result cache."""
+        self.recorder = recorder
+        self.short_term_generation = 0
+        self.long_term_generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._results: LRU[_ResultKey, tuple[int, asyncio.Future[Any]]] = LRU(
+            CACHE_SIZE, callback=self._async_evicted
+        )
+        self._sizes: dict[_ResultKey, int] = {}
+
+    def invalidate(self, short_term: bool = True, long_term: bool = True) -> None:
+        """Invalidate the results computed from statistics that changed.
+
+        Must be called from the recorder thread after the change is committed.
+        """
+        if short_term:
+            self.short_term_generation += 1
+        if long_term:
+            self.long_term_generation += 1
+        self.recorder.hass.loop.call_soon_threadsafe(self._async_remove_stale)
+
+    async def async_get(
+        self, key: Hashable, short_term: bool, target: Callable[[], _T]
+    ) -> _T:
+        """Return the result for a key, computing it in the executor on a miss.
+
+        The key must identify everything the result depends on except the
+        statistics and the time zone, short_term is set if the result is
+        computed from the 5-minute statistics.
+        """
+        generation = (
+            self.short_term_generation if short_term else self.long_term_generation
+        )
+        # Periods of a day or longer are aligned to the local time zone
+        result_key = (short_term, str(dt_util.DEFAULT_TIME_ZONE), key)
+        if (cached := self._results.get(result_key)) is not None and cached[
+            0
+        ] == generation:
+            self.hits += 1
+            return await asyncio.shield(cached[1])
+
+        self.misses += 1
+        future = self.recorder.async_add_executor_job(target)
+        self._async_remove(result_key)
+        self._results[result_key] = (generation, future)
+        future.add_done_callback(lambda fut: self._async_computed(result_key, fut))
+        return await asyncio.shield(future)
+
+    @callback
+    def _async_computed(self, key: _ResultKey, future: asyncio.Future[Any]) -> None:
+        """Account for the size of a result, forgetting failed computations.
+
+        A failed computation is forgotten so the next request retries it.
+        """
+        if (cached := self._results.get(key)) is None or cached[1] is not future:
+            return
+        if future.cancelled() or future.exception() is not None:
+            self._async_remove(key)
+            return
+        if (size := _result_size(future.result())) > MAX_RESULT_BYTES:
+            self._async_remove(key)
+            return
+        self._sizes[key] = size
+        self.size += size
+        while self.size > CACHE_MAX_BYTES and (
+            oldest := self._results.peek_last_item()
+        ):
+            self._async_remove(oldest[0])
+
+    @callback
+    def _async_remove_stale(self) -> None:
+        """Remove the results computed from statistics that changed."""
+        for key, (generation, _) in self._results.items():
+            if generation != (
+                self.short_term_generation if key[0] else self.long_term_generation
+            ):
+                self._async_remove(key)
+
+    @callback
+    def _async_remove(self, key: _ResultKey) -> None:
+        """Remove a result."""
+        if key in self._results:
+            del self._results[key]
+        self.size -= self._sizes.pop(key, 0)
+
+    @callback
+    def _async_evicted(self, key: _ResultKey, value: Any) -> None:
+        """Forget the size of a result evicted by the LRU."""
+        self.size -= self._sizes.pop(key, 0)
@@ -0,0 +1,178 @@
+"""Support managing ContextOrigins."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from lru import LRU
+from sqlalchemy import Table, func, insert, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.dml import Insert
+
+from ..const import SupportedDialect
+from ..db_schema import ContextOrigins, Events, States
+
+if TYPE_CHECKING:
+    from ..core import Recorder
+
+# Contexts are usually short lived so we only need to remember
+# the most recent ones to skip rows that are not the origin. If
+# a context is seen again after it was evicted, the insert is
+# ignored by the unique index.
+CACHE_SIZE = 2048
+
+
+def _context_origins_table() -> Table:
+    """Return the context origins table."""
+    table = ContextOrigins.__table__
+    assert isinstance(table, Table)
+    return table
+
+
+def _insert_ignore_stmt(session: Session) -> Insert:
+    """Return an insert that skips contexts that already have an origin.
+
+    The dialect is taken from the bind of the session since the insert
+    must match the database that executes it.
+    """
+    table = _context_origins_table()
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == SupportedDialect.SQLITE:
+        return sqlite.insert(table).on_conflict_do_nothing()
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        return postgresql.insert(table).on_conflict_do_nothing()
+    if dialect_name == SupportedDialect.MYSQL:
+        return mysql.insert(table).on_duplicate_key_update(
+            context_id_bin=table.c.context_id_bin
+        )
+    return insert(table)
+
+
+class ContextOriginsManager:
+    """Manage the context_origins table."""
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the context origins manager."""
+        self.recorder = recorder
+        self._seen: LRU[bytes, bool] = LRU(CACHE_SIZE)
+        self._pending: list[Events | States] = []
+        self._indexed_since: float | None = None
+        self.active = False
+        # The last event and state whose contexts were indexed by the
+        # runtime migration, or None once all of them were indexed
+        self.migrated_event_id: int | None = 0
+        self.migrated_state_id: int | None = 0
+
+    @property
+    def has_pending(self) -> bool:
+        """Return if there are origins waiting to be written."""
+        return bool(self._pending)
+
+    def add_pending(self, context_id_bin: bytes | None, row: Events | States) -> None:
+        """Add a row that was added to the session if it is the first of its context.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if context_id_bin is None or context_id_bin in self._seen:
+            return
+        self._seen[context_id_bin] = True
+        self._pending.append(row)
+
+    def write_pending(self, session: Session) -> None:
+        """Write the origins of the new contexts.
+
+        The rows must have been flushed so their ids are known. This
+        does not clear the pending rows, so the write can be retried if
+        the commit fails.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending:
+            return
+        origins: list[dict[str, Any]] = []
+        for row in self._pending:
+            # The ids are only missing if the rows were not written
+            if isinstance(row, Events):
+                event_id: int | None = row.event_id
+                if event_id is not None:
+                    origins.append(
+                        {
+                            "context_id_bin": row.context_id_bin,
+                            "time_fired_ts": row.time_fired_ts,
+                            "event_id": event_id,
+                            "state_id": None,
+                        }
+                    )
+                continue
+            state_id: int | None = row.state_id
+            if state_id is not None:
+                origins.append(
+                    {
+                        "context_id_bin": row.context_id_bin,
+                        "time_fired_ts": row.last_updated_ts,
+                        "event_id": None,
+                        "state_id": state_id,
+                    }
+                )
+        if origins:
+            session.execute(_insert_ignore_stmt(session), origins)
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to discard the written origins.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.clear()
+
+    def get_indexed_since(self, session: Session) -> float | None:
+        """Return the time of the oldest indexed context.
+
+        Contexts that were recorded before the index was created are
+        not in the index so queries that start before this time have to
+        look up the origins in the events and states tables. If no event
+        or state is older than the oldest indexed context, every context
+        is indexed and 0 is returned.
+
+        None is returned until the contexts that were recorded before
+        the index was created have been indexed.
+
+        This call is thread-safe.
+        """
+        if not self.active:
+            return None
+        if self._indexed_since is not None:
+            return self._indexed_since
+        indexed_since: float | None = session.execute(
+            select(func.min(ContextOrigins.time_fired_ts))
+        ).scalar()
+        if indexed_since is None:
+            return None
+        oldest_event: float | None = session.execute(
+            select(func.min(Events.time_fired_ts))
+        ).scalar()
+        oldest_state: float | None = session.execute(
+            select(func.min(States.last_updated_ts))
+        ).scalar()
+        if all(
+            oldest is None or oldest >= indexed_since
+            for oldest in (oldest_event, oldest_state)
+        ):
+            indexed_since = 0.0
+        self._indexed_since = indexed_since
+        return indexed_since
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._seen.clear()
+        self._pending.clear()
+        self._indexed_since = None
+        self.migrated_event_id = 0
+        self.migrated_state_id = 0
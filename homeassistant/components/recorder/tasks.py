@@ -53,6 +53,7 @@ class ChangeStatisticsUnitTask(RecorderTask):
             self.new_unit_of_measurement,
             self.old_unit_of_measurement,
         )
+        instance.statistics_result_cache.invalidate()
 
 
 @dataclass(slots=True)
@@ -64,6 +65,7 @@ class ClearStatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
         statistics.clear_statistics(instance, self.statistic_ids)
+        instance.statistics_result_cache.invalidate()
 
 
 @dataclass(slots=True)
@@ -82,6 +84,7 @@ class UpdateStatisticsMetadataTask(RecorderTask):
             self.new_statistic_id,
             self.new_unit_of_measurement,
         )
+        instance.statistics_result_cache.invalidate()
 
 
 @dataclass(slots=True)
@@ -98,6 +101,8 @@ class UpdateStatesMetadataTask(RecorderTask):
             self.entity_id,
             self.new_entity_id,
         )
+        if instance.history_cache:
+            instance.history_cache.clear()
 
 
 @dataclass(slots=True)
@@ -110,9 +115,18 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        if instance.history_cache:
+            # The filtered entities can be purged from any point in time
+            if self.apply_filter:
+                instance.history_cache.clear()
+            else:
+                instance.history_cache.evict_before(self.purge_before.timestamp())
+        finished = purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        )
+        # The short term statistics before purge_before may have been purged
+        instance.statistics_result_cache.invalidate(long_term=False)
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -135,6 +149,8 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        if instance.history_cache:
+            instance.history_cache.clear()
         if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
             return
         # Schedule a new purge task if this one didn't finish
@@ -163,6 +179,10 @@ class StatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Run statistics task."""
         if statistics.compile_statistics(instance, self.start, self.fire_events):
+            # Hourly statistics are compiled with the last 5-minute period
+            instance.statistics_result_cache.invalidate(
+                long_term=self.start.minute == 55
+            )
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(StatisticsTask(self.start, self.fire_events))
@@ -175,6 +195,7 @@ class CompileMissingStatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Run statistics task to compile missing statistics."""
         if statistics.compile_missing_statistics(instance):
+            instance.statistics_result_cache.invalidate()
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(CompileMissingStatisticsTask())
@@ -193,6 +214,10 @@ class ImportStatisticsTask(RecorderTask):
         if statistics.import_statistics(
             instance, self.metadata, self.statistics, self.table
         ):
+            instance.statistics_result_cache.invalidate(
+                short_term=self.table is StatisticsShortTerm,
+                long_term=self.table is Statistics,
+            )
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(
@@ -218,6 +243,7 @@ class AdjustStatisticsTask(RecorderTask):
             self.sum_adjustment,
             self.adjustment_unit,
         ):
+            instance.statistics_result_cache.invalidate()
             return
         # Schedule a new adjust statistics task if this one didn't finish
         instance.queue_task(
@@ -348,6 +374,17 @@ class StatisticsTimestampMigrationCleanupTask(RecorderTask):
             instance.queue_task(StatisticsTimestampMigrationCleanupTask())
 
 
+@dataclass(slots=True)
+class RebuildStatisticsRollupsTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild the statistics rollups."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollups rebuild task."""
+        if not statistics.rebuild_statistics_rollups(instance):
+            # Schedule a new rebuild task if this one didn't finish
+            instance.queue_task(RebuildStatisticsRollupsTask())
+
+
 @dataclass(slots=True)
 class AdjustLRUSizeTask(RecorderTask):
     """An object to insert into the recorder queue to adjust the LRU size."""
@@ -428,6 +465,22 @@ class EntityIDMigrationTask(RecorderTask):
             instance.queue_task(EntityIDPostMigrationTask())
 
 
+@dataclass(slots=True)
+class ContextOriginsMigrationTask(RecorderTask):
+    """An object to insert into the recorder queue to index the origins of contexts."""
+
+    commit_before = True
+    # We have to commit before to make sure the origins
+    # of new contexts are written before we look for
+    # contexts that are not indexed yet
+
+    def run(self, instance: Recorder) -> None:
+        """Run context origins migration task."""
+        if not instance._migrate_context_origins():  # pylint: disable=[protected-access]
+            # Schedule a new migration task if this one didn't finish
+            instance.queue_task(ContextOriginsMigrationTask())
+
+
 @dataclass(slots=True)
 class EntityIDPostMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to cleanup after entity_ids migration."""
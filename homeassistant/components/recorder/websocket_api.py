@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
+from functools import partial
 from typing import Any, Literal, cast
 
 import voluptuous as vol
@@ -32,19 +33,31 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
-from .models import StatisticPeriod
+from .db_schema import Statistics, StatisticsShortTerm
+from .models import StatisticMetaData, StatisticPeriod
+from .query_workers import query_worker_session
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
+    _extract_metadata_and_discard_impossible_columns,
     async_add_external_statistics,
     async_change_statistics_unit,
     async_import_statistics,
     async_list_statistic_ids,
+    get_state_units,
     list_statistic_ids,
     statistic_during_period,
     statistics_during_period,
+    statistics_during_period_from_table,
     validate_statistics,
 )
-from .util import PERIOD_SCHEMA, get_instance, resolve_period
+from .util import PERIOD_SCHEMA, get_instance, resolve_period, session_scope
+
+# Chunked statistics responses fetch windows of whole periods sized to
+# read about this many rows from the database
+STATISTICS_CHUNK_ROWS = 20000
+
+# Number of stored rows each period is compiled from
+_PERIOD_ROWS = {"5minute": 1, "hour": 1, "day": 24, "week": 24 * 7, "month": 24 * 31}
 
 UNIT_SCHEMA = vol.Schema(
     {
@@ -78,6 +91,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_import_statistics)
+    websocket_api.async_register_command(hass, ws_executor_stats)
     websocket_api.async_register_command(hass, ws_info)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_validate_statistics)
@@ -142,7 +156,6 @@ async def ws_get_statistic_during_period(
 
 def _ws_get_statistics_during_period(
     hass: HomeAssistant,
-    msg_id: int,
     start_time: dt,
     end_time: dt | None,
     statistic_ids: set[str] | None,
@@ -150,7 +163,33 @@ def _ws_get_statistics_during_period(
     units: dict[str, str],
     types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> bytes:
-    """Fetch statistics and convert them to json in the executor."""
+    """Fetch statistics and convert them to json in the executor.
+
+    Returns the json of the result only so it can be shared by requests.
+    """
+    instance = get_instance(hass)
+    if (
+        instance.query_workers is not None
+        and period in ("5minute", "hour")
+        and "change" not in types
+    ):
+        with session_scope(hass=hass, read_only=True) as session:
+            metadata = instance.statistics_meta_manager.get_many(
+                session, statistic_ids=statistic_ids
+            )
+        if not metadata:
+            return json_bytes({})
+        return instance.query_workers.run(
+            _statistics_during_period_json,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            get_state_units(hass, metadata),
+            period,
+            units,
+            types,
+        )
     result = statistics_during_period(
         hass,
         start_time,
@@ -160,6 +199,42 @@ def _ws_get_statistics_during_period(
         units,
         types,
     )
+    _convert_timestamps_to_ms(result)
+    return json_bytes(result)
+
+
+def _statistics_during_period_json(
+    start_time: dt,
+    end_time: dt | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    state_units: dict[str, str | None],
+    period: Literal["5minute", "hour"],
+    units: dict[str, str] | None,
+    _types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> bytes:
+    """Fetch statistics and convert them to json in a query worker."""
+    types = set(_types)
+    metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
+    with query_worker_session() as session:
+        result = statistics_during_period_from_table(
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            state_units,
+            Statistics if period == "hour" else StatisticsShortTerm,
+            units,
+            types,
+        )
+    _convert_timestamps_to_ms(result)
+    return json_bytes(result)
+
+
+def _convert_timestamps_to_ms(result: dict[str, list[Any]]) -> None:
+    """Convert the timestamps of statistics rows to milliseconds."""
     for statistic_id in result:
         for item in result[statistic_id]:
             if (start := item.get("start")) is not None:
@@ -168,7 +243,138 @@ def _ws_get_statistics_during_period(
                 item["end"] = int(end * 1000)
             if (last_reset := item.get("last_reset")) is not None:
                 item["last_reset"] = int(last_reset * 1000)
-    return json_bytes(messages.result_message(msg_id, result))
+
+
+def _statistics_chunk_boundaries(
+    start_time: dt,
+    end_time: dt,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    statistic_count: int,
+) -> list[dt]:
+    """Return the period boundaries splitting a time range into chunks.
+
+    Day, week and month periods are aligned in local time, like the
+    statistics queries align them.
+    """
+    periods = max(1, STATISTICS_CHUNK_ROWS // (statistic_count * _PERIOD_ROWS[period]))
+    if period == "5minute":
+        boundary = start_time.replace(
+            minute=start_time.minute - start_time.minute % 5, second=0, microsecond=0
+        )
+        step = timedelta(minutes=5 * periods)
+    elif period == "hour":
+        boundary = start_time.replace(minute=0, second=0, microsecond=0)
+        step = timedelta(hours=periods)
+    else:
+        boundary = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        if period == "day":
+            step = timedelta(days=periods)
+        elif period == "week":
+            boundary -= timedelta(days=boundary.weekday())
+            step = timedelta(weeks=periods)
+        else:
+            boundary = boundary.replace(day=1)
+    boundaries: list[dt] = []
+    while True:
+        if period == "month":
+            month = boundary.month - 1 + periods
+            boundary = boundary.replace(
+                year=boundary.year + month // 12, month=month % 12 + 1
+            )
+        else:
+            boundary += step
+        if boundary >= end_time:
+            return boundaries
+        boundaries.append(boundary)
+
+
+def _ws_get_statistics_during_period_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+    complete: bool,
+) -> bytes | None:
+    """Fetch a chunk of statistics and convert it to a json event in the executor.
+
+    Returns None if the chunk is empty and there is more to come.
+    """
+    result = statistics_during_period(
+        hass,
+        start_time,
+        end_time,
+        statistic_ids,
+        period,
+        units,
+        types,
+    )
+    if not result and not complete:
+        return None
+    _convert_timestamps_to_ms(result)
+    return json_bytes(
+        messages.event_message(msg_id, {"statistics": result, "complete": complete})
+    )
+
+
+async def _async_send_statistics_during_period_chunks(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> None:
+    """Send statistics as a series of events covering consecutive chunks.
+
+    Each chunk spans whole periods so only about STATISTICS_CHUNK_ROWS rows
+    are held in memory at a time, and the last event is marked complete.
+    The client can stop the response by unsubscribing.
+    """
+    instance = get_instance(hass)
+    connection.subscriptions[msg_id] = callback(lambda: None)
+    connection.send_result(msg_id)
+    boundaries = _statistics_chunk_boundaries(
+        start_time, end_time or dt_util.utcnow(), period, len(statistic_ids)
+    )
+    chunk_start = start_time
+    try:
+        for chunk_end in (*boundaries, None):
+            if msg_id not in connection.subscriptions:
+                return
+            complete = chunk_end is None
+            # The statistics queries extend the end time to the end of the
+            # period it falls in, so end each chunk just before its boundary.
+            query_end = (
+                end_time if chunk_end is None else chunk_end - timedelta(microseconds=1)
+            )
+            payload = await instance.async_add_executor_job(
+                _ws_get_statistics_during_period_chunk,
+                hass,
+                msg_id,
+                chunk_start,
+                query_end,
+                statistic_ids,
+                period,
+                units,
+                types,
+                complete,
+            )
+            if payload and msg_id in connection.subscriptions:
+                connection.send_message(payload)
+            if chunk_end is not None:
+                chunk_start = chunk_end
+    finally:
+        # The response is over, whether complete or failed
+        connection.subscriptions.pop(msg_id, None)
 
 
 async def ws_handle_get_statistics_during_period(
@@ -195,19 +401,46 @@ async def ws_handle_get_statistics_during_period(
 
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
-    connection.send_message(
-        await get_instance(hass).async_add_executor_job(
-            _ws_get_statistics_during_period,
+    if msg.get("chunked"):
+        await _async_send_statistics_during_period_chunks(
             hass,
+            connection,
             msg["id"],
             start_time,
             end_time,
             set(msg["statistic_ids"]),
-            msg.get("period"),
+            msg["period"],
             msg.get("units"),
             types,
         )
+        return
+    statistic_ids = set(msg["statistic_ids"])
+    units = msg.get("units")
+    # Every open dashboard asks for the same statistics, share the result
+    # until the statistics change
+    payload = await get_instance(hass).statistics_result_cache.async_get(
+        (
+            "statistics_during_period",
+            start_time,
+            end_time,
+            frozenset(statistic_ids),
+            msg["period"],
+            frozenset(units.items()) if units else None,
+            frozenset(types),
+        ),
+        msg["period"] == "5minute",
+        partial(
+            _ws_get_statistics_during_period,
+            hass,
+            start_time,
+            end_time,
+            statistic_ids,
+            msg["period"],
+            units,
+            types,
+        ),
     )
+    connection.send_message(messages.construct_result_message(msg["id"], payload))
 
 
 @websocket_api.websocket_command(
@@ -222,6 +455,7 @@ async def ws_handle_get_statistics_during_period(
             [vol.Any("change", "last_reset", "max", "mean", "min", "state", "sum")],
             vol.Coerce(set),
         ),
+        vol.Optional("chunked"): bool,
     }
 )
 @websocket_api.async_response
@@ -477,6 +711,20 @@ def ws_import_statistics(
     connection.send_result(msg["id"])
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/executor_stats",
+    }
+)
+@websocket_api.require_admin
+@callback
+def ws_executor_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return how long database executor jobs waited and ran by function."""
+    connection.send_result(msg["id"], get_instance(hass).executor_job_timer.as_dict())
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "recorder/info",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
 import logging
 from typing import Any
 
@@ -10,8 +11,10 @@ import voluptuous as vol
 
 from homeassistant.components import automation, group, person, script, websocket_api
 from homeassistant.components.homeassistant import scene
-from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback, split_entity_id
 from homeassistant.helpers import (
+    area_registry as ar,
     config_validation as cv,
     device_registry as dr,
     entity_registry as er,
@@ -20,39 +23,93 @@ from homeassistant.helpers.entity import (
     EntityInfo,
     entity_sources as get_entity_sources,
 )
+from homeassistant.helpers.event import EventStateChangedData
+from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import ConfigType
 
 DOMAIN = "search"
+DATA_SEARCH_INDEX = "search_index"
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
+ITEM_TYPES = (
+    "area",
+    "automation",
+    "automation_blueprint",
+    "config_entry",
+    "device",
+    "entity",
+    "floor",
+    "group",
+    "label",
+    "person",
+    "scene",
+    "script",
+    "script_blueprint",
+)
+
+ITEM_SCHEMA = {
+    vol.Required("item_type"): vol.In(ITEM_TYPES),
+    vol.Required("item_id"): str,
+}
+
+
+def _blueprint_references(
+    blueprint_in_x: Callable[[HomeAssistant, str], str | None],
+) -> Callable[[HomeAssistant, str], list[str]]:
+    """Return a lookup of the blueprint an automation or script is created from."""
+
+    def blueprints_in_x(hass: HomeAssistant, entity_id: str) -> list[str]:
+        if blueprint := blueprint_in_x(hass, entity_id):
+            return [blueprint]
+        return []
+
+    return blueprints_in_x
+
+
+# The lookups of what an entity of each domain references, by reference type
+_REFERENCES: dict[str, dict[str, Callable[[HomeAssistant, str], Iterable[str]]]] = {
+    automation.DOMAIN: {
+        "area": automation.areas_in_automation,
+        "blueprint": _blueprint_references(automation.blueprint_in_automation),
+        "device": automation.devices_in_automation,
+        "entity": automation.entities_in_automation,
+        "floor": automation.floors_in_automation,
+        "label": automation.labels_in_automation,
+    },
+    group.DOMAIN: {"entity": group.get_entity_ids},
+    person.DOMAIN: {"entity": person.entities_in_person},
+    "scene": {"entity": scene.entities_in_scene},
+    script.DOMAIN: {
+        "area": script.areas_in_script,
+        "blueprint": _blueprint_references(script.blueprint_in_script),
+        "device": script.devices_in_script,
+        "entity": script.entities_in_script,
+        "floor": script.floors_in_script,
+        "label": script.labels_in_script,
+    },
+}
+
+# State attributes holding the members of a group or person, the references of
+# the other domains can only change by reloading, which replaces the entity.
+_MEMBER_ATTRIBUTES = {
+    group.DOMAIN: ATTR_ENTITY_ID,
+    person.DOMAIN: person.ATTR_DEVICE_TRACKERS,
+}
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Search component."""
     websocket_api.async_register_command(hass, websocket_search_related)
+    websocket_api.async_register_command(hass, websocket_search_related_many)
     return True
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "search/related",
-        vol.Required("item_type"): vol.In(
-            (
-                "area",
-                "automation",
-                "automation_blueprint",
-                "config_entry",
-                "device",
-                "entity",
-                "group",
-                "person",
-                "scene",
-                "script",
-                "script_blueprint",
-            )
-        ),
-        vol.Required("item_id"): str,
+        **ITEM_SCHEMA,
     }
 )
 @callback
@@ -73,6 +130,108 @@ def websocket_search_related(
     )
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "search/related_many",
+        vol.Required("items"): [ITEM_SCHEMA],
+    }
+)
+@callback
+def websocket_search_related_many(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle search for the related items of many items at once."""
+    device_reg = dr.async_get(hass)
+    entity_reg = er.async_get(hass)
+    entity_sources = get_entity_sources(hass)
+    connection.send_result(
+        msg["id"],
+        [
+            Searcher(hass, device_reg, entity_reg, entity_sources).async_search(
+                item["item_type"], item["item_id"]
+            )
+            for item in msg["items"]
+        ],
+    )
+
+
+@singleton(DATA_SEARCH_INDEX)
+@callback
+def async_get_search_index(hass: HomeAssistant) -> SearchIndex:
+    """Return the search index."""
+    return SearchIndex(hass)
+
+
+class SearchIndex:
+    """Index of the items referenced by automations, scripts, scenes, groups and persons.
+
+    Which automations reference an entity can only be found by going through
+    the config of every automation, the index keeps these reverse edges so
+    finding them is a lookup. Edges between registry entries are already
+    indexed by the registries.
+
+    The references of a domain are rebuilt the first time they are needed
+    after one of its entities was added, removed or had its members changed,
+    which is what happens when its config is reloaded or edited.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the search index."""
+        self.hass = hass
+        self._references: dict[str, dict[str, defaultdict[str, set[str]]]] = {}
+        self._outdated: set[str] = set(_REFERENCES)
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_state_changed_filter,
+            run_immediately=True,
+        )
+
+    @callback
+    def _async_state_changed_filter(self, event_data: EventStateChangedData) -> bool:
+        """Filter state changes that change the references of a domain."""
+        domain = split_entity_id(event_data["entity_id"])[0]
+        if domain not in _REFERENCES or domain in self._outdated:
+            return False
+        old_state = event_data["old_state"]
+        new_state = event_data["new_state"]
+        if old_state is None or new_state is None:
+            return True
+        return (attribute := _MEMBER_ATTRIBUTES.get(domain)) is not None and (
+            old_state.attributes.get(attribute) != new_state.attributes.get(attribute)
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the references of a domain as outdated."""
+        self._outdated.add(split_entity_id(event.data["entity_id"])[0])
+
+    @callback
+    def async_referencing(
+        self, domain: str, reference_type: str, reference_id: str
+    ) -> Iterable[str]:
+        """Return the entities of a domain that reference an item."""
+        if domain in self._outdated:
+            self._async_rebuild(domain)
+        return self._references[domain][reference_type].get(reference_id, ())
+
+    @callback
+    def _async_rebuild(self, domain: str) -> None:
+        """Rebuild the references of a domain."""
+        lookups = _REFERENCES[domain]
+        references: dict[str, defaultdict[str, set[str]]] = {
+            reference_type: defaultdict(set) for reference_type in lookups
+        }
+        for entity_id in self.hass.states.async_entity_ids(domain):
+            for reference_type, lookup in lookups.items():
+                for reference_id in lookup(self.hass, entity_id):
+                    references[reference_type][reference_id].add(entity_id)
+        self._references[domain] = references
+        self._outdated.discard(domain)
+
+
 class Searcher:
     """Find related things.
 
@@ -88,7 +247,9 @@ class Searcher:
         "automation",
         "automation_blueprint",
         "config_entry",
+        "floor",
         "group",
+        "label",
         "scene",
         "script",
         "script_blueprint",
@@ -105,8 +266,10 @@ class Searcher:
     ) -> None:
         """Search results."""
         self.hass = hass
+        self._area_reg = ar.async_get(hass)
         self._device_reg = device_reg
         self._entity_reg = entity_reg
+        self._index = async_get_search_index(hass)
         self._sources = entity_sources
         self.results: defaultdict[str, set[str]] = defaultdict(set)
         self._to_resolve: deque[tuple[str, str]] = deque()
@@ -151,20 +314,36 @@ class Searcher:
         if item_type not in self.DONT_RESOLVE:
             self._to_resolve.append((item_type, item_id))
 
+    @callback
+    def _add_or_resolve_referencing(
+        self, domains: Iterable[str], reference_type: str, reference_id: str
+    ) -> None:
+        """Add the entities of the domains that reference an item."""
+        for domain in domains:
+            for entity_id in self._index.async_referencing(
+                domain, reference_type, reference_id
+            ):
+                self._add_or_resolve("entity", entity_id)
+
     @callback
     def _resolve_area(self, area_id: str) -> None:
         """Resolve an area."""
+        if (area_entry := self._area_reg.async_get_area(area_id)) is not None:
+            if area_entry.floor_id:
+                self._add_or_resolve("floor", area_entry.floor_id)
+
+            for label_id in area_entry.labels:
+                self._add_or_resolve("label", label_id)
+
         for device in dr.async_entries_for_area(self._device_reg, area_id):
             self._add_or_resolve("device", device.id)
 
         for entity_entry in er.async_entries_for_area(self._entity_reg, area_id):
             self._add_or_resolve("entity", entity_entry.entity_id)
 
-        for entity_id in script.scripts_with_area(self.hass, area_id):
-            self._add_or_resolve("entity", entity_id)
-
-        for entity_id in automation.automations_with_area(self.hass, area_id):
-            self._add_or_resolve("entity", entity_id)
+        self._add_or_resolve_referencing(
+            (script.DOMAIN, automation.DOMAIN), "area", area_id
+        )
 
     @callback
     def _resolve_automation(self, automation_entity_id: str) -> None:
@@ -183,6 +362,12 @@ class Searcher:
         for area in automation.areas_in_automation(self.hass, automation_entity_id):
             self._add_or_resolve("area", area)
 
+        for floor in automation.floors_in_automation(self.hass, automation_entity_id):
+            self._add_or_resolve("floor", floor)
+
+        for label in automation.labels_in_automation(self.hass, automation_entity_id):
+            self._add_or_resolve("label", label)
+
         if blueprint := automation.blueprint_in_automation(
             self.hass, automation_entity_id
         ):
@@ -194,8 +379,8 @@ class Searcher:
 
         Will only be called if blueprint is an entry point.
         """
-        for entity_id in automation.automations_with_blueprint(
-            self.hass, blueprint_path
+        for entity_id in self._index.async_referencing(
+            automation.DOMAIN, "blueprint", blueprint_path
         ):
             self._add_or_resolve("automation", entity_id)
 
@@ -224,6 +409,9 @@ class Searcher:
             if device_entry.area_id:
                 self._add_or_resolve("area", device_entry.area_id)
 
+            for label_id in device_entry.labels:
+                self._add_or_resolve("label", label_id)
+
             for config_entry_id in device_entry.config_entries:
                 self._add_or_resolve("config_entry", config_entry_id)
 
@@ -233,31 +421,16 @@ class Searcher:
         for entity_entry in er.async_entries_for_device(self._entity_reg, device_id):
             self._add_or_resolve("entity", entity_entry.entity_id)
 
-        for entity_id in script.scripts_with_device(self.hass, device_id):
-            self._add_or_resolve("entity", entity_id)
-
-        for entity_id in automation.automations_with_device(self.hass, device_id):
-            self._add_or_resolve("entity", entity_id)
+        self._add_or_resolve_referencing(
+            (script.DOMAIN, automation.DOMAIN), "device", device_id
+        )
 
     @callback
     def _resolve_entity(self, entity_id: str) -> None:
         """Resolve an entity."""
         # Extra: Find automations and scripts that reference this entity.
 
-        for entity in scene.scenes_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in group.groups_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in automation.automations_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in script.scripts_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in person.persons_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
+        self._add_or_resolve_referencing(_REFERENCES, "entity", entity_id)
 
         # Find devices
         entity_entry = self._entity_reg.async_get(entity_id)
@@ -265,6 +438,9 @@ class Searcher:
             if entity_entry.device_id:
                 self._add_or_resolve("device", entity_entry.device_id)
 
+            for label_id in entity_entry.labels:
+                self._add_or_resolve("label", label_id)
+
             if entity_entry.config_entry_id is not None:
                 self._add_or_resolve("config_entry", entity_entry.config_entry_id)
         else:
@@ -277,6 +453,19 @@ class Searcher:
         if domain in self.EXIST_AS_ENTITY:
             self._add_or_resolve(domain, entity_id)
 
+    @callback
+    def _resolve_floor(self, floor_id: str) -> None:
+        """Resolve a floor.
+
+        Will only be called if floor is an entry point.
+        """
+        for area_entry in ar.async_entries_for_floor(self._area_reg, floor_id):
+            self._add_or_resolve("area", area_entry.id)
+
+        self._add_or_resolve_referencing(
+            (script.DOMAIN, automation.DOMAIN), "floor", floor_id
+        )
+
     @callback
     def _resolve_group(self, group_entity_id: str) -> None:
         """Resolve a group.
@@ -286,6 +475,25 @@ class Searcher:
         for entity_id in group.get_entity_ids(self.hass, group_entity_id):
             self._add_or_resolve("entity", entity_id)
 
+    @callback
+    def _resolve_label(self, label_id: str) -> None:
+        """Resolve a label.
+
+        Will only be called if label is an entry point.
+        """
+        for area_entry in ar.async_entries_for_label(self._area_reg, label_id):
+            self._add_or_resolve("area", area_entry.id)
+
+        for device_entry in dr.async_entries_for_label(self._device_reg, label_id):
+            self._add_or_resolve("device", device_entry.id)
+
+        for entity_entry in er.async_entries_for_label(self._entity_reg, label_id):
+            self._add_or_resolve("entity", entity_entry.entity_id)
+
+        self._add_or_resolve_referencing(
+            (script.DOMAIN, automation.DOMAIN), "label", label_id
+        )
+
     @callback
     def _resolve_person(self, person_entity_id: str) -> None:
         """Resolve a person.
@@ -319,6 +527,12 @@ class Searcher:
         for area in script.areas_in_script(self.hass, script_entity_id):
             self._add_or_resolve("area", area)
 
+        for floor in script.floors_in_script(self.hass, script_entity_id):
+            self._add_or_resolve("floor", floor)
+
+        for label in script.labels_in_script(self.hass, script_entity_id):
+            self._add_or_resolve("label", label)
+
         if blueprint := script.blueprint_in_script(self.hass, script_entity_id):
             self._add_or_resolve("script_blueprint", blueprint)
 
@@ -328,5 +542,7 @@ class Searcher:
 
         Will only be called if blueprint is an entry point.
         """
-        for entity_id in script.scripts_with_blueprint(self.hass, blueprint_path):
+        for entity_id in self._index.async_referencing(
+            script.DOMAIN, "blueprint", blueprint_path
+        ):
             self._add_or_resolve("script", entity_id)
@@ -0,0 +1,216 @@
+"""Incrementally aggregate sensor states for long term statistics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+import threading
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import EventStateChangedData
+
+from .const import ATTR_STATE_CLASS, DOMAIN, SensorStateClass
+
+# The length of a short term statistics period
+PERIOD_SECONDS = 300
+
+# Compiling statistics may be delayed when the recorder is busy, keep
+# enough periods to still serve them
+MAX_PERIOD_AGE = 3600
+
+_ENTITY_ID_PREFIX = f"{DOMAIN}."
+
+
+@dataclass(slots=True)
+class _Period:
+    """Running min, max and time weighted sum of a sensor during a period."""
+
+    start_value: float | None
+    first_ts: float
+    last_value: float | None
+    last_ts: float
+    min: float
+    max: float
+    accumulated: float = 0.0
+
+
+@dataclass(slots=True)
+class _EntityAggregate:
+    """Aggregated states of a single sensor."""
+
+    tracking_since: float
+    unit: str | None
+    unit_changed_ts: float
+    last_ts: float = 0.0
+    value: float | None = None
+    # Periods which started before this have been dropped
+    pruned_before: float = 0.0
+    periods: dict[float, _Period] = field(default_factory=dict)
+
+
+class StatisticsAggregator:
+    """Aggregate the states of measurement sensors as they change.
+
+    The min, max and time weighted average of each sensor are accumulated
+    per short term statistics period so compiling statistics for a period
+    does not have to fetch and walk the history of every sensor.
+
+    States are added from the event loop while statistics are compiled
+    in the recorder thread. Sensors are tracked by entity_id since the
+    statistics metadata_id of a sensor is only known in the recorder
+    thread, it is looked up when the aggregates are compiled.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._lock = threading.Lock()
+        self._entities: dict[str, _EntityAggregate] = {}
+
+    @callback
+    def async_start(self, hass: HomeAssistant) -> None:
+        """Start aggregating state changes."""
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=_async_sensor_state_changed_filter,
+            run_immediately=True,
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to the aggregates."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        with self._lock:
+            if (
+                new_state is None
+                or new_state.attributes.get(ATTR_STATE_CLASS)
+                != SensorStateClass.MEASUREMENT
+            ):
+                # The recorded history of the sensor is interrupted
+                self._entities.pop(entity_id, None)
+                return
+            updated_ts = new_state.last_updated_timestamp
+            unit = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            if (aggregate := self._entities.get(entity_id)) is None:
+                aggregate = self._entities[entity_id] = _EntityAggregate(
+                    updated_ts, unit, updated_ts
+                )
+            elif updated_ts < aggregate.last_ts:
+                # States are expected in order, start over
+                aggregate = self._entities[entity_id] = _EntityAggregate(
+                    updated_ts, unit, updated_ts
+                )
+            elif aggregate.unit != unit:
+                aggregate.unit = unit
+                aggregate.unit_changed_ts = updated_ts
+            aggregate.last_ts = updated_ts
+            # Statistics are compiled from significant states
+            # which only include changes of the state itself
+            if new_state.last_changed_timestamp != updated_ts:
+                return
+            try:
+                value = float(new_state.state)
+            except (ValueError, TypeError):
+                value = math.nan
+            if not math.isfinite(value):
+                # The history drops states that are not numbers, the last
+                # value counts until the next value in the same period but
+                # the sensor has no value at the start of the next period
+                _get_period(aggregate, updated_ts)
+                aggregate.value = None
+                return
+            _add_value(aggregate, value, updated_ts)
+
+    def aggregate(
+        self, entity_id: str, start_ts: float, end_ts: float
+    ) -> tuple[str | None, float, float, float] | None:
+        """Return the unit, min, max and mean of a sensor during a period.
+
+        Returns None if the period is not a short term statistics period,
+        the states of the sensor during the period are not fully known or
+        the unit of the sensor has changed.
+        """
+        if start_ts % PERIOD_SECONDS or end_ts - start_ts != PERIOD_SECONDS:
+            return None
+        with self._lock:
+            if (
+                (aggregate := self._entities.get(entity_id)) is None
+                or aggregate.tracking_since >= start_ts
+                or aggregate.pruned_before > start_ts
+                or aggregate.unit_changed_ts >= start_ts
+            ):
+                return None
+            if (period := aggregate.periods.get(start_ts)) is None:
+                # The state did not change during the period
+                value = next(
+                    (
+                        later_period.start_value
+                        for period_start, later_period in sorted(
+                            aggregate.periods.items()
+                        )
+                        if period_start > start_ts
+                    ),
+                    aggregate.value,
+                )
+                if value is None:
+                    return None
+                return aggregate.unit, value, value, value
+            if period.last_value is None:
+                return None
+            accumulated = period.accumulated + period.last_value * (
+                end_ts - period.last_ts
+            )
+            if period.start_value is None:
+                start_ts = period.first_ts
+            if (period_seconds := end_ts - start_ts) == 0:
+                mean = 0.0
+            else:
+                mean = accumulated / period_seconds
+            return aggregate.unit, period.min, period.max, mean
+
+
+def _get_period(aggregate: _EntityAggregate, updated_ts: float) -> _Period:
+    """Return the period a state was updated in, starting it if needed."""
+    periods = aggregate.periods
+    period_start = updated_ts - updated_ts % PERIOD_SECONDS
+    if (period := periods.get(period_start)) is None:
+        start_value = aggregate.value
+        period = periods[period_start] = _Period(
+            start_value,
+            updated_ts,
+            start_value,
+            period_start,
+            math.inf if start_value is None else start_value,
+            -math.inf if start_value is None else start_value,
+        )
+        aggregate.pruned_before = period_start - MAX_PERIOD_AGE
+        for old_period_start in [
+            old_period_start
+            for old_period_start in periods
+            if old_period_start < aggregate.pruned_before
+        ]:
+            del periods[old_period_start]
+    return period
+
+
+def _add_value(aggregate: _EntityAggregate, value: float, updated_ts: float) -> None:
+    """Add a value to the period it was updated in."""
+    period = _get_period(aggregate, updated_ts)
+    if period.last_value is None:
+        # The first value of a period which started without one
+        period.first_ts = updated_ts
+    else:
+        period.accumulated += period.last_value * (updated_ts - period.last_ts)
+    period.last_value = value
+    period.last_ts = updated_ts
+    period.min = min(period.min, value)
+    period.max = max(period.max, value)
+    aggregate.value = value
+
+
+@callback
+def _async_sensor_state_changed_filter(event_data: EventStateChangedData) -> bool:
+    """Filter state changes of sensors."""
+    return event_data["entity_id"].startswith(_ENTITY_ID_PREFIX)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from collections.abc import Callable, Iterable, MutableMapping
+from dataclasses import dataclass
 import datetime
 import itertools
 import logging
@@ -30,13 +32,14 @@ from homeassistant.const import (
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.core import HomeAssistant, State, callback, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.loader import async_suggest_report_issue
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
+from .aggregator import StatisticsAggregator
 from .const import (
     ATTR_LAST_RESET,
     ATTR_STATE_CLASS,
@@ -73,6 +76,14 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+DATA_STATISTICS_AGGREGATOR = "sensor_statistics_aggregator"
+DATA_STATISTICS_CATCH_UP = "sensor_statistics_catch_up"
+
+# Missed statistics are compiled from the history of a window of periods
+# loaded at once instead of querying the history of every period
+CATCH_UP_WINDOW = datetime.timedelta(hours=1)
+STATISTICS_PERIOD = datetime.timedelta(minutes=5)
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -356,6 +367,189 @@ def reset_detected(
     return fstate < 0.9 * previous_fstate
 
 
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Start aggregating the states of measurement sensors."""
+    aggregator = hass.data[DATA_STATISTICS_AGGREGATOR] = StatisticsAggregator()
+    aggregator.async_start(hass)
+
+
+def _aggregated_statistics(
+    hass: HomeAssistant,
+    session: Session,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> tuple[
+    dict[str, tuple[str | None, float, float, float]],
+    dict[str, tuple[int, StatisticMetaData]],
+]:
+    """Return the min, max and mean of sensors the aggregator has fully tracked.
+
+    The aggregates are only used when no unit conversion is needed, all
+    other sensors are compiled from their history.
+    """
+    aggregated: dict[str, tuple[str | None, float, float, float]] = {}
+    if (aggregator := hass.data.get(DATA_STATISTICS_AGGREGATOR)) is None:
+        return aggregated, {}
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    for state in sensor_states:
+        entity_id = state.entity_id
+        if "sum" not in wanted_statistics[entity_id] and (
+            aggregate := aggregator.aggregate(entity_id, start_ts, end_ts)
+        ):
+            aggregated[entity_id] = aggregate
+    if not aggregated:
+        return aggregated, {}
+    # The aggregator tracks sensors by entity_id since their statistics
+    # metadata_id is only known in the recorder thread, once statistics
+    # have been compiled. The ids are resolved once per compiled period.
+    old_metadatas = statistics.get_metadata_with_session(
+        get_instance(hass), session, statistic_ids=set(aggregated)
+    )
+    for entity_id, (statistics_unit, *_) in list(aggregated.items()):
+        if (
+            (old_metadata := old_metadatas.get(entity_id))
+            and (old_unit := old_metadata[1]["unit_of_measurement"]) != statistics_unit
+            and old_unit in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER
+        ):
+            del aggregated[entity_id]
+            del old_metadatas[entity_id]
+    return aggregated, old_metadatas
+
+
+@dataclass(slots=True)
+class _CatchUpHistory:
+    """History of sensors during a window of missed statistics periods."""
+
+    start: datetime.datetime
+    end: datetime.datetime
+    entity_ids: set[str]
+    states: MutableMapping[str, list[State]]
+    timestamps: dict[str, list[float]]
+
+    def period_history(
+        self,
+        entity_ids: list[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+        significant_changes_only: bool,
+    ) -> MutableMapping[str, list[State]]:
+        """Return the states of a period as a history query of the period would."""
+        if not self.states:
+            return {}
+        query_start_ts = (start - datetime.timedelta.resolution).timestamp()
+        end_ts = end.timestamp()
+        history_list: dict[str, list[State]] = {}
+        for entity_id in entity_ids:
+            states = self.states[entity_id]
+            timestamps = self.timestamps[entity_id]
+            # The state at the start of the period is the last one before
+            # it, the state at the start of the window has the start time
+            first_idx = bisect_right(timestamps, query_start_ts)
+            end_idx = bisect_left(timestamps, end_ts, first_idx)
+            entity_history = states[first_idx - 1 : first_idx] if first_idx else []
+            if significant_changes_only:
+                entity_history.extend(
+                    state
+                    for state in states[first_idx:end_idx]
+                    if state.last_changed == state.last_updated
+                )
+            else:
+                entity_history.extend(states[first_idx:end_idx])
+            history_list[entity_id] = entity_history
+        return history_list
+
+
+def _get_catch_up_history(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entity_ids: list[str],
+    significant_changes_only: bool,
+) -> _CatchUpHistory | None:
+    """Return the history of a window of missed periods which includes start-end.
+
+    Returns None if no periods after this one can be compiled yet, or a
+    recorder run started during the window since the state at the start of
+    a period is looked up in the run of the period.
+    """
+    catch_ups: dict[bool, _CatchUpHistory] = hass.data.setdefault(
+        DATA_STATISTICS_CATCH_UP, {}
+    )
+    if (
+        (catch_up := catch_ups.get(significant_changes_only)) is not None
+        and catch_up.start <= start
+        and end <= catch_up.end
+        and catch_up.entity_ids.issuperset(entity_ids)
+    ):
+        return catch_up
+    catch_ups.pop(significant_changes_only, None)
+    # The states of the latest period may still be waiting to be recorded
+    now = dt_util.utcnow()
+    last_period_end = now.replace(
+        minute=now.minute - now.minute % 5, second=0, microsecond=0
+    )
+    window_end = min(start + CATCH_UP_WINDOW, last_period_end - STATISTICS_PERIOD)
+    if window_end <= end:
+        return None
+    query_start = start - datetime.timedelta.resolution
+    recorder_runs_manager = get_instance(hass).recorder_runs_manager
+    if (
+        (run := recorder_runs_manager.get(query_start)) is None
+        or (window_run := recorder_runs_manager.get(window_end)) is None
+        or run.start != window_run.start
+    ):
+        return None
+    # All states are loaded, the significant states of a period
+    # are filtered when the period is sliced from the window
+    states = history.get_full_significant_states_with_session(
+        hass,
+        session,
+        query_start,
+        window_end,
+        entity_ids=entity_ids,
+        significant_changes_only=False,
+    )
+    catch_up = catch_ups[significant_changes_only] = _CatchUpHistory(
+        start,
+        window_end,
+        set(entity_ids),
+        states,
+        {
+            entity_id: [state.last_updated_timestamp for state in entity_states]
+            for entity_id, entity_states in states.items()
+        },
+    )
+    return catch_up
+
+
+def _get_period_history(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entity_ids: list[str],
+    significant_changes_only: bool,
+) -> MutableMapping[str, list[State]]:
+    """Return the history of sensors during a statistics period."""
+    if catch_up := _get_catch_up_history(
+        hass, session, start, end, entity_ids, significant_changes_only
+    ):
+        return catch_up.period_history(entity_ids, start, end, significant_changes_only)
+    return history.get_full_significant_states_with_session(
+        hass,
+        session,
+        start - datetime.timedelta.resolution,
+        end,
+        entity_ids=entity_ids,
+        significant_changes_only=significant_changes_only,
+    )
+
+
 def _wanted_statistics(sensor_states: list[State]) -> dict[str, set[str]]:
     """Prepare a dict with wanted statistics for entities."""
     return {
@@ -398,38 +592,34 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    aggregated, aggregated_metadatas = _aggregated_statistics(
+        hass, session, sensor_states, wanted_statistics, start, end
+    )
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
     history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list = _get_period_history(
+            hass, session, start, end, entities_full_history, False
         )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
+        if "sum" not in wanted_statistics[i.entity_id] and i.entity_id not in aggregated
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        _history_list = _get_period_history(
+            hass, session, start, end, entities_significant_history, True
         )
         history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in aggregated:
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -445,10 +635,16 @@ def compile_statistics(  # noqa: C901
     old_metadatas = statistics.get_metadata_with_session(
         get_instance(hass), session, statistic_ids=set(entities_with_float_states)
     )
+    old_metadatas.update(aggregated_metadatas)
     to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if aggregate := aggregated.get(entity_id):
+            to_process.append(
+                (entity_id, aggregate[0], _state.attributes[ATTR_STATE_CLASS], [])
+            )
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -510,6 +706,10 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if aggregate := aggregated.get(entity_id):
+            _, stat["min"], stat["max"], stat["mean"] = aggregate
+            result.append({"meta": meta, "stat": stat})
+            continue
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(*itertools.islice(zip(*valid_float_states), 1))
         if "min" in wanted_statistics[entity_id]:
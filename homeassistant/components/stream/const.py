@@ -36,6 +36,7 @@ MAX_TIMESTAMP_GAP = 30  # seconds - anything from 10 to 50000 is probably reason
 
 MAX_MISSING_DTS = 6  # Number of packets missing DTS to allow
 SOURCE_TIMEOUT = 30  # Timeout for reading stream source
+MAX_KEYFRAME_IMAGES = 8  # Sizes of the image of the last keyframe to keep
 
 STREAM_RESTART_INCREMENT = 10  # Increase wait_timeout by this amount each retry
 STREAM_RESTART_RESET_TIME = 300  # Reset wait_timeout after this many seconds
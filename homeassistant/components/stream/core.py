@@ -22,16 +22,18 @@ from homeassistant.util.decorator import Registry
 from .const import (
     ATTR_STREAMS,
     DOMAIN,
+    MAX_KEYFRAME_IMAGES,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
     from . import Stream
+    from .diagnostics import Diagnostics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -77,8 +79,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view of the segment data once it is complete
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +104,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Data of all parts, set when the segment is complete
+    _data: bytes | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -135,11 +139,29 @@ class Segment:
         """
         self.parts.append(part)
         self.duration = duration
+        if self.complete:
+            self._pack_parts()
         for output in self._stream_outputs:
             output.part_put()
 
+    def _pack_parts(self) -> None:
+        """Keep the data of the parts in one buffer shared with the parts.
+
+        The parts become views of the buffer, so the data is only held once
+        and the segment is served without joining its parts on every request.
+        """
+        self._data = b"".join([part.data for part in self.parts])
+        view = memoryview(self._data)
+        start = 0
+        for part in self.parts:
+            end = start + len(part.data)
+            part.data = view[start:end]
+            start = end
+
     def get_data(self) -> bytes:
         """Return reconstructed data for all parts as bytes, without init."""
+        if self._data is not None:
+            return self._data
         return b"".join([part.data for part in self.parts])
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
@@ -423,10 +445,16 @@ class KeyFrameConverter:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
         get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
+        _generate_image will decode the packet into the frame of the keyframe
         _generate_image will clear the packet, so there will only be one attempt per packet
+        _generate_image will encode the frame at the requested size
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+
+    The images encoded from the current frame are kept per size and
+    orientation, so requests for the same keyframe share one decode and one
+    encode. Requests are handled one at a time, so requests arriving while
+    the keyframe is converted are answered from the images kept.
     """
 
     def __init__(
@@ -434,6 +462,7 @@ class KeyFrameConverter:
         hass: HomeAssistant,
         stream_settings: StreamSettings,
         dynamic_stream_settings: DynamicStreamSettings,
+        diagnostics: Diagnostics,
     ) -> None:
         """Initialize."""
 
@@ -446,11 +475,15 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        # Images encoded from the frame by size and orientation
+        self._images: dict[tuple[int | None, int | None, int], bytes] = {}
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
         self._stream_settings = stream_settings
         self._dynamic_stream_settings = dynamic_stream_settings
+        self._diagnostics = diagnostics
 
     def stash_keyframe_packet(self, packet: Packet) -> None:
         """Store the keyframe and set the asyncio.Event from the event loop.
@@ -484,18 +517,22 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
-        """Generate the keyframe image.
-
-        This is run in an executor thread, but since it is called within an
-        the asyncio lock from the main thread, there will only be one entry
-        at a time per instance.
-        """
-
-        if not (self._turbojpeg and self._packet and self._codec_context):
+    def _image_key(
+        self, width: int | None, height: int | None
+    ) -> tuple[int | None, int | None, int]:
+        """Return the key of the image of the frame at a size."""
+        orientation = self._dynamic_stream_settings.orientation
+        if width and height:
+            return (width, height, orientation)
+        return (None, None, orientation)
+
+    def _decode_packet(self) -> None:
+        """Decode the stashed keyframe packet into the frame."""
+        if not (self._packet and self._codec_context):
             return
         packet = self._packet
         self._packet = None
+        self._diagnostics.increment("keyframe_decode")
         for _ in range(2):  # Retry once if codec context needs to be flushed
             try:
                 # decode packet (flush afterwards)
@@ -513,7 +550,24 @@ class KeyFrameConverter:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
-            frame = frames[0]
+            self._frame = frames[0]
+            self._images.clear()
+
+    def _generate_image(self, width: int | None, height: int | None) -> None:
+        """Generate the keyframe image.
+
+        This is run in an executor thread, but since it is called within an
+        the asyncio lock from the main thread, there will only be one entry
+        at a time per instance.
+        """
+
+        if not self._turbojpeg:
+            return
+        self._decode_packet()
+        if (frame := self._frame) is None:
+            return
+        key = self._image_key(width, height)
+        if (image := self._images.get(key)) is None:
             if width and height:
                 if self._dynamic_stream_settings.orientation >= 5:
                     frame = frame.reformat(width=height, height=width)
@@ -523,7 +577,11 @@ class KeyFrameConverter:
                 frame.to_ndarray(format="bgr24"),
                 self._dynamic_stream_settings.orientation,
             )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            image = bytes(self._turbojpeg.encode(bgr_array))
+            if len(self._images) >= MAX_KEYFRAME_IMAGES:
+                del self._images[next(iter(self._images))]
+            self._images[key] = image
+        self._image = image
 
     async def async_get_image(
         self,
@@ -538,5 +596,12 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
+            if self._packet is None and (
+                image := self._images.get(self._image_key(width, height))
+            ):
+                # Nothing new to decode and the image was already encoded
+                self._diagnostics.increment("keyframe_image_reused")
+                self._image = image
+                return image
             await self._hass.async_add_executor_job(self._generate_image, width, height)
         return self._image
@@ -48,6 +48,7 @@ from homeassistant.helpers.json import (
     json_bytes,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.storage import async_get_write_stats
 from homeassistant.loader import (
     Integration,
     IntegrationNotFound,
@@ -61,8 +62,10 @@ from homeassistant.util.json import format_unserializable_data
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_result_message
+from .snapshot import StatesSnapshot
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+DATA_STATES_SNAPSHOT = "websocket_api_states_snapshot"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +87,7 @@ def async_register_commands(
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
+    async_reg(hass, handle_storage_write_stats)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
@@ -303,6 +307,15 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+@callback
+def _async_get_states_snapshot(hass: HomeAssistant) -> StatesSnapshot:
+    """Return the shared states snapshot, setting it up on first use."""
+    if (snapshot := hass.data.get(DATA_STATES_SNAPSHOT)) is None:
+        snapshot = hass.data[DATA_STATES_SNAPSHOT] = StatesSnapshot(hass)
+        snapshot.async_setup()
+    return cast(StatesSnapshot, snapshot)
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
@@ -366,6 +379,7 @@ def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
     entity_ids: set[str],
     user: User,
+    snapshot: StatesSnapshot,
     msg_id: int,
     event: Event[EventStateChangedData],
 ) -> None:
@@ -375,12 +389,7 @@ def _forward_entity_changes(
         return
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
+    if not snapshot.async_can_read(user, entity_id):
         return
     send_message(messages.cached_state_diff_message(msg_id, event))
 
@@ -400,7 +409,7 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    snapshot = _async_get_states_snapshot(hass)
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         partial(
@@ -408,6 +417,7 @@ def handle_subscribe_entities(
             connection.send_message,
             entity_ids,
             connection.user,
+            snapshot,
             msg["id"],
         ),
         run_immediately=True,
@@ -418,17 +428,23 @@ def handle_subscribe_entities(
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
     try:
-        serialized_states = [
-            state.as_compressed_state_json
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
-        ]
+        if entity_ids:
+            states_json = b",".join(
+                state.as_compressed_state_json
+                for state in _async_get_allowed_states(hass, connection)
+                if state.entity_id in entity_ids
+            )
+        else:
+            # The serialized states are shared by all connections
+            # until the next state change
+            states_json = snapshot.async_states_json(connection.user)
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+        _send_handle_entities_init_response(connection, msg["id"], states_json)
         return
 
+    states = _async_get_allowed_states(hass, connection)
     serialized_states = []
     for state in states:
         try:
@@ -441,11 +457,13 @@ def handle_subscribe_entities(
                 ),
             )
 
-    _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+    _send_handle_entities_init_response(
+        connection, msg["id"], b",".join(serialized_states)
+    )
 
 
 def _send_handle_entities_init_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
+    connection: ActiveConnection, msg_id: int, states_json: bytes
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
@@ -454,7 +472,7 @@ def _send_handle_entities_init_response(
                 b'{"id":',
                 str(msg_id).encode(),
                 b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
+                states_json,
                 b"}}}",
             )
         )
@@ -548,6 +566,16 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "storage/write_stats"})
+def handle_storage_write_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle storage write stats command."""
+    connection.send_result(msg["id"], async_get_write_stats(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -0,0 +1,133 @@
+"""Shared snapshot of the serialized states sent to entity subscribers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from homeassistant.auth import EVENT_USER_REMOVED, EVENT_USER_UPDATED
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+
+
+@dataclass(slots=True)
+class _Partition:
+    """Serialized states and read permissions shared by users with the same groups."""
+
+    permissions: AbstractPermissions
+    states_json: bytes | None = None
+    allowed: dict[str, bool] = field(default_factory=dict)
+
+
+class StatesSnapshot:
+    """Serialize the compressed states once and share them between connections.
+
+    The joined compressed states are built on first use after a state
+    change and reused by every connection that subscribes until the next
+    change. Users without access to all entities are partitioned by their
+    groups, since their permissions are derived from the group policies,
+    and each partition caches its own states and entity read checks. A
+    partition is replaced if the permissions of a user no longer match it,
+    and all partitions are dropped when the entity, device or user
+    registries change since the checks may no longer hold.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self._hass = hass
+        self._states_json: bytes | None = None
+        self._partitions: dict[tuple[str, ...], _Partition] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for changes that invalidate the snapshot."""
+        bus = self._hass.bus
+        bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+        for event_type in (
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            EVENT_DEVICE_REGISTRY_UPDATED,
+            EVENT_USER_UPDATED,
+            EVENT_USER_REMOVED,
+        ):
+            bus.async_listen(
+                event_type, self._async_registry_updated, run_immediately=True
+            )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Invalidate the serialized states."""
+        self._states_json = None
+        removed = event.data["new_state"] is None
+        for partition in self._partitions.values():
+            partition.states_json = None
+            if removed:
+                partition.allowed.pop(event.data["entity_id"], None)
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Drop the partitions as entity permissions may have changed."""
+        self._partitions.clear()
+
+    @callback
+    def _async_get_partition(self, user: User) -> _Partition | None:
+        """Return the partition of a user, or None if the user can read all."""
+        if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+            return None
+        permissions = user.permissions
+        key = tuple(group.id for group in user.groups)
+        if (partition := self._partitions.get(key)) is None or (
+            partition.permissions is not permissions
+            and partition.permissions != permissions
+        ):
+            partition = self._partitions[key] = _Partition(permissions)
+        return partition
+
+    @callback
+    def async_states_json(self, user: User) -> bytes:
+        """Return the compressed states the user can read as joined JSON members.
+
+        Raises ValueError or TypeError if a state cannot be serialized.
+        """
+        if (partition := self._async_get_partition(user)) is None:
+            if (states_json := self._states_json) is None:
+                states_json = self._states_json = b",".join(
+                    state.as_compressed_state_json
+                    for state in self._hass.states.async_all()
+                )
+            return states_json
+        if (states_json := partition.states_json) is None:
+            can_read = self._async_can_read
+            states_json = partition.states_json = b",".join(
+                state.as_compressed_state_json
+                for state in self._hass.states.async_all()
+                if can_read(user, partition, state.entity_id)
+            )
+        return states_json
+
+    @callback
+    def async_can_read(self, user: User, entity_id: str) -> bool:
+        """Return if the user can read the state of an entity."""
+        if (partition := self._async_get_partition(user)) is None:
+            return True
+        return self._async_can_read(user, partition, entity_id)
+
+    @callback
+    def _async_can_read(
+        self, user: User, partition: _Partition, entity_id: str
+    ) -> bool:
+        """Return if the user can read an entity, caching the result.
+
+        The result is not cached for removed entities, so the cache only
+        holds entities in the state machine.
+        """
+        if (allowed := partition.allowed.get(entity_id)) is None:
+            allowed = user.permissions.check_entity(entity_id, POLICY_READ)
+            if self._hass.states.get(entity_id) is not None:
+                partition.allowed[entity_id] = allowed
+        return allowed
@@ -11,6 +11,7 @@ from collections import UserDict, defaultdict
 from collections.abc import (
     Callable,
     Collection,
+    Container,
     Coroutine,
     Iterable,
     KeysView,
@@ -377,7 +378,7 @@ class HomeAssistant:
     http: HomeAssistantHTTP = None  # type: ignore[assignment]
     config_entries: ConfigEntries = None  # type: ignore[assignment]
 
-    def __new__(cls, config_dir: str) -> HomeAssistant:
+    def __new__(cls, config_dir: str, import_workers: int = 1) -> HomeAssistant:
         """Set the _hass thread local data."""
         hass = super().__new__(cls)
         _hass.hass = hass
@@ -387,7 +388,7 @@ class HomeAssistant:
         """Return the representation."""
         return f"<HomeAssistant {self.state}>"
 
-    def __init__(self, config_dir: str) -> None:
+    def __init__(self, config_dir: str, import_workers: int = 1) -> None:
         """Initialize new Home Assistant object."""
         # pylint: disable-next=import-outside-toplevel
         from . import loader
@@ -412,7 +413,7 @@ class HomeAssistant:
         self._stop_future: concurrent.futures.Future[None] | None = None
         self._shutdown_jobs: list[HassJobWithArgs] = []
         self.import_executor = InterruptibleThreadPoolExecutor(
-            max_workers=1, thread_name_prefix="ImportExecutor"
+            max_workers=import_workers, thread_name_prefix="ImportExecutor"
         )
 
     @property
@@ -1306,13 +1307,37 @@ def _event_repr(
     return f"<Event {event_type}[{str(origin)[0]}]>"
 
 
+@dataclass(slots=True, frozen=True)
+class _KeyedEventFilter:
+    """Filter events by looking up a key of the event data in an index."""
+
+    key: str
+    index: Container[Any]
+
+
 _FilterableJobType = tuple[
+    HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],  # job
+    Callable[[_DataT], bool] | _KeyedEventFilter | None,  # event_filter
+    bool,  # run_immediately
+]
+
+
+_DispatchJobType = tuple[
     HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],  # job
     Callable[[_DataT], bool] | None,  # event_filter
+    _KeyedEventFilter | None,  # keyed_filter
     bool,  # run_immediately
 ]
 
 
+def _dispatch_job(filterable_job: _FilterableJobType[Any]) -> _DispatchJobType[Any]:
+    """Convert a filterable job to a job in a dispatch tuple."""
+    job, event_filter, run_immediately = filterable_job
+    if isinstance(event_filter, _KeyedEventFilter):
+        return (job, None, event_filter, run_immediately)
+    return (job, event_filter, None, run_immediately)
+
+
 @dataclass(slots=True)
 class _OneTimeListener:
     hass: HomeAssistant
@@ -1344,13 +1369,25 @@ EMPTY_LIST: list[Any] = []
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_dispatch",
+        "_hass",
+        "_listeners",
+        "_match_all_dispatch",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType[Any]]] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Immutable tuples of the jobs to run for each event type, rebuilt
+        # when listeners are added or removed so firing an event does not
+        # have to merge the listener lists.
+        self._dispatch: dict[str, tuple[_DispatchJobType[Any], ...]] = {}
+        self._match_all_dispatch: tuple[_DispatchJobType[Any], ...] = ()
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(
@@ -1425,23 +1462,23 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
-        if event_type == EVENT_STATE_CHANGED:
-            aliased_listeners = self._listeners.get(EVENT_STATE_REPORTED, EMPTY_LIST)
-        else:
-            aliased_listeners = EMPTY_LIST
-        listeners = listeners + match_all_listeners + aliased_listeners
+        if (listeners := self._dispatch.get(event_type)) is None:
+            if event_type in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+                return
+            listeners = self._match_all_dispatch
         if not listeners:
             return
 
         event: Event | None = None
 
-        for job, event_filter, run_immediately in listeners:
-            if event_filter is not None:
+        for job, event_filter, keyed_filter, run_immediately in listeners:
+            if keyed_filter is not None:
+                if (
+                    event_data is None
+                    or event_data.get(keyed_filter.key) not in keyed_filter.index
+                ):
+                    continue
+            elif event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
                         continue
@@ -1529,15 +1566,86 @@ class EventBus:
             ),
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        key: str,
+        index: Container[Any],
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type where a key of the data is indexed.
+
+        The listener only runs when the value of key in the event data is
+        in index. This is equivalent to an event_filter that checks
+        ``event_data.get(key) in index``, but the bus does the lookup
+        inline which is much faster for high volume events such as
+        state_changed. The index is not copied so it can be updated by
+        the caller after the listener is added.
+
+        This method must be run in the event loop.
+        """
+        if event_type == EVENT_STATE_REPORTED and not run_immediately:
+            raise HomeAssistantError(
+                f"Run immediately must be set to True for event {event_type}"
+            )
+        return self._async_listen_filterable_job(
+            event_type,
+            (
+                HassJob(listener, f"listen {event_type}"),
+                _KeyedEventFilter(key, index),
+                run_immediately,
+            ),
+        )
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType[Any]
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_update_dispatch(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def _async_update_dispatch(self, event_type: str) -> None:
+        """Rebuild the dispatch tuples affected by listeners of event_type."""
+        if event_type == MATCH_ALL:
+            self._match_all_dispatch = tuple(
+                _dispatch_job(filterable_job)
+                for filterable_job in self._match_all_listeners
+            )
+            affected_event_types: Iterable[str] = list(self._dispatch)
+        elif event_type == EVENT_STATE_REPORTED:
+            affected_event_types = (EVENT_STATE_REPORTED, EVENT_STATE_CHANGED)
+        else:
+            affected_event_types = (event_type,)
+        listeners = self._listeners
+        for affected_event_type in affected_event_types:
+            if affected_event_type in listeners or (
+                affected_event_type == EVENT_STATE_CHANGED
+                and EVENT_STATE_REPORTED in listeners
+            ):
+                self._dispatch[affected_event_type] = self._build_dispatch(
+                    affected_event_type
+                )
+            else:
+                self._dispatch.pop(affected_event_type, None)
+
+    @callback
+    def _build_dispatch(self, event_type: str) -> tuple[_DispatchJobType[Any], ...]:
+        """Build the dispatch tuple for an event type with listeners."""
+        listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            listeners = listeners + self._match_all_listeners
+        if event_type == EVENT_STATE_CHANGED:
+            listeners = listeners + self._listeners.get(
+                EVENT_STATE_REPORTED, EMPTY_LIST
+            )
+        return tuple(_dispatch_job(filterable_job) for filterable_job in listeners)
+
     def listen_once(
         self,
         event_type: str,
@@ -1612,6 +1720,8 @@ class EventBus:
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+        self._async_update_dispatch(event_type)
 
 
 class CompressedState(TypedDict):
@@ -14,6 +14,7 @@ from collections import UserDict
 from collections.abc import Callable, Iterable, KeysView, Mapping, ValuesView
 from datetime import datetime, timedelta
 from enum import StrEnum
+from functools import cached_property
 import logging
 import time
 from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict, TypeVar, cast
@@ -21,7 +22,6 @@ from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict, TypeVar,
 import attr
 import voluptuous as vol
 
-from homeassistant.backports.functools import cached_property
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
@@ -145,18 +145,26 @@ DISPLAY_DICT_OPTIONAL = (
 )
 
 
+# Most entries have no options, they share a single read only dict
+_EMPTY_ENTITY_OPTIONS: ReadOnlyEntityOptionsType = ReadOnlyDict({})
+
+
 def _protect_entity_options(
     data: EntityOptionsType | None,
 ) -> ReadOnlyEntityOptionsType:
     """Protect entity options from being modified."""
-    if data is None:
-        return ReadOnlyDict({})
+    if not data:
+        return _EMPTY_ENTITY_OPTIONS
     return ReadOnlyDict({key: ReadOnlyDict(val) for key, val in data.items()})
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class RegistryEntry:
-    """Entity Registry Entry."""
+    """Entity Registry Entry.
+
+    Entries are slotted as large registries keep tens of thousands of them,
+    attrs stores the cached properties of slotted classes in slots too.
+    """
 
     entity_id: str = attr.ib()
     unique_id: str = attr.ib()
@@ -514,11 +522,14 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains four additional indexes:
+    Maintains seven additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> list[key]
     - device_id -> list[key]
+    - area_id -> list[key]
+    - label -> list[key]
+    - platform -> list[key]
     """
 
     def __init__(self) -> None:
@@ -529,6 +540,8 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
         self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
         self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._labels_index: dict[str, dict[str, Literal[True]]] = {}
+        self._platform_index: dict[str, dict[str, Literal[True]]] = {}
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -550,6 +563,9 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
             self._device_id_index.setdefault(device_id, {})[key] = True
         if (area_id := entry.area_id) is not None:
             self._area_id_index.setdefault(area_id, {})[key] = True
+        for label in entry.labels:
+            self._labels_index.setdefault(label, {})[key] = True
+        self._platform_index.setdefault(entry.platform, {})[key] = True
 
     def _unindex_entry_value(
         self, key: str, value: str, index: dict[str, dict[str, Literal[True]]]
@@ -576,6 +592,9 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
             self._unindex_entry_value(key, device_id, self._device_id_index)
         if area_id := entry.area_id:
             self._unindex_entry_value(key, area_id, self._area_id_index)
+        for label in entry.labels:
+            self._unindex_entry_value(key, label, self._labels_index)
+        self._unindex_entry_value(key, entry.platform, self._platform_index)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
@@ -619,6 +638,16 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         data = self.data
         return [data[key] for key in self._area_id_index.get(area_id, ())]
 
+    def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
+        """Get entries for label."""
+        data = self.data
+        return [data[key] for key in self._labels_index.get(label, ())]
+
+    def get_entries_for_platform(self, platform: str) -> list[RegistryEntry]:
+        """Get entries for platform."""
+        data = self.data
+        return [data[key] for key in self._platform_index.get(platform, ())]
+
 
 class EntityRegistry(BaseRegistry):
     """Class to hold a registry of entities."""
@@ -1284,11 +1313,10 @@ class EntityRegistry(BaseRegistry):
     @callback
     def async_clear_label_id(self, label_id: str) -> None:
         """Clear label from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if label_id in entry.labels:
-                labels = entry.labels.copy()
-                labels.remove(label_id)
-                self.async_update_entity(entity_id, labels=labels)
+        for entry in self.entities.get_entries_for_label(label_id):
+            labels = entry.labels.copy()
+            labels.remove(label_id)
+            self.async_update_entity(entry.entity_id, labels=labels)
 
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
@@ -1367,7 +1395,15 @@ def async_entries_for_label(
     registry: EntityRegistry, label_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a label."""
-    return [entry for entry in registry.entities.values() if label_id in entry.labels]
+    return registry.entities.get_entries_for_label(label_id)
+
+
+@callback
+def async_entries_for_platform(
+    registry: EntityRegistry, platform: str
+) -> list[RegistryEntry]:
+    """Return entries that match a platform."""
+    return registry.entities.get_entries_for_platform(platform)
 
 
 @callback
@@ -73,12 +73,17 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+TRACK_TEMPLATE_RENDER_SCHEDULER = "track_template_render_scheduler"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
 
 _LOGGER = logging.getLogger(__name__)
 
+# Types of the template variables a render can be shared for
+_SHAREABLE_TYPES = {str, int, float, bool, type(None)}
+
 # Used to spread async_track_utc_time_change listeners and DataUpdateCoordinator
 # refresh cycles between RANDOM_MICROSECOND_MIN..RANDOM_MICROSECOND_MAX.
 # The values have been determined experimentally in production testing, background
@@ -105,15 +110,22 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         None,
     ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
+    filter_callable: (
+        Callable[
+            [
+                HomeAssistant,
+                dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+                _TypedDictT,
+            ],
+            bool,
+        ]
+        | None
+    )
     run_immediately: bool
+    # When set, events are routed by looking up this key of the event
+    # data in the callbacks on the event bus instead of calling
+    # the filter_callable
+    key: str | None = None
 
 
 @dataclass(slots=True)
@@ -144,6 +156,24 @@ class TrackTemplate:
     rate_limit: float | None = None
 
 
+@dataclass(slots=True)
+class TemplateRenderStats:
+    """Class for render statistics of a tracked template.
+
+    renders
+        The number of times the template was rendered.
+    shared_renders
+        The number of times the result of a render with the same
+        variables for the same state change was reused.
+    cpu_time
+        The CPU time in seconds spent rendering the template.
+    """
+
+    renders: int = 0
+    shared_renders: int = 0
+    cpu_time: float = 0.0
+
+
 @dataclass(slots=True)
 class TrackTemplateResult:
     """Class for result of template tracking.
@@ -337,23 +367,14 @@ def _async_dispatch_entity_id_event(
             )
 
 
-@callback
-def _async_state_change_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     listeners_key=TRACK_STATE_CHANGE_LISTENER,
     callbacks_key=TRACK_STATE_CHANGE_CALLBACKS,
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_change_filter,
+    filter_callable=None,
     run_immediately=False,
+    key="entity_id",
 )
 
 
@@ -427,12 +448,22 @@ def _async_track_event(
     listeners_key = tracker.listeners_key
 
     if listeners_key not in hass_data:
-        hass_data[listeners_key] = hass.bus.async_listen(
-            tracker.event_type,
-            ft.partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=ft.partial(tracker.filter_callable, hass, callbacks),
-            run_immediately=tracker.run_immediately,
-        )
+        if tracker.key is not None:
+            hass_data[listeners_key] = hass.bus.async_listen_keyed(
+                tracker.event_type,
+                ft.partial(tracker.dispatcher_callable, hass, callbacks),
+                tracker.key,
+                callbacks,
+                run_immediately=tracker.run_immediately,
+            )
+        else:
+            assert tracker.filter_callable is not None
+            hass_data[listeners_key] = hass.bus.async_listen(
+                tracker.event_type,
+                ft.partial(tracker.dispatcher_callable, hass, callbacks),
+                event_filter=ft.partial(tracker.filter_callable, hass, callbacks),
+                run_immediately=tracker.run_immediately,
+            )
 
     job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
 
@@ -508,16 +539,6 @@ def async_track_entity_registry_updated_event(
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
 @callback
 def _async_dispatch_device_id_event(
     hass: HomeAssistant,
@@ -543,8 +564,9 @@ _KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
     callbacks_key=TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS,
     event_type=EVENT_DEVICE_REGISTRY_UPDATED,
     dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+    filter_callable=None,
     run_immediately=True,
+    key="device_id",
 )
 
 
@@ -929,6 +951,125 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRenderScheduler:
+    """Render tracked templates and share the results between trackers.
+
+    Trackers that re-render the same template with the same variables for
+    the same state change share a single render. The shared renders are
+    discarded whenever any state changes so a result is never reused after
+    the states it was rendered from have changed.
+
+    Render counts and CPU time are collected for every tracked template.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.stats: dict[str, TemplateRenderStats] = {}
+        self._trackers: dict[str, int] = {}
+        self._event: Event[EventStateChangedData] | None = None
+        self._renders: dict[tuple[Any, ...], RenderInfo] = {}
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Discard the shared renders."""
+        self._event = None
+        self._renders.clear()
+
+    @callback
+    def async_track(self, track_templates: Iterable[TrackTemplate]) -> None:
+        """Start collecting statistics for templates."""
+        for track_template_ in track_templates:
+            template_str = track_template_.template.template
+            self._trackers[template_str] = self._trackers.get(template_str, 0) + 1
+            if template_str not in self.stats:
+                self.stats[template_str] = TemplateRenderStats()
+
+    @callback
+    def async_untrack(self, track_templates: Iterable[TrackTemplate]) -> None:
+        """Stop collecting statistics for templates no longer tracked."""
+        for track_template_ in track_templates:
+            template_str = track_template_.template.template
+            if (trackers := self._trackers[template_str] - 1) == 0:
+                del self._trackers[template_str]
+                del self.stats[template_str]
+            else:
+                self._trackers[template_str] = trackers
+
+    @callback
+    def async_render_to_info(
+        self,
+        template: Template,
+        variables: TemplateVarsType,
+        event: Event[EventStateChangedData] | None,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+    ) -> RenderInfo:
+        """Render a template, sharing the render for the same state change."""
+        stats = self.stats.get(template.template)
+        key: tuple[Any, ...] | None = None
+        if event is not None and (variables_key := _variables_key(variables)):
+            # pylint: disable=protected-access
+            key = (
+                template.template,
+                template._limited,
+                template._strict,
+                template._log_fn,
+                *variables_key,
+            )
+            if event is not self._event:
+                self._event = event
+                self._renders.clear()
+            elif (shared := self._renders.get(key)) is not None:
+                if stats is not None:
+                    stats.shared_renders += 1
+                info = copy.copy(shared)
+                info.template = template
+                return info
+
+        start = time.thread_time()
+        info = template.async_render_to_info(variables, strict=strict, log_fn=log_fn)
+        if stats is not None:
+            stats.renders += 1
+            stats.cpu_time += time.thread_time() - start
+        if key is not None:
+            self._renders[key] = info
+        return info
+
+
+def _variables_key(variables: TemplateVarsType) -> tuple[Any, ...] | None:
+    """Return a hashable key of the variables or None if they cannot be shared."""
+    if not variables:
+        return (None,)
+    # The type is part of the key since 1, 1.0 and True are equal but don't
+    # render the same. Containers are not shared as they could hold them.
+    if any(type(value) not in _SHAREABLE_TYPES for value in variables.values()):
+        return None
+    return (frozenset((name, type(value), value) for name, value in variables.items()),)
+
+
+@callback
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    if (scheduler := hass.data.get(TRACK_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[
+            TRACK_TEMPLATE_RENDER_SCHEDULER
+        ] = _TemplateRenderScheduler(hass)
+    return scheduler
+
+
+@callback
+def async_get_template_render_stats(
+    hass: HomeAssistant,
+) -> dict[str, TemplateRenderStats]:
+    """Return the render statistics of the tracked templates by template."""
+    return _async_get_template_render_scheduler(hass).stats
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -951,6 +1092,7 @@ class TrackTemplateResultInfo:
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._scheduler = _async_get_template_render_scheduler(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -967,13 +1109,14 @@ class TrackTemplateResultInfo:
         """Activation of template tracking."""
         block_render = False
         super_template = self._track_templates[0] if self._has_super_template else None
+        self._scheduler.async_track(self._track_templates)
 
         # Render the super template first
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._scheduler.async_render_to_info(
+                template, variables, None, strict=strict, log_fn=log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -993,8 +1136,8 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._scheduler.async_render_to_info(
+                template, variables, None, strict=strict, log_fn=log_fn
             )
 
             if info.exception:
@@ -1066,6 +1209,7 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._scheduler.async_untrack(self._track_templates)
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1079,9 +1223,13 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        replayed: bool = False,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
+        The render is shared with other trackers of the same template
+        and variables for the event, unless the event is replayed.
+
         Returns False if the template was not re-rendered.
 
         Returns True if the template re-rendered and did not
@@ -1118,8 +1266,8 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._scheduler.async_render_to_info(
+            template, track_template_.variables, None if replayed else event
         )
 
         try:
@@ -1169,7 +1317,7 @@ class TrackTemplateResultInfo:
         self,
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
-        replayed: bool | None = False,
+        replayed: bool = False,
     ) -> None:
         """Refresh the template.
 
@@ -1194,7 +1342,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, replayed
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1225,7 +1375,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, replayed
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
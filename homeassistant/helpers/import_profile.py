@@ -0,0 +1,211 @@
+"""Profile integration import and setup times to schedule imports on startup."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import logging
+from typing import Any, TypedDict
+
+from homeassistant import loader, requirements
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.import_profile"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+# Weight of the latest measurement when updating the predicted times
+PREDICTION_WEIGHT = 0.5
+
+# Number of integrations listed in the startup report
+REPORT_SIZE = 10
+
+
+class _IntegrationProfileDict(TypedDict):
+    """Stored profile of an integration."""
+
+    import_time: float
+    setup_time: float
+    platforms: list[str]
+
+
+@dataclass(slots=True)
+class IntegrationProfile:
+    """Predicted import and setup times of an integration."""
+
+    import_time: float
+    setup_time: float
+    platforms: list[str]
+
+
+class ImportProfile:
+    """Predict integration import times from previous startups.
+
+    The import and setup time of every integration set up during startup is
+    stored, and the next startup imports the integrations with the slowest
+    predicted imports first, together with the platforms they loaded, while
+    the earlier setup stages are still running.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the import profile."""
+        self._hass = hass
+        self._store = Store[dict[str, _IntegrationProfileDict]](
+            hass, STORAGE_VERSION, STORAGE_KEY, private=True, atomic_writes=True
+        )
+        self.predicted: dict[str, IntegrationProfile] = {}
+        self.actual: dict[str, IntegrationProfile] = {}
+
+    async def async_load(self) -> None:
+        """Load the profile of the previous startups."""
+        if not (data := await self._store.async_load()):
+            return
+        self.predicted = {
+            domain: IntegrationProfile(
+                profile["import_time"], profile["setup_time"], profile["platforms"]
+            )
+            for domain, profile in data.items()
+        }
+
+    async def async_preimport(
+        self, integrations: Iterable[loader.Integration], queued: int
+    ) -> None:
+        """Import integrations and their platforms, slowest predicted first.
+
+        At most queued imports are waiting for the import executor at a
+        time so imports requested by the setup of integrations are not stuck
+        behind all of them. Requirements are processed before an import is
+        queued, so installing them does not hold up the other imports.
+        """
+        predicted = self.predicted
+        to_import = sorted(
+            (
+                integration
+                for integration in integrations
+                if integration.domain in predicted and integration.import_executor
+            ),
+            key=lambda integration: predicted[integration.domain].import_time,
+            reverse=True,
+        )
+        if not to_import:
+            return
+        hass = self._hass
+        semaphore = asyncio.Semaphore(queued)
+
+        async def _async_preimport(integration: loader.Integration) -> None:
+            """Import an integration and its platforms."""
+            domain = integration.domain
+            if not await _async_requirements_installed(hass, domain):
+                return
+            platforms = [
+                platform
+                for platform in predicted[domain].platforms
+                if await _async_requirements_installed(hass, platform)
+            ]
+            async with semaphore:
+                try:
+                    await integration.async_get_component()
+                    if platforms:
+                        await integration.async_get_platforms(platforms)
+                except Exception as err:  # pylint: disable=broad-except
+                    # Setting up the integration reports the error
+                    _LOGGER.debug("Error importing %s ahead of setup: %s", domain, err)
+
+        # The semaphore wakes up waiters in order, so the integrations
+        # whose requirements are ready are imported in the order of the tasks
+        await asyncio.gather(
+            *(_async_preimport(integration) for integration in to_import)
+        )
+
+    @callback
+    def async_update(
+        self,
+        domains: Iterable[str],
+        import_times: Mapping[str, float],
+        setup_times: Mapping[str, float],
+    ) -> None:
+        """Record the timings of this startup and schedule saving the profile."""
+        components: dict[str, Any] = self._hass.data[loader.DATA_COMPONENTS]
+        platforms: dict[str, list[str]] = {}
+        for name in components:
+            domain, _, platform = name.partition(".")
+            if platform:
+                platforms.setdefault(domain, []).append(platform)
+        self.actual = {
+            domain: IntegrationProfile(
+                import_times.get(domain, 0.0),
+                setup_times.get(domain, 0.0),
+                sorted(platforms.get(domain, ())),
+            )
+            for domain in domains
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, _IntegrationProfileDict]:
+        """Return the predicted times updated with the actual times."""
+        data: dict[str, _IntegrationProfileDict] = {}
+        for domain, actual in self.actual.items():
+            import_time = actual.import_time
+            setup_time = actual.setup_time
+            if predicted := self.predicted.get(domain):
+                import_time = _weighted(predicted.import_time, import_time)
+                setup_time = _weighted(predicted.setup_time, setup_time)
+            data[domain] = {
+                "import_time": round(import_time, 4),
+                "setup_time": round(setup_time, 4),
+                "platforms": actual.platforms,
+            }
+        return data
+
+    @callback
+    def async_report(self) -> dict[str, dict[str, float | None]]:
+        """Return the predicted and actual times of the slowest integrations."""
+        predicted = self.predicted
+        report: dict[str, dict[str, float | None]] = {}
+        for domain, actual in sorted(
+            self.actual.items(),
+            key=lambda item: item[1].import_time + item[1].setup_time,
+            reverse=True,
+        )[:REPORT_SIZE]:
+            prediction = predicted.get(domain)
+            report[domain] = {
+                "import_time": round(actual.import_time, 2),
+                "predicted_import_time": (
+                    round(prediction.import_time, 2) if prediction else None
+                ),
+                "setup_time": round(actual.setup_time, 2),
+                "predicted_setup_time": (
+                    round(prediction.setup_time, 2) if prediction else None
+                ),
+            }
+        return report
+
+
+async def _async_requirements_installed(hass: HomeAssistant, name: str) -> bool:
+    """Install the requirements of an integration before importing it.
+
+    A platform that fails to import because of missing requirements is
+    cached as missing, so nothing is imported before the requirements the
+    setup would install are in place. Platforms that are not integrations,
+    like config_flow, have no requirements of their own.
+    """
+    try:
+        await requirements.async_get_integration_with_requirements(hass, name)
+    except loader.IntegrationNotFound:
+        return True
+    except HomeAssistantError as err:
+        _LOGGER.debug("Not importing %s ahead of setup: %s", name, err)
+        return False
+    return True
+
+
+def _weighted(predicted: float, actual: float) -> float:
+    """Return the new prediction from the previous one and a measurement."""
+    return predicted + (actual - predicted) * PREDICTION_WEIGHT
@@ -171,6 +171,21 @@ def save_json(
     atomic_writes: bool = False,
 ) -> None:
     """Save JSON data to a file."""
+    mode, json_data = encode_json_for_save(filename, data, encoder=encoder)
+    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
+    method(filename, json_data, private, mode=mode)
+
+
+def encode_json_for_save(
+    filename: str,
+    data: list | dict,
+    *,
+    encoder: type[json.JSONEncoder] | None = None,
+) -> tuple[str, str | bytes]:
+    """Encode JSON data to save to a file.
+
+    Returns the mode to open the file with and the encoded data.
+    """
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -194,8 +209,7 @@ def save_json(
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
-    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
-    method(filename, json_data, private, mode=mode)
+    return mode, json_data
 
 
 def find_paths_unserializable_data(
@@ -3,22 +3,24 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import suppress
 from datetime import datetime, timedelta
 import logging
-from typing import Any, Self, cast
+import os
+from typing import Any, Self, TypedDict, cast
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
-from homeassistant.util.json import json_loads
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
-from .storage import Store
+from .json import JSONEncoder, json_bytes
+from .storage import STORAGE_DIR, Store
 
 DATA_RESTORE_STATE = "restore_state"
 
@@ -26,6 +28,7 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
+JOURNAL_KEY = "core.restore_state_journal"
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -33,6 +36,12 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long between rewriting all states and clearing the journal, which
+# also refreshes when the states of existing entities were last seen.
+# Unchanged states are not journaled, so the last seen time of an entity
+# that no longer exists may be up to this long before it was last seen.
+COMPACT_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -95,6 +104,93 @@ class StoredState:
         )
 
 
+class JournalRecord(TypedDict):
+    """A change to the stored state of an entity."""
+
+    entity_id: str
+    stored_state: dict[str, Any] | None
+    # When the record was written, as a timestamp
+    time: float
+
+
+class RestoreStateJournal:
+    """Append only journal of the stored states changed since the last snapshot.
+
+    Each record is a JSON document on its own line. A record without a
+    stored state removes the stored state of the entity.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the journal."""
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, JOURNAL_KEY)
+        self.records = 0
+
+    async def async_load(self) -> list[JournalRecord]:
+        """Load the records of the journal."""
+        records = await self._async_read_records()
+        self.records = len(records)
+        return records
+
+    async def async_append(self, records: list[JournalRecord]) -> None:
+        """Append records to the journal."""
+        await self._async_append_records(records)
+        self.records += len(records)
+
+    async def async_remove(self) -> None:
+        """Remove the journal."""
+        await self._async_remove()
+        self.records = 0
+
+    async def _async_read_records(self) -> list[JournalRecord]:
+        """Read the records of the journal."""
+        return await self.hass.async_add_executor_job(self._read_records)
+
+    async def _async_append_records(self, records: list[JournalRecord]) -> None:
+        """Append records to the journal."""
+        await self.hass.async_add_executor_job(self._append_records, records)
+
+    async def _async_remove(self) -> None:
+        """Remove the journal."""
+        await self.hass.async_add_executor_job(self._remove)
+
+    def _read_records(self) -> list[JournalRecord]:
+        """Read the records of the journal in the executor."""
+        try:
+            with open(self.path, "rb") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return []
+        records: list[JournalRecord] = []
+        for line in lines:
+            try:
+                records.append(cast(JournalRecord, json_loads(line)))
+            except JSON_DECODE_EXCEPTIONS:
+                # The last record is incomplete if writing it was interrupted
+                _LOGGER.warning("Ignoring invalid record in %s", self.path)
+        return records
+
+    def _append_records(self, records: list[JournalRecord]) -> None:
+        """Append records to the journal in the executor."""
+        data = b"".join(json_bytes(record) + b"\n" for record in records)
+        with open(self.path, "ab") as journal:
+            journal.write(data)
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def _remove(self) -> None:
+        """Remove the journal in the executor."""
+        with suppress(FileNotFoundError):
+            os.remove(self.path)
+
+
+def _timestamp(last_seen: datetime | str) -> float:
+    """Return the timestamp of when a stored state was last seen."""
+    if isinstance(last_seen, str):
+        return dt_util.parse_datetime(last_seen, raise_on_error=True).timestamp()
+    return last_seen.timestamp()
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     restore_state = RestoreStateData(hass)
@@ -109,7 +205,13 @@ def async_get(hass: HomeAssistant) -> RestoreStateData:
 
 
 class RestoreStateData:
-    """Helper class for managing the helper saved data."""
+    """Helper class for managing the helper saved data.
+
+    All stored states are written to the store when Home Assistant has
+    started and once a day. In between, only the stored states that changed
+    since the last dump are appended to the journal, which is replayed on
+    top of the store when loading.
+    """
 
     @classmethod
     async def async_save_persistent_states(cls, hass: HomeAssistant) -> None:
@@ -135,10 +237,14 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, atomic_writes=True
         )
+        self.journal = RestoreStateJournal(hass)
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state and extra data of each entity as last written
+        self._written: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        self._last_compacted: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -159,16 +265,42 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
-        if stored_states is None:
+        try:
+            records = await self.journal.async_load()
+        except OSError as exc:
+            _LOGGER.error("Error loading last state changes", exc_info=exc)
+            records = []
+
+        # The next dump writes all stored states
+        self._written = {}
+        self._last_compacted = None
+        if stored_states is None and not records:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
-        else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
-            }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            return
+
+        # The snapshot and the journal are parsed in full, but only the
+        # winning dict of each entity is turned into a StoredState
+        last_states = {item["state"]["entity_id"]: item for item in stored_states or ()}
+        # Records written before the snapshot are left over from a compaction
+        # which was interrupted before the journal was removed
+        snapshot_time = max(
+            (_timestamp(item["last_seen"]) for item in last_states.values()),
+            default=0.0,
+        )
+        for record in records:
+            if record["time"] < snapshot_time:
+                continue
+            if (stored_state := record["stored_state"]) is None:
+                last_states.pop(record["entity_id"], None)
+            else:
+                last_states[record["entity_id"]] = stored_state
+        self.last_states = {
+            entity_id: StoredState.from_dict(item)
+            for entity_id, item in last_states.items()
+            if valid_entity_id(entity_id)
+        }
+        _LOGGER.debug("Created cache with %s", list(self.last_states))
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -215,17 +347,85 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the stored states that changed since the last dump are written,
+        unless all stored states are due to be rewritten.
+        """
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
+        written = self._written
+        current: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        records: list[JournalRecord] = []
+        now = dt_util.utcnow()
+        timestamp = now.timestamp()
+        for stored_state in stored_states:
+            entity_id = stored_state.state.entity_id
+            state = stored_state.state
+            extra_data = stored_state.extra_data
+            extra_dict = extra_data.as_dict() if extra_data else None
+            current[entity_id] = (state, extra_dict)
+            if (last_written := written.get(entity_id)) is None or (
+                last_written[0] is not state or last_written[1] != extra_dict
+            ):
+                records.append(
+                    {
+                        "entity_id": entity_id,
+                        "stored_state": stored_state.as_dict(),
+                        "time": timestamp,
+                    }
+                )
+        records.extend(
+            {"entity_id": entity_id, "stored_state": None, "time": timestamp}
+            for entity_id in written
+            if entity_id not in current
+        )
+
+        if (
+            self._last_compacted is None
+            or now - self._last_compacted >= COMPACT_INTERVAL
+            or self.journal.records + len(records) > len(stored_states)
+        ):
+            await self._async_compact(stored_states, current, now)
+            return
+        if not records:
+            return
+        try:
+            await self.journal.async_append(records)
+        except OSError as exc:
+            _LOGGER.error("Error saving current state changes", exc_info=exc)
+            # Write all stored states on the next dump
+            self._last_compacted = None
+            return
+        self._written = current
+
+    async def _async_compact(
+        self,
+        stored_states: list[StoredState],
+        current: dict[str, tuple[State, dict[str, Any] | None]],
+        now: datetime,
+    ) -> None:
+        """Write all stored states and remove the journal.
+
+        The journal is only removed once the stored states are written, if
+        removing it fails its records are older than the stored states and
+        are skipped when loading.
+        """
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
-        except HomeAssistantError as exc:
+        except (HomeAssistantError, OSError) as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            # Write all stored states on the next dump
+            self._last_compacted = None
+            return
+        self._written = current
+        self._last_compacted = now
+        try:
+            await self.journal.async_remove()
+        except OSError as exc:
+            _LOGGER.error("Error removing last state changes", exc_info=exc)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -6,10 +6,12 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import asdict, dataclass
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
+import time
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
@@ -25,7 +27,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_files_atomic
 
 from . import json as json_helper
 
@@ -43,6 +45,7 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITER = "storage_writer"
 
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
@@ -385,23 +388,7 @@ class Store(Generic[_T]):
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
-
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        if "data_func" in data:
-            data["data"] = data.pop("data_func")()
-
-        _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
-        )
+        await _async_get_writer(self.hass).async_write(self, data)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -414,3 +401,164 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+
+@dataclass(slots=True)
+class StoreWriteStats:
+    """Writes of a store by the storage writer."""
+
+    writes: int = 0
+    errors: int = 0
+    bytes: int = 0
+    latency: float = 0.0
+    max_latency: float = 0.0
+
+
+@dataclass(slots=True)
+class _PendingWrite:
+    """Data waiting to be written for a store."""
+
+    store: Store
+    data: dict[str, Any]
+    queued: float
+    future: asyncio.Future[None]
+
+
+class StorageWriter:
+    """Write the data of all stores from one executor job at a time.
+
+    Writes requested while a batch is being written wait for the next
+    batch. A store only has one write in flight at a time, so a batch holds
+    at most one write per store. The data is serialized in the executor and
+    the files of stores with atomic writes are synced once all files of the
+    batch are written, with one sync per directory for the whole batch.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the storage writer."""
+        self.hass = hass
+        self._pending: list[_PendingWrite] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self.stats: dict[str, StoreWriteStats] = {}
+
+    async def async_write(self, store: Store, data: dict[str, Any]) -> None:
+        """Write the data of a store.
+
+        Raises the error of serializing or writing the data.
+        """
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._pending.append(_PendingWrite(store, data, time.monotonic(), future))
+        if self._flush_task is None:
+            # Started on the next iteration of the event loop to batch
+            # the writes of all stores saved in this iteration
+            self._flush_task = self.hass.async_create_task(
+                self._async_flush(), "storage writer"
+            )
+        await future
+
+    @callback
+    def _async_get_stats(self, key: str) -> StoreWriteStats:
+        """Return the stats of a store."""
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = StoreWriteStats()
+        return stats
+
+    async def _async_flush(self) -> None:
+        """Write batches until no writes are pending."""
+        batch: list[_PendingWrite] = []
+        try:
+            while self._pending:
+                batch = self._pending
+                self._pending = []
+                results = await self.hass.async_add_executor_job(_write_batch, batch)
+                now = time.monotonic()
+                for pending, (size, err) in zip(batch, results, strict=True):
+                    stats = self._async_get_stats(pending.store.key)
+                    latency = now - pending.queued
+                    stats.writes += 1
+                    stats.bytes += size
+                    stats.latency += latency
+                    stats.max_latency = max(stats.max_latency, latency)
+                    if err is not None:
+                        stats.errors += 1
+                    if not pending.future.done():
+                        if err is None:
+                            pending.future.set_result(None)
+                        else:
+                            pending.future.set_exception(err)
+                batch = []
+        except asyncio.CancelledError:
+            self._async_fail_writes(
+                batch, HomeAssistantError("Writing the store was cancelled")
+            )
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            self._async_fail_writes(batch, err)
+        finally:
+            self._flush_task = None
+
+    @callback
+    def _async_fail_writes(self, batch: list[_PendingWrite], err: Exception) -> None:
+        """Fail the writes of a batch and the writes waiting for the next one."""
+        failed = [*batch, *self._pending]
+        self._pending = []
+        for pending in failed:
+            self._async_get_stats(pending.store.key).errors += 1
+            if not pending.future.done():
+                pending.future.set_exception(err)
+
+
+def _write_batch(batch: list[_PendingWrite]) -> list[tuple[int, Exception | None]]:
+    """Serialize and write a batch of store data in the executor.
+
+    Returns the number of bytes written and the error of each write.
+    """
+    results: list[tuple[int, Exception | None]] = []
+    atomic: list[tuple[int, tuple[str, bytes | str, bool, str]]] = []
+    for idx, pending in enumerate(batch):
+        store = pending.store
+        data = pending.data
+        path = store.path
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if "data_func" in data:
+                data["data"] = data.pop("data_func")()
+            _LOGGER.debug("Writing data for %s to %s", store.key, path)
+            mode, json_data = json_helper.encode_json_for_save(
+                path, data, encoder=store._encoder
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            results.append((0, err))
+            continue
+        results.append((len(json_data), None))
+        if store._atomic_writes:
+            atomic.append((idx, (path, json_data, store._private, mode)))
+            continue
+        try:
+            write_utf8_file(path, json_data, store._private, mode=mode)
+        except WriteError as err:
+            results[idx] = (0, err)
+    if atomic:
+        errors = write_utf8_files_atomic([file for _, file in atomic])
+        for (idx, _), write_error in zip(atomic, errors, strict=True):
+            if write_error is not None:
+                results[idx] = (0, write_error)
+    return results
+
+
+@callback
+def _async_get_writer(hass: HomeAssistant) -> StorageWriter:
+    """Return the storage writer."""
+    if STORAGE_WRITER not in hass.data:
+        hass.data[STORAGE_WRITER] = StorageWriter(hass)
+    writer: StorageWriter = hass.data[STORAGE_WRITER]
+    return writer
+
+
+@callback
+def async_get_write_stats(hass: HomeAssistant) -> dict[str, dict[str, float]]:
+    """Return the write stats of every store written since the start."""
+    if STORAGE_WRITER not in hass.data:
+        return {}
+    writer: StorageWriter = hass.data[STORAGE_WRITER]
+    return {key: asdict(stats) for key, stats in sorted(writer.stats.items())}
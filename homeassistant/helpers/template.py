@@ -11,8 +11,11 @@ from contextlib import AbstractContextManager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -21,6 +24,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import time
 from types import CodeType, TracebackType
 from typing import (
     Any,
@@ -52,13 +56,16 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -88,6 +95,7 @@ from . import (
     location as loc_helper,
 )
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -101,6 +109,12 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE = "template.bytecode_cache"
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+BYTECODE_CACHE_SIZE = 4096
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -2496,6 +2510,145 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+class TemplateBytecodeCache:
+    """Persist compiled template code across restarts.
+
+    The code is keyed by a hash of the environment variant and the template
+    source, since the limited environment replaces some filters and tests
+    and the generated code depends on them. The whole cache is discarded
+    when Home Assistant, Python or Jinja changes.
+
+    Templates compiled during startup come from the configuration and are
+    persisted. Templates compiled after startup, like the ones rendered
+    once from the developer tools or a service call, are only persisted
+    once they have been compiled again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self._hass = hass
+        self._store = Store[dict[str, Any]](
+            hass, BYTECODE_CACHE_STORAGE_VERSION, BYTECODE_CACHE_STORAGE_KEY
+        )
+        # Encoded code loaded from disk, decoded on first use
+        self._stored: dict[str, list[Any]] = {}
+        # Compile time, code and if it is persisted by key
+        self._code: LRU[str, tuple[float, CodeType, bool]] = LRU(BYTECODE_CACHE_SIZE)
+        self._started = False
+        self._save_scheduled = False
+        self.hits = 0
+        self.misses = 0
+        self.compile_time = 0.0
+        self.compile_time_saved = 0.0
+
+    async def async_load(self) -> None:
+        """Load the compiled templates persisted by the previous run."""
+        if not (data := await self._store.async_load()):
+            return
+        if data["build"] != _bytecode_build():
+            _LOGGER.debug("Discarding compiled templates of a different build")
+            return
+        self._stored = data["templates"]
+
+    def compile(
+        self, variant: str, source: str, compile_fn: Callable[[str], CodeType]
+    ) -> CodeType:
+        """Return the compiled code of a template source."""
+        key = hashlib.sha256(
+            f"{variant}\0{source}".encode(errors="surrogatepass")
+        ).hexdigest()
+        if (cached := self._code.get(key)) is None and (
+            stored := self._stored.pop(key, None)
+        ):
+            with suppress(ValueError, EOFError, TypeError):
+                cached = self._code[key] = (
+                    stored[0],
+                    marshal.loads(base64.b64decode(stored[1])),
+                    True,
+                )
+        if cached is not None:
+            self.hits += 1
+            self.compile_time_saved += cached[0]
+            if not cached[2]:
+                # Compiled again, so it is worth persisting
+                self._code[key] = (cached[0], cached[1], True)
+                self._schedule_save()
+            return cached[1]
+        start = time.perf_counter()
+        code = compile_fn(source)
+        duration = time.perf_counter() - start
+        self.misses += 1
+        self.compile_time += duration
+        self._code[key] = (duration, code, not self._started)
+        if not self._started:
+            self._schedule_save()
+        return code
+
+    def _schedule_save(self) -> None:
+        """Schedule saving the compiled templates from any thread."""
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def async_prune(self) -> None:
+        """Only persist templates that have been compiled by this run."""
+        self._started = True
+        self._stored.clear()
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the compiled templates."""
+        self._save_scheduled = False
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the compiled templates to persist."""
+        templates = dict(self._stored)
+        for key, (duration, code, persist) in self._code.items():
+            if persist:
+                templates[key] = [
+                    duration,
+                    base64.b64encode(marshal.dumps(code)).decode(),
+                ]
+        return {"build": _bytecode_build(), "templates": templates}
+
+
+def _bytecode_build() -> str:
+    """Return the build the compiled templates are valid for."""
+    return (
+        f"{__version__}-{sys.implementation.cache_tag}-{sys.version}"
+        f"-{jinja2.__version__}-{MAGIC_NUMBER.hex()}"
+    )
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the compiled templates persisted by the previous run."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+    @callback
+    def _async_started(_: Event) -> None:
+        """Log the compile time saved during startup."""
+        _LOGGER.debug(
+            "Compiled templates during startup: %s from cache saving %.3fs,"
+            " %s compiled in %.3fs",
+            bytecode_cache.hits,
+            bytecode_cache.compile_time_saved,
+            bytecode_cache.misses,
+            bytecode_cache.compile_time,
+        )
+        # Templates are validated when the configuration is loaded so
+        # the ones that were not compiled during startup are no longer used
+        bytecode_cache.async_prune()
+
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STARTED, _async_started, run_immediately=True
+    )
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2563,6 +2716,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._bytecode_variant = (
+            f"{'limited' if limited else 'strict' if strict else 'default'}"
+            f"-sandboxed={self.sandboxed}"
+        )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
@@ -2887,9 +3044,22 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = self.template_cache[source] = self._compile_source(source)
 
         return cached
 
+    def _compile_source(self, source: str | jinja2.nodes.Template) -> CodeType:
+        """Compile the template, using the bytecode cache when it is loaded."""
+        if (
+            self.hass is None
+            or not isinstance(source, str)
+            or (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is None
+        ):
+            return super().compile(source)
+        return cast(
+            CodeType,
+            bytecode_cache.compile(self._bytecode_variant, source, super().compile),
+        )
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
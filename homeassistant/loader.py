@@ -101,6 +101,7 @@ DATA_INTEGRATIONS = "integrations"
 DATA_MISSING_PLATFORMS = "missing_platforms"
 DATA_CUSTOM_COMPONENTS = "custom_components"
 DATA_PRELOAD_PLATFORMS = "preload_platforms"
+DATA_IMPORT_TIMES = "integration_import_times"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -241,6 +242,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMES] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -746,6 +748,8 @@ class Integration:
 
         platforms_to_preload: list[str] = hass.data[DATA_PRELOAD_PLATFORMS]
         self._platforms_to_preload = platforms_to_preload
+        import_times: dict[str, float] = hass.data[DATA_IMPORT_TIMES]
+        self._import_times = import_times
         self._component_future: asyncio.Future[ComponentProtocol] | None = None
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         cache: dict[str, ModuleType | ComponentProtocol] = hass.data[DATA_COMPONENTS]
@@ -1034,6 +1038,7 @@ class Integration:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        start = time.perf_counter()
         try:
             cache[domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -1054,6 +1059,9 @@ class Integration:
                 with suppress(ImportError):
                     self.get_platform(platform_name)
 
+        # The import time is only meaningful for the first import of the
+        # integration, so keep the first measurement.
+        self._import_times.setdefault(domain, time.perf_counter() - start)
         return cache[domain]
 
     def _load_platforms(self, platform_names: Iterable[str]) -> dict[str, ModuleType]:
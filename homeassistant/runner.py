@@ -57,6 +57,8 @@ class RuntimeConfig:
 
     safe_mode: bool = False
 
+    import_workers: int = 1
+
 
 def can_use_pidfd() -> bool:
     """Check if pidfd_open is available.
@@ -5,12 +5,14 @@ from __future__ import annotations
 import argparse
 import asyncio
 import collections
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from contextlib import suppress
+import io
 import json
 import logging
 from timeit import default_timer as timer
 from typing import TypeVar
+import zlib
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -19,7 +21,7 @@ from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
-from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.json import JSON_DUMP, JSONEncoder, json_bytes
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -228,6 +230,80 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def async_fire_filtered_listeners(hass):
+    """Time firing a million events to 20 listeners that filter them."""
+    event_name = "benchmark_event"
+    events_to_fire = 10**6
+
+    @core.callback
+    def event_filter(event_data):
+        """Filter event."""
+        return False
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+
+    for _ in range(20):
+        hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+    # Listeners for other event types should not slow down firing
+    for idx in range(1000):
+        hass.bus.async_listen(f"{event_name}_{idx}", listener)
+
+    async_fire = hass.bus.async_fire
+    event_data = {"entity_id": "light.kitchen"}
+    start = timer()
+
+    for _ in range(events_to_fire):
+        async_fire(event_name, event_data)
+
+    return timer() - start
+
+
+@benchmark
+async def async_fire_state_changed_keyed(hass):
+    """Time firing a million state_changed events to keyed listeners.
+
+    With 1000 tracked entities and events for untracked entities.
+    """
+    entity_id = "light.kitchen"
+    events_to_fire = 10**6
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+
+    for idx in range(1000):
+        async_track_state_change_event(hass, f"{entity_id}{idx}", listener)
+
+    async_fire = hass.bus.async_fire
+    event_data = {
+        "entity_id": "switch.no_listeners",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+    start = timer()
+
+    for _ in range(events_to_fire):
+        async_fire(EVENT_STATE_CHANGED, event_data)
+
+    return timer() - start
+
+
+@benchmark
+async def async_fire_no_listeners(hass):
+    """Time firing a million events that have no listeners."""
+    events_to_fire = 10**6
+    async_fire = hass.bus.async_fire
+    start = timer()
+
+    for _ in range(events_to_fire):
+        async_fire("benchmark_event")
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -315,6 +391,743 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def websocket_subscribe_entities_reconnect(hass):
+    """Time 100 reconnect storms of 40 clients subscribing to 2000 entities.
+
+    Half of the clients are admins, the other half can only read lights.
+    A state changes between storms.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import Group, User
+    from homeassistant.components.websocket_api.commands import (
+        handle_subscribe_entities,
+    )
+
+    class Connection:
+        """Minimal websocket connection."""
+
+        def __init__(self, user):
+            """Initialize the connection."""
+            self.user = user
+            self.subscriptions = {}
+            self.logger = logging.getLogger(__name__)
+
+        def send_message(self, message):
+            """Drop the message."""
+
+        def send_result(self, msg_id, result=None):
+            """Drop the result."""
+
+    for idx in range(1000):
+        hass.states.async_set(f"light.kitchen_{idx}", "on", {"brightness": idx})
+        hass.states.async_set(f"sensor.kitchen_{idx}", str(idx), {"unit": "W"})
+    admin = User(name="Admin", perm_lookup=None, is_owner=True, is_active=True)
+    tablet = User(name="Tablet", perm_lookup=None, is_active=True)
+    tablet.groups = [
+        Group(name="Lights", policy={"entities": {"domains": {"light": True}}})
+    ]
+    msg = {"id": 1, "type": "subscribe_entities"}
+    clients = 40
+
+    start = timer()
+
+    for storm in range(100):
+        hass.states.async_set("sensor.kitchen_0", str(storm))
+        for idx in range(clients):
+            connection = Connection(admin if idx % 2 else tablet)
+            handle_subscribe_entities(hass, connection, msg)
+            connection.subscriptions[1]()
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_subscription_matching(hass):
+    """Match 100k messages against 10k wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    trie = SubscriptionTrie()
+    job = core.HassJob(lambda msg: None)
+    for idx in range(10**4):
+        trie.add(Subscription(f"homeassistant/+/node_{idx}/#", job))
+    topics = [
+        f"homeassistant/sensor/node_{idx % 10**4}/state_{idx}"
+        for idx in range(4 * 10**4)
+    ]
+    messages_to_match = 10**5
+    size = len(topics)
+
+    start = timer()
+
+    for idx in range(messages_to_match):
+        assert trie.match(topics[idx % size])
+
+    return timer() - start
+
+
+def _entity_registry_storage_data(entities: int) -> dict[str, list[dict]]:
+    """Return entity registry storage data with many entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import entity_registry as er
+
+    entries = [
+        er.RegistryEntry(
+            entity_id=f"sensor.entity_{idx}",
+            unique_id=str(idx),
+            platform=f"platform_{idx % 20}",
+            area_id=f"area_{idx % 100}",
+            config_entry_id=f"config_entry_{idx % 500}",
+            device_id=f"device_{idx // 10}",
+            labels={f"label_{idx % 50}"},
+            original_name=f"Entity {idx}",
+        )
+        for idx in range(entities)
+    ]
+    return {
+        "entities": json.loads(
+            json_bytes([entry.as_storage_fragment for entry in entries])
+        ),
+        "deleted_entities": [],
+    }
+
+
+@benchmark
+async def entity_registry_load(hass):
+    """Load an entity registry with 25k entities 20 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from unittest.mock import patch
+
+    from homeassistant.helpers import entity_registry as er
+
+    data = _entity_registry_storage_data(25000)
+    registry = er.EntityRegistry(hass)
+
+    start = timer()
+
+    with patch.object(registry._store, "async_load", return_value=data):
+        for _ in range(20):
+            await registry.async_load()
+
+    return timer() - start
+
+
+@benchmark
+async def entity_registry_lookups(hass):
+    """Look up entities of devices, areas, labels and platforms 10k times each."""
+    # pylint: disable-next=import-outside-toplevel
+    from unittest.mock import patch
+
+    from homeassistant.helpers import entity_registry as er
+
+    registry = er.EntityRegistry(hass)
+    with patch.object(
+        registry._store,
+        "async_load",
+        return_value=_entity_registry_storage_data(25000),
+    ):
+        await registry.async_load()
+
+    start = timer()
+
+    for idx in range(10**4):
+        er.async_entries_for_device(registry, f"device_{idx % 2500}")
+        er.async_entries_for_area(registry, f"area_{idx % 100}")
+        er.async_entries_for_label(registry, f"label_{idx % 50}")
+        er.async_entries_for_platform(registry, f"platform_{idx % 20}")
+
+    return timer() - start
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Write 100k states to SQLite through the ORM unit of work."""
+    return await hass.async_add_executor_job(_write_recorder_states, False)
+
+
+@benchmark
+async def recorder_bulk_write_states(hass):
+    """Write 100k states to SQLite with multi-row INSERT statements."""
+    return await hass.async_add_executor_job(_write_recorder_states, True)
+
+
+def _write_recorder_states(bulk: bool) -> float:
+    """Write states for 1000 entities in commit sized batches."""
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.bulk_writer import BulkWriter
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    bulk_writer = BulkWriter()
+    states_to_write = 10**5
+    batch_size = 1500
+    entities = 1000
+    written = 0
+
+    start = timer()
+
+    with Session(engine, expire_on_commit=False) as session:
+        states_meta = [
+            StatesMeta(entity_id=f"sensor.test_{idx}") for idx in range(entities)
+        ]
+        attributes = [
+            StateAttributes(shared_attrs=f'{{"idx":{idx}}}', hash=idx)
+            for idx in range(100)
+        ]
+        session.add_all([*states_meta, *attributes])
+        session.commit()
+        committed_state_ids: dict[int, int] = {}
+        while written < states_to_write:
+            pending_states: dict[int, States] = {}
+            for idx in range(written, written + batch_size):
+                entity = idx % entities
+                dbstate = States(
+                    state=str(idx),
+                    last_updated_ts=idx,
+                    last_changed_ts=idx,
+                    metadata_id=states_meta[entity].metadata_id,
+                    attributes_id=attributes[idx % 100].attributes_id,
+                )
+                if (old_state := pending_states.get(entity)) is not None:
+                    dbstate.old_state = old_state
+                elif (old_state_id := committed_state_ids.get(entity)) is not None:
+                    dbstate.old_state_id = old_state_id
+                pending_states[entity] = dbstate
+                if bulk:
+                    bulk_writer.add(dbstate)
+                else:
+                    session.add(dbstate)
+            if bulk:
+                bulk_writer.write(session)
+            session.commit()
+            bulk_writer.clear()
+            for entity, dbstate in pending_states.items():
+                committed_state_ids[entity] = dbstate.state_id
+            written += batch_size
+
+    return timer() - start
+
+
+@benchmark
+async def logbook_entity_context_joins(hass):
+    """Query a busy week of logbook rows joining every row of each context."""
+    return await hass.async_add_executor_job(_query_logbook_entities, False)
+
+
+@benchmark
+async def logbook_entity_context_origins(hass):
+    """Query a busy week of logbook rows looking up context origins."""
+    return await hass.async_add_executor_job(_query_logbook_entities, True)
+
+
+def _query_logbook_entities(use_context_origins: bool) -> float:
+    """Query 20 entities from a week of contexts that each change 10 entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from datetime import timedelta
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.logbook.queries import statement_for_request
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        ContextOrigins,
+        Events,
+        EventTypes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.util import execute_stmt_lambda_element
+    from homeassistant.util import dt as dt_util
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    contexts = 2 * 10**4
+    states_per_context = 10
+    entities = 500
+    end = dt_util.utcnow()
+    start = end - timedelta(days=7)
+    step = (end - start).total_seconds() / contexts
+
+    with Session(engine) as session:
+        session.execute(
+            insert(EventTypes),
+            [
+                {"event_type_id": 1, "event_type": "call_service"},
+                {"event_type_id": 2, "event_type": "logbook_entry"},
+            ],
+        )
+        session.execute(
+            insert(StatesMeta),
+            [
+                {"metadata_id": idx, "entity_id": f"light.test_{idx}"}
+                for idx in range(entities)
+            ],
+        )
+        events = []
+        states = []
+        origins = []
+        for idx in range(contexts):
+            context_id_bin = idx.to_bytes(16, "big")
+            time_fired_ts = start.timestamp() + idx * step
+            events.append(
+                {
+                    "event_id": idx,
+                    "event_type_id": 1,
+                    "time_fired_ts": time_fired_ts,
+                    "context_id_bin": context_id_bin,
+                }
+            )
+            origins.append(
+                {
+                    "context_id_bin": context_id_bin,
+                    "time_fired_ts": time_fired_ts,
+                    "event_id": idx,
+                }
+            )
+            states.extend(
+                {
+                    "state": str(idx),
+                    "metadata_id": (idx + offset * 50) % entities,
+                    "last_updated_ts": time_fired_ts + offset / 1000,
+                    "context_id_bin": context_id_bin,
+                }
+                for offset in range(states_per_context)
+            )
+        session.execute(insert(Events), events)
+        session.execute(insert(States), states)
+        session.execute(insert(ContextOrigins), origins)
+        session.commit()
+
+        entity_ids = [f"light.test_{idx}" for idx in range(20)]
+        stmt = statement_for_request(
+            start,
+            end,
+            (2,),
+            entity_ids,
+            list(range(20)),
+            context_origins_since=0 if use_context_origins else None,
+        )
+        start_time = timer()
+        for _ in execute_stmt_lambda_element(session, stmt, orm_rows=False):
+            pass
+        return timer() - start_time
+
+
+@benchmark
+async def statistics_queries_loop_lag(hass):
+    """Measure the event loop lag while statistics are fetched in threads."""
+    return await _statistics_queries_loop_lag(hass, 0)
+
+
+@benchmark
+async def statistics_queries_loop_lag_query_workers(hass):
+    """Measure the event loop lag while statistics are fetched by query workers."""
+    return await _statistics_queries_loop_lag(hass, 4)
+
+
+async def _statistics_queries_loop_lag(hass, query_workers: int) -> float:
+    """Return the worst event loop lag while answering 16 concurrent requests.
+
+    Each request fetches a month of hourly statistics for 20 sensors.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from datetime import timedelta
+    from functools import partial
+    from pathlib import Path
+    from tempfile import TemporaryDirectory
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import query_workers as workers
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        Statistics,
+        StatisticsMeta,
+    )
+    from homeassistant.components.recorder.websocket_api import (
+        _statistics_during_period_json,
+    )
+    from homeassistant.util import dt as dt_util
+
+    sensors = 20
+    hours = 24 * 31
+    end = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    start = end - timedelta(hours=hours)
+    metadata = {
+        f"sensor.test_{idx}": (
+            idx + 1,
+            {
+                "has_mean": True,
+                "has_sum": False,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": f"sensor.test_{idx}",
+                "unit_of_measurement": "°C",
+            },
+        )
+        for idx in range(sensors)
+    }
+
+    def _create_statistics(db_url: str) -> None:
+        engine = create_engine(db_url)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.execute(
+                insert(StatisticsMeta),
+                [
+                    {"id": metadata_id, **meta}
+                    for metadata_id, meta in metadata.values()
+                ],
+            )
+            session.execute(
+                insert(Statistics),
+                [
+                    {
+                        "metadata_id": metadata_id,
+                        "created_ts": 0,
+                        "start_ts": start.timestamp() + hour * 3600,
+                        "mean": hour % 30,
+                        "min": hour % 30 - 1,
+                        "max": hour % 30 + 1,
+                    }
+                    for metadata_id, _ in metadata.values()
+                    for hour in range(hours)
+                ],
+            )
+            session.commit()
+        engine.dispose()
+
+    with TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{Path(tmp) / 'statistics.db'}"
+        await hass.async_add_executor_job(_create_statistics, db_url)
+        query = partial(
+            _statistics_during_period_json,
+            start,
+            end,
+            set(metadata),
+            metadata,
+            {statistic_id: "°F" for statistic_id in metadata},
+            "hour",
+            None,
+            {"mean", "min", "max"},
+        )
+        pool = workers.QueryWorkers(db_url, query_workers) if query_workers else None
+        if pool is None:
+            # Answer the queries in this process, like the executor does
+            # pylint: disable-next=protected-access
+            workers._initialize_worker(db_url)  # noqa: SLF001
+
+        def _fetch() -> bytes:
+            return pool.run(query) if pool else query()
+
+        # Start the worker processes
+        await asyncio.gather(
+            *(hass.async_add_executor_job(_fetch) for _ in range(query_workers))
+        )
+        lag = 0.0
+
+        async def _measure_lag() -> None:
+            nonlocal lag
+            loop = asyncio.get_running_loop()
+            while True:
+                before = loop.time()
+                await asyncio.sleep(0.001)
+                lag = max(lag, loop.time() - before - 0.001)
+
+        lag_task = asyncio.create_task(_measure_lag())
+        await asyncio.gather(*(hass.async_add_executor_job(_fetch) for _ in range(16)))
+        lag_task.cancel()
+        if pool is not None:
+            await hass.async_add_executor_job(pool.shutdown)
+        return lag
+
+
+def _prometheus_scrape_benchmark(entities: int, prerender: bool) -> None:
+    """Register a benchmark scraping the Prometheus metrics of sensors."""
+
+    async def prometheus_scrape(hass):
+        return await hass.async_add_executor_job(
+            _scrape_prometheus_metrics, entities, prerender
+        )
+
+    prometheus_scrape.__name__ = (
+        f"prometheus_scrape_prerendered_{entities}"
+        if prerender
+        else f"prometheus_scrape_{entities}"
+    )
+    prometheus_scrape.__doc__ = (
+        f"Scrape the metrics of {entities} sensors with 10% changed per scrape."
+    )
+    benchmark(prometheus_scrape)
+
+
+for _entities in (1000, 8000):
+    for _prerender in (False, True):
+        _prometheus_scrape_benchmark(_entities, _prerender)
+
+
+def _scrape_prometheus_metrics(entities: int, prerender: bool) -> float:
+    """Return the time spent in 20 scrapes."""
+    # pylint: disable-next=import-outside-toplevel
+    import prometheus_client
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.prometheus import PrometheusMetrics
+    from homeassistant.components.prometheus.exposition import ExpositionCache
+    from homeassistant.helpers.entity_values import EntityValues
+    from homeassistant.helpers.entityfilter import FILTER_SCHEMA
+
+    prometheus_client.REGISTRY = prometheus_client.CollectorRegistry()
+    exposition_cache = ExpositionCache() if prerender else None
+    metrics = PrometheusMetrics(
+        FILTER_SCHEMA({}),
+        "homeassistant",
+        "°C",
+        EntityValues(),
+        None,
+        None,
+        exposition_cache,
+    )
+    attributes = {
+        "device_class": "temperature",
+        "friendly_name": "Temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    for idx in range(entities):
+        metrics.handle_state(core.State(f"sensor.test_{idx}", "20", attributes))
+
+    runtime = 0.0
+    for scrape in range(20):
+        for idx in range(scrape, entities, 10):
+            metrics.handle_state(
+                core.State(f"sensor.test_{idx}", str(scrape), attributes)
+            )
+        start = timer()
+        if exposition_cache is None:
+            prometheus_client.generate_latest(prometheus_client.REGISTRY)
+        else:
+            exposition_cache.async_snapshot(False)()
+        runtime += timer() - start
+    return runtime
+
+
+@benchmark
+async def influxdb_encode_json(hass):
+    """Encode 50,000 state changes like the InfluxDB client does for json."""
+    # pylint: disable-next=import-outside-toplevel
+    from influxdb.line_protocol import make_lines
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import influxdb
+
+    event_to_json = influxdb._generate_event_to_json(_influxdb_config())
+    events = [
+        core.Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": state.entity_id, "old_state": None, "new_state": state},
+        )
+        for state in _influxdb_states()
+    ]
+
+    start = timer()
+    make_lines({"points": [event_to_json(event) for event in events]})
+    return timer() - start
+
+
+@benchmark
+async def influxdb_encode_line_protocol(hass):
+    """Encode 50,000 state changes to line protocol from the states."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import influxdb
+    from homeassistant.components.influxdb.line_protocol import generate_state_to_line
+
+    state_to_line = generate_state_to_line(
+        influxdb._generate_state_to_json(_influxdb_config()), None
+    )
+    states = _influxdb_states()
+
+    start = timer()
+    "\n".join(line for state in states if (line := state_to_line(state)))
+    return timer() - start
+
+
+def _influxdb_config() -> dict:
+    """Return the InfluxDB config of the encoding benchmarks."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import influxdb
+
+    return influxdb.CONFIG_SCHEMA({influxdb.DOMAIN: {}})[influxdb.DOMAIN]
+
+
+def _influxdb_states() -> list[core.State]:
+    """Return 50,000 states of 500 sensors."""
+    attributes = {
+        "device_class": "power",
+        "friendly_name": "Power",
+        "state_class": "measurement",
+        "unit_of_measurement": "W",
+    }
+    return [
+        core.State(f"sensor.power_{idx % 500}", str(idx / 10), attributes)
+        for idx in range(50000)
+    ]
+
+
+@benchmark
+async def camera_still_stream_per_client(hass):
+    """Stream 100 frames to 20 MJPEG clients each fetching its own images."""
+    return await _camera_still_stream(hass, shared=False)
+
+
+@benchmark
+async def camera_still_stream_shared(hass):
+    """Stream 100 frames to 20 MJPEG clients sharing the images fetched."""
+    return await _camera_still_stream(hass, shared=True)
+
+
+async def _camera_still_stream(hass: core.HomeAssistant, shared: bool) -> float:
+    """Return the time to stream the frames of a simulated camera to clients."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.camera.still_stream import StillStreamHub
+
+    raw_image = bytes(range(256)) * 1024
+
+    def frame_source() -> Callable[[], Awaitable[bytes | None]]:
+        """Return a camera encoding a new image on every fetch."""
+        frames = 0
+
+        async def image_cb() -> bytes | None:
+            nonlocal frames
+            if (frames := frames + 1) > 100:
+                return None
+            await asyncio.sleep(0)
+            return zlib.compress(raw_image + frames.to_bytes(4), 6)
+
+        return image_cb
+
+    received = 0
+
+    async def write(frame: bytes) -> None:
+        nonlocal received
+        received += len(frame)
+        await asyncio.sleep(0)
+
+    shared_hub = StillStreamHub(hass, frame_source(), "image/jpeg", 0)
+    start = timer()
+    await asyncio.gather(
+        *(
+            (
+                shared_hub
+                if shared
+                else StillStreamHub(hass, frame_source(), "image/jpeg", 0)
+            ).async_send_frames(write)
+            for _ in range(20)
+        )
+    )
+    return timer() - start
+
+
+@benchmark
+async def stream_hls_segments_joined(hass):
+    """Serve the HLS segments of a stream joining their parts per request."""
+    return _serve_hls_segments(packed=False)
+
+
+@benchmark
+async def stream_hls_segments_packed(hass):
+    """Serve the HLS segments of a stream from their packed data."""
+    return _serve_hls_segments(packed=True)
+
+
+def _serve_hls_segments(packed: bool) -> float:
+    """Return the time for 20 clients to fetch the segments of a stream.
+
+    The parts of the segments are encoded from a synthetic PyAV stream.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import av
+
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.core import Part, Segment
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util import dt as dt_util
+
+    # Encode 20 seconds of 720p video with a keyframe every 2 seconds, and
+    # use the packets of every 1/3 of a second as the parts of the segments.
+    output = av.open(io.BytesIO(), "w", format="mp4")
+    video = output.add_stream(
+        "libx264", rate=30, options={"g": "60", "preset": "ultrafast"}
+    )
+    video.width, video.height, video.pix_fmt = 1280, 720, "yuv420p"
+    image = np.indices((720, 1280, 3)).sum(axis=0).astype(np.uint8)
+    rng = np.random.default_rng(0)
+    noise = [rng.integers(0, 64, image.shape, dtype=np.uint8) for _ in range(4)]
+    packets: list[bytes] = []
+    for frame_num in range(600):
+        frame = av.VideoFrame.from_ndarray(
+            np.roll(image, frame_num * 4, 1) + noise[frame_num % 4]
+        )
+        packets.extend(bytes(packet) for packet in video.encode(frame))
+    packets.extend(bytes(packet) for packet in video.encode(None))
+    output.close()
+
+    segments: list[Segment] = []
+    for sequence, seg_start in enumerate(range(0, len(packets), 60)):
+        segment = Segment(
+            sequence=sequence,
+            init=b"",
+            stream_id=0,
+            start_time=dt_util.utcnow(),
+            _stream_outputs=[],
+        )
+        for part_start in range(seg_start, seg_start + 60, 10):
+            segment.async_add_part(
+                Part(
+                    duration=1 / 3,
+                    has_keyframe=part_start == seg_start,
+                    data=b"".join(packets[part_start : part_start + 10]),
+                ),
+                2 if part_start + 10 >= seg_start + 60 else 0,
+            )
+        segments.append(segment)
+
+    served = 0
+    start = timer()
+    for segment in segments:
+        for _ in range(20):
+            if packed:
+                served += len(segment.get_data())
+            else:
+                served += len(b"".join([part.data for part in segment.parts]))
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
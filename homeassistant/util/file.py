@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 import logging
 import os
 import tempfile
+from typing import IO, Any
 
 from atomicwrites import AtomicWriter
 
@@ -77,3 +79,82 @@ def write_utf8_file(
                     filename,
                     err,
                 )
+
+
+def write_utf8_files_atomic(
+    files: Sequence[tuple[str, bytes | str, bool, str]],
+) -> list[WriteError | None]:
+    """Write files of (filename, utf8_data, private, mode) and rename them into place.
+
+    Each file is written all or nothing like write_utf8_file_atomic, but
+    the files are only synced after all of them are written and each
+    directory is synced once after the renames, so the disk can batch the
+    flushes of the files.
+
+    Returns the error writing each file, or None if it was written.
+    """
+    errors: list[WriteError | None] = [None] * len(files)
+    pending: list[tuple[int, str, IO[Any]]] = []
+    directories: set[str] = set()
+    try:
+        for idx, (filename, utf8_data, private, mode) in enumerate(files):
+            encoding = "utf-8" if "b" not in mode else None
+            fdesc: IO[Any]
+            try:
+                # Modern versions of Python tempfile create this file with mode 0o600
+                fdesc = tempfile.NamedTemporaryFile(  # pylint: disable=consider-using-with
+                    mode=mode,
+                    encoding=encoding,
+                    dir=os.path.dirname(filename),
+                    delete=False,
+                )
+            except OSError as error:
+                _LOGGER.exception("Saving file failed: %s", filename)
+                errors[idx] = WriteError(error)
+                continue
+            pending.append((idx, filename, fdesc))
+            try:
+                fdesc.write(utf8_data)
+                if not private:
+                    os.fchmod(fdesc.fileno(), 0o644)
+                fdesc.flush()
+            except OSError as error:
+                _LOGGER.exception("Saving file failed: %s", filename)
+                errors[idx] = WriteError(error)
+
+        for idx, filename, fdesc in pending:
+            if errors[idx] is not None:
+                continue
+            try:
+                os.fsync(fdesc.fileno())
+                fdesc.close()
+                os.replace(fdesc.name, filename)
+            except OSError as error:
+                _LOGGER.exception("Saving file failed: %s", filename)
+                errors[idx] = WriteError(error)
+            else:
+                directories.add(os.path.dirname(os.path.abspath(filename)))
+    finally:
+        for idx, filename, fdesc in pending:
+            fdesc.close()
+            if errors[idx] is not None and os.path.exists(fdesc.name):
+                try:
+                    os.remove(fdesc.name)
+                except OSError as err:
+                    _LOGGER.error(
+                        "File replacement cleanup failed for %s while saving %s: %s",
+                        fdesc.name,
+                        filename,
+                        err,
+                    )
+
+    for directory in directories:
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            _LOGGER.exception("Syncing directory failed: %s", directory)
+    return errors
@@ -1375,6 +1375,26 @@ def mock_storage(
         """Remove data."""
         data.pop(store.key, None)
 
+    async def mock_read_journal(
+        journal: restore_state.RestoreStateJournal,
+    ) -> list[restore_state.JournalRecord]:
+        """Mock version of reading the restore state journal."""
+        return list(data.get(restore_state.JOURNAL_KEY, []))
+
+    async def mock_append_journal(
+        journal: restore_state.RestoreStateJournal,
+        records: list[restore_state.JournalRecord],
+    ) -> None:
+        """Mock version of appending to the restore state journal."""
+        _LOGGER.debug("Appending to restore state journal: %s", records)
+        data.setdefault(restore_state.JOURNAL_KEY, []).extend(
+            json_loads(_orjson_default_encoder(records))
+        )
+
+    async def mock_remove_journal(journal: restore_state.RestoreStateJournal) -> None:
+        """Mock version of removing the restore state journal."""
+        data.pop(restore_state.JOURNAL_KEY, None)
+
     with patch(
         "homeassistant.helpers.storage.Store._async_load",
         side_effect=mock_async_load,
@@ -1387,6 +1407,18 @@ def mock_storage(
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.restore_state.RestoreStateJournal._async_read_records",
+        side_effect=mock_read_journal,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.restore_state.RestoreStateJournal._async_append_records",
+        side_effect=mock_append_journal,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.restore_state.RestoreStateJournal._async_remove",
+        side_effect=mock_remove_journal,
+        autospec=True,
     ):
         yield data
 
@@ -0,0 +1,122 @@
+"""The tests for the MJPEG streams of camera images."""
+
+import asyncio
+from collections.abc import Callable
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.camera.still_stream import StillStreamHub
+from homeassistant.core import HomeAssistant
+
+from tests.typing import ClientSessionGenerator
+
+
+def _frame(image: bytes, content_type: bytes = b"image/jpeg") -> bytes:
+    """Return the multipart frame of an image."""
+    return (
+        b"--frameboundary\r\nContent-Type: %s\r\n"
+        b"Content-Length: %d\r\n\r\n%s\r\n" % (content_type, len(image), image)
+    )
+
+
+async def _wait_for(condition: Callable[[], bool]) -> None:
+    """Let the tasks run until a condition is met."""
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("Condition not met")
+
+
+async def test_hub_fans_out_frames(hass: HomeAssistant) -> None:
+    """Test the images are fetched once and sent to all clients."""
+    images: asyncio.Queue[bytes | None] = asyncio.Queue()
+    hub = StillStreamHub(hass, images.get, "image/jpeg", 0)
+    fast: list[bytes] = []
+    slow: list[bytes] = []
+    slow_writing = asyncio.Event()
+
+    async def write_fast(frame: bytes) -> None:
+        fast.append(frame)
+
+    async def write_slow(frame: bytes) -> None:
+        slow.append(frame)
+        await slow_writing.wait()
+
+    clients = [
+        hass.async_create_task(hub.async_send_frames(write_fast)),
+        hass.async_create_task(hub.async_send_frames(write_slow)),
+    ]
+    images.put_nowait(b"one")
+    await _wait_for(lambda: len(fast) == 2)
+    # Unchanged images are skipped
+    images.put_nowait(b"one")
+    images.put_nowait(b"two")
+    await _wait_for(lambda: len(fast) == 3)
+    images.put_nowait(b"three")
+    await _wait_for(lambda: len(fast) == 4)
+    images.put_nowait(None)
+    slow_writing.set()
+    await asyncio.gather(*clients)
+
+    assert hub.fetches == 5
+    # The first frame is sent twice
+    assert fast == [_frame(b"one"), _frame(b"one"), _frame(b"two"), _frame(b"three")]
+    # The slow client skipped to the latest frame once it caught up
+    assert slow == [_frame(b"one"), _frame(b"one"), _frame(b"three")]
+    assert hub.dropped == 1
+    assert not hub.has_subscribers
+    # The same bytes are written to all clients
+    assert fast[-1] is slow[-1]
+
+
+async def test_camera_proxy_stream_shared(
+    hass: HomeAssistant, mock_camera, hass_client: ClientSessionGenerator
+) -> None:
+    """Test clients of the MJPEG stream of a camera share the images fetched."""
+    client = await hass_client()
+    fetches = 0
+
+    async def camera_image(*args, **kwargs) -> bytes:
+        nonlocal fetches
+        fetches += 1
+        return b"image %d" % fetches
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=camera_image,
+    ):
+        responses = [
+            await client.get("/api/camera_proxy_stream/camera.demo_camera?interval=1")
+            for _ in range(3)
+        ]
+        for response in responses:
+            assert response.status == HTTPStatus.OK
+            frame = _frame(b"image 1", b"image/jpg")
+            assert await response.content.readexactly(len(frame)) == frame
+        assert fetches == 1
+        for response in responses:
+            response.close()
+
+
+@pytest.mark.parametrize("interval", ["0.5", "1"])
+async def test_camera_proxy_stream_ends(
+    hass: HomeAssistant,
+    mock_camera,
+    hass_client: ClientSessionGenerator,
+    interval: str,
+) -> None:
+    """Test the MJPEG stream ends when the camera has no image."""
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=None,
+    ):
+        response = await client.get(
+            f"/api/camera_proxy_stream/camera.demo_camera?interval={interval}"
+        )
+        assert response.status == HTTPStatus.OK
+        assert await response.read() == b""
@@ -478,6 +478,72 @@ async def test_fossil_energy_consumption_no_co2(
     }
 
 
+async def test_fossil_energy_consumption_shared_result(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test fossil_energy_consumption results are shared until statistics change."""
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 01:00:00"))
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata,
+        ({"start": period1, "last_reset": None, "state": 0, "sum": 2},),
+    )
+    await async_wait_recording_done(hass)
+    cache = recorder_mock.statistics_result_cache
+
+    client = await hass_ws_client()
+    request = {
+        "type": "energy/fossil_energy_consumption",
+        "start_time": period1.isoformat(),
+        "end_time": dt_util.parse_datetime("2021-09-02 00:00:00").isoformat(),
+        "energy_statistic_ids": ["test:total_energy_import"],
+        "co2_statistic_id": "test:co2_ratio_missing",
+        "period": "hour",
+    }
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["result"] == {period1.isoformat(): pytest.approx(2.0)}
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["result"] == {period1.isoformat(): pytest.approx(2.0)}
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert cache.size > 0
+
+    # Importing statistics drops the result
+    async_add_external_statistics(
+        hass,
+        metadata,
+        ({"start": period2, "last_reset": None, "state": 1, "sum": 5},),
+    )
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert cache.size == 0
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["result"] == {
+        period1.isoformat(): pytest.approx(2.0),
+        period2.isoformat(): pytest.approx(3.0),
+    }
+    assert (cache.misses, cache.hits) == (2, 1)
+
+    # Purging only drops the results of the short term statistics
+    await hass.services.async_call("recorder", "purge", {"keep_days": 0}, blocking=True)
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert (cache.misses, cache.hits) == (2, 2)
+
+
 @pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
 async def test_fossil_energy_consumption_hole(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
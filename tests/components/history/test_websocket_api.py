@@ -172,6 +172,69 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends chunks matching the full result."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow()
+    for minutes in range(0, 270, 30):
+        with freeze_time(start + timedelta(minutes=minutes)):
+            hass.states.async_set("sensor.one", minutes)
+            hass.states.async_set("sensor.two", minutes % 60)
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/history_during_period",
+        "start_time": start.isoformat(),
+        "end_time": (start + timedelta(hours=4, minutes=45)).isoformat(),
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "significant_changes_only": False,
+        "minimal_response": True,
+        "no_attributes": True,
+    }
+    states: dict[str, list] = {}
+    events = 0
+    with (
+        freeze_time(start + timedelta(hours=5)),
+        patch.object(websocket_api, "HISTORY_CHUNK_STATES", 1),
+    ):
+        await client.send_json_auto_id(request)
+        response = await client.receive_json()
+        assert response["success"]
+        expected = response["result"]
+
+        await client.send_json_auto_id({**request, "chunked": True})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+
+        while True:
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            events += 1
+            for entity_id, state_list in response["event"]["states"].items():
+                states.setdefault(entity_id, []).extend(state_list)
+            if response["event"]["complete"]:
+                break
+
+    assert len(expected["sensor.one"]) == 8
+    assert events > 2
+    assert states == expected
+
+    # The subscription ends with the last chunk
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": response["id"]}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1,16 +1,25 @@
 """The tests for the InfluxDB component."""
 
+import asyncio
 from dataclasses import dataclass
 import datetime
+import gzip
 from http import HTTPStatus
+from pathlib import Path
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from influxdb.line_protocol import make_lines
 import pytest
+import requests
+import requests_mock
 
 import homeassistant.components.influxdb as influxdb
 from homeassistant.components.influxdb.const import DEFAULT_BUCKET
+from homeassistant.components.influxdb.line_protocol import generate_state_to_line
+from homeassistant.components.influxdb.writer import WriteBuffer
 from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.setup import async_setup_component
 
 INFLUX_PATH = "homeassistant.components.influxdb"
@@ -1687,3 +1696,183 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize("precision", [None, "ns", "us", "ms", "s"])
+async def test_line_protocol(hass: HomeAssistant, precision) -> None:
+    """Test states are encoded to the lines the client writes for their json."""
+    conf = influxdb.CONFIG_SCHEMA(
+        {
+            "influxdb": {
+                "tags": {"instance": "my home"},
+                "tags_attributes": ["friendly_name", "empty"],
+                "default_measurement": "state",
+            }
+        }
+    )[influxdb.DOMAIN]
+    state_to_json = influxdb._generate_state_to_json(conf)
+    state_to_line = generate_state_to_line(state_to_json, precision)
+
+    hass.states.async_set(
+        "sensor.temperature",
+        "21.5",
+        {
+            "unit_of_measurement": "°C",
+            "friendly_name": 'Living room, "north" = warm',
+            "empty": "",
+            "note": 'back\\slash "quoted"\nnext line',
+            "count": 3,
+            "on": True,
+        },
+    )
+    hass.states.async_set("light.kitchen", STATE_ON, {"friendly_name": "Kitchen"})
+    hass.states.async_set("light.unknown", "unknown")
+
+    for entity_id in ("sensor.temperature", "light.kitchen"):
+        state = hass.states.get(entity_id)
+        json = state_to_json(state)
+        json["time"] = state.last_updated
+        expected = make_lines(
+            {"points": [json]}, precision=influxdb.V1_PRECISION.get(precision)
+        )
+        assert state_to_line(state) == expected.rstrip("\n")
+
+    assert state_to_line(hass.states.get("light.unknown")) is None
+
+
+async def test_batching(
+    hass: HomeAssistant, requests_mock: requests_mock.Mocker, tmp_path: Path
+) -> None:
+    """Test batches of line protocol are written compressed."""
+    hass.config.config_dir = str(tmp_path)
+    requests_mock.post("http://localhost:8086/write", status_code=204)
+    config = {"influxdb": {"batching": {"batch_timeout": 0}, "precision": "s"}}
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    requests_mock.reset_mock()
+
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    lines = b"".join(
+        gzip.decompress(request.body) for request in requests_mock.request_history
+    ).decode()
+    timestamp = int(hass.states.get("sensor.two").last_updated.timestamp())
+    assert (
+        lines.splitlines()[-1] == f"W,domain=sensor,entity_id=two value=2.0 {timestamp}"
+    )
+    request = requests_mock.last_request
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert request.qs == {"db": ["home_assistant"], "precision": ["s"]}
+
+    for entity_id in (
+        "sensor.influxdb_queue_depth",
+        "sensor.influxdb_buffered_events",
+        "sensor.influxdb_dropped_events",
+    ):
+        assert hass.states.get(entity_id).state == "0"
+
+
+async def test_batching_buffers_while_unreachable(
+    hass: HomeAssistant,
+    requests_mock: requests_mock.Mocker,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test batches are buffered on disk and written once InfluxDB is back."""
+    monkeypatch.setattr(f"{INFLUX_PATH}.writer.RETRY_DELAY", 0.01)
+    hass.config.config_dir = str(tmp_path)
+    requests_mock.post("http://localhost:8086/write", status_code=204)
+    config = {
+        "influxdb": {
+            "batching": {"batch_timeout": 0},
+            "exclude": {"entity_globs": ["sensor.influxdb_*"]},
+        }
+    }
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+
+    requests_mock.post(
+        "http://localhost:8086/write", exc=requests.exceptions.ConnectionError
+    )
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    hass.states.async_set("sensor.two", "2")
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    await async_update_entity(hass, "sensor.influxdb_buffered_events")
+    assert hass.states.get("sensor.influxdb_buffered_events").state == "2"
+    assert len(list((tmp_path / ".storage" / "influxdb_buffer").iterdir())) == 2
+
+    requests_mock.reset_mock()
+    requests_mock.post("http://localhost:8086/write", status_code=204)
+    # The buffered batches are written on the next retry
+    writer = hass.data[influxdb.DOMAIN]
+    for _ in range(100):
+        await async_wait_for_queue_to_process(hass)
+        if not writer.buffer:
+            break
+        await asyncio.sleep(0.01)
+
+    lines = [
+        gzip.decompress(request.body).decode()
+        for request in requests_mock.request_history
+    ]
+    assert [line.split(" ")[0] for line in lines] == [
+        "sensor.one,domain=sensor,entity_id=one",
+        "sensor.two,domain=sensor,entity_id=two",
+    ]
+    assert not list((tmp_path / ".storage" / "influxdb_buffer").iterdir())
+    await async_update_entity(hass, "sensor.influxdb_buffered_events")
+    assert hass.states.get("sensor.influxdb_buffered_events").state == "0"
+
+
+@pytest.mark.parametrize("mock_client", [influxdb.API_VERSION_2], indirect=True)
+async def test_batching_v2(hass: HomeAssistant, mock_client, tmp_path: Path) -> None:
+    """Test batches of line protocol are written with the V2 API."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"batching": {"batch_timeout": 0}}
+    config.update(BASE_V2_CONFIG)
+    await _setup(hass, mock_client, config, _get_write_api_mock_v2)
+    assert mock_client.call_args.kwargs["enable_gzip"] is True
+
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    write_api = _get_write_api_mock_v2(mock_client)
+    assert write_api.call_args == call(bucket=DEFAULT_BUCKET, record=ANY)
+    assert write_api.call_args.kwargs["record"].startswith(
+        "sensor.one,domain=sensor,entity_id=one value=1.0 "
+    )
+
+
+def test_write_buffer(tmp_path: Path) -> None:
+    """Test the buffer drops the oldest batches when it is full."""
+    buffer = WriteBuffer(str(tmp_path), 60)
+    buffer.append("first", 1)
+    buffer.append("second", 2)
+    assert len(buffer) == 2
+    assert buffer.events == 3
+    buffer.append("third", 3)
+    assert buffer.dropped == 1
+    assert buffer.events == 5
+    buffer.append("".join(str(hash(str(number))) for number in range(50)), 4)
+    assert buffer.dropped == 5
+
+    buffer = WriteBuffer(str(tmp_path), 60)
+    buffer.load()
+    assert buffer.events == 5
+    assert buffer.peek() == ("second", 2)
+    buffer.pop()
+    buffer.append("fourth", 1)
+    assert buffer.peek() == ("third", 3)
+    buffer.pop()
+    assert buffer.peek() == ("fourth", 1)
+    buffer.pop()
+    assert buffer.peek() is None
+    assert not list(tmp_path.iterdir())
@@ -15,7 +15,11 @@ import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import (
     MessageCallbackType,
@@ -1329,6 +1333,59 @@ async def test_subscribe_special_characters(
     assert calls[0].payload == payload
 
 
+def test_subscription_trie() -> None:
+    """Test wildcard subscriptions are matched and pruned by the trie."""
+    trie = SubscriptionTrie()
+    subscriptions = {
+        topic: Subscription(topic, ha.HassJob(lambda msg: None))
+        for topic in (
+            "#",
+            "+",
+            "home/+/temperature",
+            "home/#",
+            "home/+/+",
+            "home/kitchen/#",
+            "+/kitchen/temperature",
+            "$SYS/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+    assert len(trie) == len(subscriptions)
+    assert set(trie) == set(subscriptions.values())
+    assert "home/+/temperature" in trie
+    assert "home/+" not in trie
+
+    def matching(topic: str) -> set[str]:
+        return {subscription.topic for subscription in trie.match(topic)}
+
+    assert matching("home/kitchen/temperature") == {
+        "#",
+        "home/+/temperature",
+        "home/#",
+        "home/+/+",
+        "home/kitchen/#",
+        "+/kitchen/temperature",
+    }
+    assert matching("home") == {"#", "+", "home/#"}
+    assert matching("home/kitchen") == {"#", "home/#", "home/kitchen/#"}
+    assert matching("garden/kitchen/humidity") == {"#"}
+    assert matching("$SYS/broker/uptime") == {"$SYS/#"}
+    assert matching("$SYS") == {"$SYS/#"}
+
+    trie.remove(subscriptions["home/#"])
+    trie.remove(subscriptions["home/kitchen/#"])
+    assert matching("home/kitchen") == {"#"}
+    with pytest.raises(ValueError):
+        trie.remove(subscriptions["home/#"])
+
+    for topic, subscription in subscriptions.items():
+        if topic not in ("home/#", "home/kitchen/#"):
+            trie.remove(subscription)
+    assert len(trie) == 0
+    assert not trie._root.children
+
+
 @patch("homeassistant.components.mqtt.client.INITIAL_SUBSCRIBE_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.DISCOVERY_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.SUBSCRIBE_COOLDOWN", 0.0)
@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
+import threading
 from typing import Any
 from unittest import mock
 
@@ -36,6 +37,7 @@ from homeassistant.components.climate import (
     ATTR_TARGET_TEMP_LOW,
 )
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES
+from homeassistant.components.prometheus.exposition import ExpositionCache
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
@@ -79,11 +81,12 @@ class FilterTest:
     should_pass: bool
 
 
-@pytest.fixture(name="client")
+@pytest.fixture(name="client", params=[False, True], ids=["registry", "prerender"])
 async def setup_prometheus_client(
     hass: HomeAssistant,
     hass_client: ClientSessionGenerator,
     namespace: str,
+    request: pytest.FixtureRequest,
 ):
     """Initialize an hass_client with Prometheus component."""
     # Reset registry
@@ -92,7 +95,7 @@ async def setup_prometheus_client(
     prometheus_client.PlatformCollector(registry=prometheus_client.REGISTRY)
     prometheus_client.GCCollector(registry=prometheus_client.REGISTRY)
 
-    config = {}
+    config = {prometheus.CONF_PRERENDER: request.param}
     if namespace is not None:
         config[prometheus.CONF_PROM_NAMESPACE] = namespace
     assert await async_setup_component(
@@ -195,6 +198,54 @@ async def test_view_default_namespace(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics_gzip(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test the OpenMetrics format and gzip encoding are negotiated."""
+    headers = {
+        "Accept": "application/openmetrics-text; version=0.0.1",
+        "Accept-Encoding": "gzip",
+    }
+    resp = await client.get(prometheus.API_ENDPOINT, headers=headers)
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"] == (
+        "application/openmetrics-text; version=0.0.1; charset=utf-8"
+    )
+    assert resp.headers["content-encoding"] == "gzip"
+    body = (await resp.text()).split("\n")
+    assert body[-2:] == ["# EOF", ""]
+    assert body.count("# EOF") == 1
+    assert "# TYPE state_change counter" in body
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 1.0' in body
+    )
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+
+    set_state_with_entry(hass, sensor_entities["sensor_1"], 16.1)
+    await hass.async_block_till_done()
+    resp = await client.get(prometheus.API_ENDPOINT, headers=headers)
+    body = (await resp.text()).split("\n")
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 2.0' in body
+    )
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 16.1' in body
+    )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
@@ -1940,3 +1991,33 @@ async def test_filtered_denylist(
         was_called = mock_client.labels.call_count == 1
         assert test.should_pass == was_called
         mock_client.labels.reset_mock()
+
+
+async def test_prerendered_metrics_changed_while_rendered(
+    hass: HomeAssistant,
+) -> None:
+    """Test a metric changed from a thread while it is rendered is not lost."""
+    cache = ExpositionCache()
+    metric = cache.metric("test_value", "Test", ["entity", "friendly_name"], False)
+    first = metric.labels(entity="sensor.first", friendly_name="First")
+    first.set(1)
+    second = metric.labels(entity="sensor.second", friendly_name="Second")
+    render = metric._render
+
+    def _render_and_change(entity_id: str) -> None:
+        render(entity_id)
+        if entity_id == "sensor.first":
+            # Blocks until the render is done, then marks the entities changed
+            thread = threading.Thread(target=second.set, args=(2,))
+            thread.start()
+            thread.join(0.1)
+            threads.append(thread)
+
+    threads: list[threading.Thread] = []
+    with mock.patch.object(metric, "_render", _render_and_change):
+        body = cache.async_snapshot(False)().decode()
+    threads[0].join()
+    assert 'test_value{entity="sensor.first",friendly_name="First"} 1.0\n' in body
+
+    body = cache.async_snapshot(False)().decode()
+    assert 'test_value{entity="sensor.second",friendly_name="Second"} 2.0\n' in body
@@ -0,0 +1,85 @@
+"""The tests for the recorder context origins manager."""
+
+from __future__ import annotations
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import ContextOrigins, Events
+from homeassistant.components.recorder.table_managers.context_origins import (
+    ContextOriginsManager,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.util.ulid import ulid_to_bytes
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_context_origins_are_the_first_row_of_each_context(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test only the first event or state of a context is indexed."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    event_context = Context()
+    state_context = Context()
+
+    hass.bus.async_fire("first_event", context=event_context)
+    hass.states.async_set("light.kitchen", "on", context=event_context)
+    await async_wait_recording_done(hass)
+    hass.bus.async_fire("second_event", context=event_context)
+    hass.states.async_set("light.kitchen", "off", context=state_context)
+    hass.bus.async_fire("third_event", context=state_context)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        origins = {
+            origin.context_id_bin: origin for origin in session.query(ContextOrigins)
+        }
+        first_event = (
+            session.query(Events)
+            .filter(Events.context_id_bin == ulid_to_bytes(event_context.id))
+            .order_by(Events.time_fired_ts)
+            .first()
+        )
+
+        event_origin = origins[ulid_to_bytes(event_context.id)]
+        assert event_origin.event_id == first_event.event_id
+        assert event_origin.state_id is None
+        assert event_origin.time_fired_ts == first_event.time_fired_ts
+        state_origin = origins[ulid_to_bytes(state_context.id)]
+        assert state_origin.event_id is None
+        assert state_origin.state_id is not None
+
+        assert instance.context_origins_manager.get_indexed_since(session) == 0
+
+
+async def test_indexed_since_with_rows_older_than_the_index(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the index only covers the period after the oldest indexed context."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    hass.bus.async_fire("indexed_event")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        indexed_since = session.query(ContextOrigins.time_fired_ts).order_by(
+            ContextOrigins.time_fired_ts
+        )[0][0]
+        session.add(
+            Events(
+                time_fired_ts=indexed_since - 3600,
+                context_id_bin=ulid_to_bytes(Context().id),
+            )
+        )
+
+    manager = ContextOriginsManager(instance)
+    with session_scope(hass=hass, read_only=True) as session:
+        # The index is not used until the recorded contexts are indexed
+        assert manager.get_indexed_since(session) is None
+        manager.active = True
+        assert manager.get_indexed_since(session) == indexed_since
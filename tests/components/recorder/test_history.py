@@ -23,6 +23,12 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.history import legacy
+from homeassistant.components.recorder.history.cache import (
+    EVICT_TO_FRACTION,
+    ROW_SIZE,
+    CachedStateRow,
+    HistoryCache,
+)
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.models.legacy import (
     LegacyLazyState,
@@ -1103,6 +1109,135 @@ def test_state_changes_during_period_multiple_entities_single_test(
         assert hist[entity_id][0].state == value
 
 
+def test_history_cache_matches_database(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test history served from the history cache matches the database."""
+    hass = hass_recorder({recorder.CONF_HISTORY_CACHE_MAX_MEMORY: 1})
+    instance = recorder.get_instance(hass)
+    history_cache = instance.history_cache
+    assert history_cache is not None
+    zero, four, _ = record_states(hass)
+    one = zero + timedelta(seconds=1)
+    half = one + timedelta(seconds=0.5)
+    two = one + timedelta(seconds=1)
+    three = two + timedelta(seconds=1)
+    mp = "media_player.test"
+    therm = "thermostat.test"
+
+    def _summarize(hist):
+        return {
+            entity_id: [
+                state
+                if isinstance(state, dict)
+                else (state.state, state.last_changed, state.last_updated)
+                for state in states
+            ]
+            for entity_id, states in hist.items()
+        }
+
+    def _query_both(query, *args, **kwargs):
+        instance.history_cache = None
+        from_database = _summarize(query(hass, *args, no_attributes=True, **kwargs))
+        instance.history_cache = history_cache
+        hits = history_cache.hits
+        from_cache = _summarize(query(hass, *args, no_attributes=True, **kwargs))
+        assert from_cache == from_database
+        return history_cache.hits > hits
+
+    for start, end, entity_ids, kwargs, served_from_cache in (
+        (two, four, [mp, therm], {}, True),
+        (two, three, [mp], {"significant_changes_only": False}, True),
+        (two, None, [mp, therm], {"minimal_response": True}, True),
+        (
+            two,
+            None,
+            [mp, therm],
+            {"minimal_response": True, "compressed_state_format": True},
+            True,
+        ),
+        (two, four, [mp], {"include_start_time_state": False}, True),
+        # There is no state in the cache before the start time
+        (zero, four, [mp, therm], {}, False),
+    ):
+        assert (
+            _query_both(
+                history.get_significant_states, start, end, entity_ids, **kwargs
+            )
+            is served_from_cache
+        )
+
+    for start, limit in ((two, None), (half, 1), (half, None)):
+        assert _query_both(
+            history.state_changes_during_period, start, four, mp, limit=limit
+        )
+
+    # Attributes are not cached
+    hits = history_cache.hits
+    history.get_significant_states(hass, two, four, [mp, therm])
+    assert history_cache.hits == hits
+
+
+def test_history_cache_eviction() -> None:
+    """Test the history cache evicts the oldest states when full."""
+    cache = HistoryCache(ROW_SIZE * 100)
+    start = cache.complete_since
+    metadata_ids = {"sensor.one": 1, "sensor.two": 2}
+
+    def _rows(start_time_ts):
+        return cache.get_rows(
+            metadata_ids, start_time_ts, None, True, None, False, (), False
+        )
+
+    for idx in range(60):
+        cache.add("sensor.one", str(idx), start + idx, None)
+        cache.add("sensor.two", "on", start + idx + 0.5, start)
+    assert cache.memory <= ROW_SIZE * 100
+    assert cache.complete_since > start
+    assert _rows(start + 1) is None
+    rows = _rows(cache.complete_since)
+    assert rows is not None
+    assert rows[0].metadata_id == 1
+    assert rows[0].last_updated_ts == 0
+    assert rows[-1] == CachedStateRow(2, "on", start + 59.5, None)
+
+    cache.evict_before(start + 55)
+    assert cache.complete_since == start + 55
+    assert _rows(start + 55) is None
+    assert [row.state for row in _rows(start + 56.2)] == [
+        "56",
+        "57",
+        "58",
+        "59",
+        "on",
+        "on",
+        "on",
+        "on",
+        "on",
+    ]
+
+    cache.clear()
+    assert cache.memory == 0
+    # The states at the start time are no longer known
+    assert _rows(cache.complete_since) is None
+
+
+def test_history_cache_eviction_target() -> None:
+    """Test the history cache evicts down to near its target size."""
+    max_memory = 200000
+    cache = HistoryCache(max_memory)
+    start = complete_since = cache.complete_since
+    evictions = 0
+    for idx in range(20000):
+        # Unique states so the interned states take most of the memory
+        cache.add(f"sensor.test_{idx % 10}", f"{idx}.5", start + idx, None)
+        if cache.complete_since != complete_since:
+            complete_since = cache.complete_since
+            evictions += 1
+            assert max_memory * 0.5 <= cache.memory <= max_memory * EVICT_TO_FRACTION
+    assert evictions > 2
+
+
 @pytest.mark.freeze_time("2039-01-19 03:14:07.555555-00:00")
 async def test_get_full_significant_states_past_year_2038(
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -19,6 +19,7 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_WRITE,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -32,6 +33,7 @@ from homeassistant.components.recorder import (
     pool,
     statistics,
 )
+from homeassistant.components.recorder.bulk_writer import BulkWriter
 from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
@@ -343,6 +345,155 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_reading_from_read_database(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test read only sessions use the read database and jobs are timed."""
+    if not recorder_db_url.startswith("sqlite://"):
+        # The replica would need to be set up by the database server
+        return
+    # The read database must be the same file, in memory databases are
+    # separate for each engine
+    recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            recorder.CONF_DB_URL: recorder_db_url,
+            recorder.CONF_DB_READ_URL: recorder_db_url,
+        },
+    )
+    assert instance.read_engine is not None
+    assert instance.read_engine is not instance.engine
+
+    hass.states.async_set("test.recorder", "on")
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> list[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is instance.read_engine
+            return [db_state.state for db_state in session.query(States)]
+
+    assert await instance.async_add_executor_job(_read_states) == ["on"]
+    assert await instance.async_add_executor_job(_read_states) == ["on"]
+
+    stats = instance.executor_job_timer.as_dict()["_read_states"]
+    assert stats["count"] == 2
+    assert stats["wait_time"] >= stats["max_wait_time"] >= 0
+    assert stats["run_time"] > 0
+
+    with session_scope(hass=hass) as session:
+        assert session.get_bind() is instance.engine
+
+
+async def test_saving_states_and_events_with_bulk_write(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the bulk write path links old states and deduplicates shared rows."""
+    instance = await async_setup_recorder_instance(hass, {CONF_BULK_WRITE: True})
+    assert instance._bulk_writer is not None
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    for state in ("on", "off", "on"):
+        hass.states.async_set("test.recorder", state, attributes)
+        hass.states.async_set("test.other", state, attributes)
+        hass.bus.async_fire("test_bulk_event", {"some": "data"})
+    hass.states.async_remove("test.other")
+    await async_wait_recording_done(hass)
+    assert not instance.event_session.new
+
+    hass.states.async_set("test.recorder", "off", attributes)
+    hass.bus.async_fire("test_bulk_event", {"some": "data"})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata_ids = {
+            states_meta.entity_id: states_meta.metadata_id
+            for states_meta in session.query(StatesMeta)
+        }
+        db_states = session.query(States).order_by(States.state_id).all()
+        recorder_states = [
+            db_state
+            for db_state in db_states
+            if db_state.metadata_id == metadata_ids["test.recorder"]
+        ]
+        assert [db_state.state for db_state in recorder_states] == [
+            "on",
+            "off",
+            "on",
+            "off",
+        ]
+        assert recorder_states[0].old_state_id is None
+        for previous, db_state in zip(recorder_states, recorder_states[1:]):
+            assert db_state.old_state_id == previous.state_id
+        other_states = [
+            db_state
+            for db_state in db_states
+            if db_state.metadata_id == metadata_ids["test.other"]
+        ]
+        assert [db_state.state for db_state in other_states] == [
+            "on",
+            "off",
+            "on",
+            None,
+        ]
+        assert other_states[-1].old_state_id == other_states[-2].state_id
+        assert (
+            len(
+                {
+                    db_state.attributes_id
+                    for db_state in (*recorder_states, *other_states[:3])
+                }
+            )
+            == 1
+        )
+
+        db_events = (
+            session.query(Events)
+            .filter(
+                Events.event_type_id.in_(select_event_type_ids(("test_bulk_event",)))
+            )
+            .all()
+        )
+        assert len(db_events) == 4
+        assert len({db_event.data_id for db_event in db_events}) == 1
+
+
+async def test_saving_states_with_bulk_write_retried(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a failed bulk write is retried without duplicating shared rows."""
+    instance = await async_setup_recorder_instance(hass, {CONF_BULK_WRITE: True})
+    insert_states = BulkWriter._insert_states
+    failures = 0
+
+    def _insert_states_once(self, session, states):
+        nonlocal failures
+        if not failures:
+            failures += 1
+            raise OperationalError("insert the states", "fake params", "forced")
+        insert_states(self, session, states)
+
+    with (
+        patch.object(instance, "db_retry_wait", 0),
+        patch.object(BulkWriter, "_insert_states", _insert_states_once),
+    ):
+        hass.states.async_set("test.recorder", "on", {"test_attr": 5})
+        hass.states.async_set("test.recorder", "off", {"test_attr": 5})
+        await async_wait_recording_done(hass)
+
+    assert failures == 1
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesMeta).count() == 1
+        assert session.query(StateAttributes).count() == 1
+        db_states = session.query(States).order_by(States.state_id).all()
+        assert [db_state.state for db_state in db_states] == ["on", "off"]
+        assert db_states[1].old_state_id == db_states[0].state_id
+        assert db_states[0].metadata_id == db_states[1].metadata_id
+
+
 async def test_saving_state_with_intermixed_time_changes(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
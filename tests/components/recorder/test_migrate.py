@@ -24,8 +24,19 @@ from homeassistant.components import persistent_notification as pn, recorder
 from homeassistant.components.recorder import db_schema, migration
 from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
+    ContextOrigins,
+    Events,
+    MigrationChanges,
     RecorderRuns,
     States,
+    Statistics,
+    StatisticsDaily,
+    StatisticsMeta,
+    StatisticsMonthly,
+    StatisticsWeekly,
+)
+from homeassistant.components.recorder.table_managers.context_origins import (
+    ContextOriginsManager,
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant
@@ -468,6 +479,118 @@ def test_forgiving_add_column(recorder_db_url: str) -> None:
     engine.dispose()
 
 
+def test_context_origins_backfill(recorder_db_url: str, hass: HomeAssistant) -> None:
+    """Test the context origins migration indexes the first row of every context."""
+    engine = create_engine(recorder_db_url, poolclass=StaticPool)
+    db_schema.Base.metadata.create_all(engine)
+    ContextOrigins.__table__.drop(engine)
+    event_first, state_first, state_only = b"1" * 16, b"2" * 16, b"3" * 16
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Events(event_id=1, time_fired_ts=10, context_id_bin=event_first),
+                Events(event_id=2, time_fired_ts=11, context_id_bin=event_first),
+                States(state_id=1, last_updated_ts=12, context_id_bin=event_first),
+                Events(event_id=3, time_fired_ts=21, context_id_bin=state_first),
+                States(state_id=2, last_updated_ts=20, context_id_bin=state_first),
+                States(state_id=3, last_updated_ts=30, context_id_bin=state_only),
+            ]
+        )
+        session.commit()
+
+    migration._apply_update(Mock(), hass, engine, lambda: Session(engine), 43, 42)
+
+    with Session(engine) as session:
+        # The recorder indexed a later row of a context while migrating
+        session.add(
+            ContextOrigins(context_id_bin=state_first, time_fired_ts=21, event_id=3)
+        )
+        session.commit()
+
+    instance = Mock(get_session=lambda: Session(engine), max_bind_vars=2)
+    instance.context_origins_manager = ContextOriginsManager(instance)
+    batches = 1
+    while not migration.migrate_context_origins(instance):
+        batches += 1
+    # Two batches of each table and one to find there is nothing left
+    assert batches == 6
+    assert instance.context_origins_manager.active is True
+
+    with Session(engine) as session:
+        assert {
+            origin.context_id_bin: (
+                origin.event_id,
+                origin.state_id,
+                origin.time_fired_ts,
+            )
+            for origin in session.query(ContextOrigins)
+        } == {
+            event_first: (1, None, 10),
+            state_first: (None, 2, 20),
+            state_only: (None, 3, 30),
+        }
+        assert (
+            session.query(MigrationChanges)
+            .filter_by(migration_id=migration.ContextOriginsMigration.migration_id)
+            .one()
+        )
+    engine.dispose()
+
+
+def test_statistics_rollups_backfill(recorder_db_url: str, hass: HomeAssistant) -> None:
+    """Test the schema 44 migration rolls up the hourly statistics."""
+    engine = create_engine(recorder_db_url, poolclass=StaticPool)
+    db_schema.Base.metadata.create_all(engine)
+    for table in (StatisticsDaily, StatisticsWeekly, StatisticsMonthly):
+        table.__table__.drop(engine)
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00")).timestamp()
+    with Session(engine) as session:
+        session.add(StatisticsMeta(id=1, statistic_id="sensor.test", source="test"))
+        session.add_all(
+            Statistics(
+                metadata_id=1,
+                start_ts=start + hour * 3600,
+                mean=hour,
+                min=hour,
+                max=hour,
+                sum=hour,
+            )
+            for hour in range(0, 24 * 8, 6)
+        )
+        session.commit()
+
+    migration._apply_update(Mock(), hass, engine, lambda: Session(engine), 44, 43)
+
+    with Session(engine) as session:
+        days = session.query(StatisticsDaily).order_by(StatisticsDaily.start_ts).all()
+        assert [
+            (day.start_ts, day.mean, day.mean_weight, day.min, day.max, day.sum)
+            for day in days[:2]
+        ] == [
+            (start, 9, 4, 0, 18, 18),
+            (start + 86400, 33, 4, 24, 42, 42),
+        ]
+        assert len(days) == 8
+        assert [
+            (week.start_ts, week.mean, week.mean_weight, week.sum)
+            for week in session.query(StatisticsWeekly).order_by(
+                StatisticsWeekly.start_ts
+            )
+        ] == [(start, 81, 28, 162), (start + 7 * 86400, 177, 4, 186)]
+        assert [
+            (month.start_ts, month.mean_weight)
+            for month in session.query(StatisticsMonthly)
+        ] == [
+            (
+                dt_util.as_utc(
+                    dt_util.parse_datetime("2022-10-01 00:00:00")
+                ).timestamp(),
+                32,
+            )
+        ]
+    engine.dispose()
+
+
 def test_forgiving_add_index(recorder_db_url: str) -> None:
     """Test that add index will continue if index exists."""
     engine = create_engine(recorder_db_url, poolclass=StaticPool)
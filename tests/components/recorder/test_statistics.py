@@ -1854,6 +1854,75 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+def test_statistics_rollups(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test the statistics rollups match reducing the hourly statistics."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    wait_recording_done(hass)
+
+    zero = dt_util.utcnow()
+    external_statistics = [
+        {
+            "start": zero + timedelta(hours=hour),
+            "last_reset": None,
+            "max": hour % 24,
+            "mean": hour % 7,
+            "min": -(hour % 13),
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(0, 24 * 45, 5)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    def _statistics_during_period(
+        period: str, rollups_valid: bool
+    ) -> dict[str, list[dict]]:
+        instance.statistics_rollups_valid = rollups_valid
+        return statistics_during_period(
+            hass,
+            zero + timedelta(days=3),
+            zero + timedelta(days=40),
+            statistic_ids={"test:total_energy_import"},
+            period=period,
+            types={"change", "last_reset", "max", "mean", "min", "state", "sum"},
+        )
+
+    for period in ("day", "week", "month"):
+        from_rollups = _statistics_during_period(period, True)
+        assert from_rollups["test:total_energy_import"]
+        assert from_rollups == _statistics_during_period(period, False)
+
+    # The rollups no longer line up with the days after the time zone changed
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Vienna"))
+    from_hourly = _statistics_during_period("day", False)
+    with patch.object(
+        statistics,
+        "rebuild_statistics_rollups_with_session",
+        wraps=statistics.rebuild_statistics_rollups_with_session,
+    ) as rebuild_mock:
+        assert _statistics_during_period("day", True) == from_hourly
+        assert instance.statistics_rollups_valid is False
+        wait_recording_done(hass)
+    assert len(rebuild_mock.mock_calls) == 1
+    assert instance.statistics_rollups_valid is True
+    assert _statistics_during_period("day", True) == from_hourly
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -2,6 +2,7 @@
 
 import datetime
 from datetime import timedelta
+from pathlib import Path
 from statistics import fmean
 import threading
 from unittest.mock import ANY, patch
@@ -10,7 +11,7 @@ from freezegun import freeze_time
 import pytest
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, statistics_cache
 from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
@@ -38,7 +39,7 @@ from .common import (
 )
 
 from tests.common import async_fire_time_changed
-from tests.typing import WebSocketGenerator
+from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
 
 DISTANCE_SENSOR_FT_ATTRIBUTES = {
     "device_class": "distance",
@@ -215,6 +216,275 @@ async def test_statistics_during_period(
     }
 
 
+@pytest.mark.parametrize("period", ["hour", "day", "month"])
+async def test_statistics_during_period_chunked(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    period: str,
+) -> None:
+    """Test statistics_during_period sends chunks matching the full result."""
+    start = dt_util.as_utc(
+        dt_util.start_of_local_day(dt_util.now() - timedelta(days=40))
+    )
+    end = start + timedelta(days=38, hours=5)
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(24 * 39)
+    ]
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "recorder/statistics_during_period",
+        "start_time": (start + timedelta(hours=1)).isoformat(),
+        "end_time": end.isoformat(),
+        "statistic_ids": ["test:total_energy_import"],
+        "period": period,
+        "types": ["change", "state", "sum"],
+    }
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]["test:total_energy_import"]
+
+    with patch(
+        "homeassistant.components.recorder.websocket_api.STATISTICS_CHUNK_ROWS", 24
+    ):
+        await client.send_json_auto_id({**request, "chunked": True})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+
+        rows = []
+        events = 0
+        while True:
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            events += 1
+            rows.extend(
+                response["event"]["statistics"].get("test:total_energy_import", [])
+            )
+            if response["event"]["complete"]:
+                break
+
+    assert events > 1
+    assert rows == expected
+
+    # The subscription ends with the last chunk
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": response["id"]}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
+async def test_statistics_during_period_shared_result(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test statistics_during_period results are shared until statistics change."""
+    start = dt_util.as_utc(
+        dt_util.start_of_local_day(dt_util.now() - timedelta(days=2))
+    )
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [{"start": start, "last_reset": None, "state": 1, "sum": 1}],
+    )
+    await async_wait_recording_done(hass)
+    cache = recorder_mock.statistics_result_cache
+
+    client = await hass_ws_client()
+    request = {
+        "type": "recorder/statistics_during_period",
+        "start_time": start.isoformat(),
+        "statistic_ids": ["test:total_energy_import"],
+        "period": "day",
+        "types": ["sum"],
+    }
+    with patch(
+        "homeassistant.components.recorder.websocket_api.statistics_during_period",
+        wraps=recorder.statistics.statistics_during_period,
+    ) as statistics_during_period_mock:
+        # Both requests are sent before the first result is computed
+        await client.send_json_auto_id(request)
+        await client.send_json_auto_id(request)
+        responses = [await client.receive_json(), await client.receive_json()]
+        assert statistics_during_period_mock.call_count == 1
+    assert [response["result"] for response in responses] == [
+        {"test:total_energy_import": [ANY]}
+    ] * 2
+    assert responses[0]["result"]["test:total_energy_import"][0]["sum"] == 1
+    assert (cache.misses, cache.hits) == (1, 1)
+
+    # Importing statistics invalidates the result
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [
+            {
+                "start": start + timedelta(hours=1),
+                "last_reset": None,
+                "state": 2,
+                "sum": 2,
+            }
+        ],
+    )
+    await async_wait_recording_done(hass)
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["result"]["test:total_energy_import"][0]["sum"] == 2
+    assert (cache.misses, cache.hits) == (2, 1)
+
+    # Compiling short term statistics does not invalidate the hourly result
+    do_adhoc_statistics(hass, start=dt_util.utcnow().replace(minute=0))
+    await async_wait_recording_done(hass)
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["result"]["test:total_energy_import"][0]["sum"] == 2
+    assert (cache.misses, cache.hits) == (2, 2)
+
+
+async def test_statistics_during_period_shared_result_purged(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test short term statistics results are dropped when the database is purged."""
+    cache = recorder_mock.statistics_result_cache
+    client = await hass_ws_client()
+    request = {
+        "type": "recorder/statistics_during_period",
+        "start_time": (dt_util.utcnow() - timedelta(days=1)).isoformat(),
+        "statistic_ids": ["sensor.test"],
+        "period": "5minute",
+    }
+    await client.send_json_auto_id(request)
+    assert (await client.receive_json())["success"]
+    await client.send_json_auto_id(request)
+    assert (await client.receive_json())["success"]
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert cache.size > 0
+
+    await hass.services.async_call("recorder", "purge", {"keep_days": 0}, blocking=True)
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert cache.size == 0
+    await client.send_json_auto_id(request)
+    assert (await client.receive_json())["success"]
+    assert (cache.misses, cache.hits) == (2, 1)
+
+
+async def test_statistics_result_cache_size(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the statistics result cache only keeps results up to its size."""
+    cache = recorder_mock.statistics_result_cache
+    with (
+        patch.object(statistics_cache, "CACHE_MAX_BYTES", 10),
+        patch.object(statistics_cache, "MAX_RESULT_BYTES", 5),
+    ):
+        assert await cache.async_get("large", False, lambda: b"123456") == b"123456"
+        assert await cache.async_get("large", False, lambda: b"123456") == b"123456"
+        assert (cache.misses, cache.hits, cache.size) == (2, 0, 0)
+        for key in ("one", "two", "three"):
+            assert await cache.async_get(key, False, lambda: b"1234") == b"1234"
+        assert cache.size == 8
+        # The least recently used result was dropped
+        await cache.async_get("one", False, lambda: b"1234")
+        await cache.async_get("three", False, lambda: b"1234")
+        assert (cache.misses, cache.hits) == (6, 1)
+
+
+async def test_statistics_during_period_query_workers(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test hourly statistics are fetched by the query workers."""
+    if recorder_db_url.startswith("sqlite://"):
+        # The workers need to open the same database
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            recorder.CONF_DB_URL: recorder_db_url,
+            recorder.CONF_QUERY_WORKERS: 1,
+        },
+    )
+    assert instance.query_workers is not None
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy_import",
+            "unit_of_measurement": "kWh",
+        },
+        [
+            {"start": start + timedelta(hours=hour), "state": hour, "sum": hour}
+            for hour in range(3)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.websocket_api.statistics_during_period",
+    ) as statistics_during_period_mock:
+        await client.send_json_auto_id(
+            {
+                "type": "recorder/statistics_during_period",
+                "start_time": start.isoformat(),
+                "statistic_ids": ["test:total_energy_import"],
+                "period": "hour",
+                "units": {"energy": "Wh"},
+                "types": ["sum", "mean"],
+            }
+        )
+        response = await client.receive_json()
+    assert statistics_during_period_mock.call_count == 0
+    assert response["success"]
+    assert response["result"] == {
+        "test:total_energy_import": [
+            {
+                "start": int((start + timedelta(hours=hour)).timestamp() * 1000),
+                "end": int((start + timedelta(hours=hour + 1)).timestamp() * 1000),
+                "sum": hour * 1000,
+            }
+            for hour in range(3)
+        ]
+    }
+
+
 @pytest.mark.freeze_time(datetime.datetime(2022, 10, 21, 7, 25, tzinfo=datetime.UTC))
 @pytest.mark.parametrize("offset", [0, 1, 2])
 async def test_statistic_during_period(
@@ -2095,6 +2365,28 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_executor_stats(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the database executor job stats."""
+    client = await hass_ws_client()
+
+    def _job() -> None:
+        """Run a job."""
+
+    await recorder_mock.async_add_executor_job(_job)
+
+    await client.send_json_auto_id({"type": "recorder/executor_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["_job"] == {
+        "count": 1,
+        "wait_time": ANY,
+        "max_wait_time": ANY,
+        "run_time": ANY,
+    }
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1,13 +1,18 @@
 """Tests for Search integration."""
 
+from unittest.mock import patch
+
 import pytest
 
 from homeassistant.components import search
+from homeassistant.const import SERVICE_RELOAD
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import (
     area_registry as ar,
     device_registry as dr,
     entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
 )
 from homeassistant.setup import async_setup_component
 
@@ -588,3 +593,178 @@ async def test_ws_api(hass: HomeAssistant, hass_ws_client: WebSocketGenerator) -
         "config_entry": [hue_config_entry.entry_id],
         "area": [kitchen_area.id],
     }
+
+
+async def test_floor_and_label_lookup(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+    label_registry: lr.LabelRegistry,
+) -> None:
+    """Test floor and label based lookup."""
+    ground_floor = floor_registry.async_create("Ground floor")
+    label = label_registry.async_create("Downstairs")
+    living_room_area = area_registry.async_create(
+        "Living Room", floor_id=ground_floor.floor_id
+    )
+    entity_registry.async_get_or_create(
+        "light", "hue", "1234", suggested_object_id="ceiling"
+    )
+    entity_registry.async_update_entity("light.ceiling", labels={label.label_id})
+
+    assert await async_setup_component(
+        hass,
+        "script",
+        {
+            "script": {
+                "ground_floor_off": {
+                    "sequence": [
+                        {
+                            "service": "light.turn_off",
+                            "target": {"floor_id": ground_floor.floor_id},
+                        },
+                    ]
+                },
+                "downstairs_on": {
+                    "sequence": [
+                        {
+                            "service": "light.turn_on",
+                            "target": {"label_id": label.label_id},
+                        },
+                    ]
+                },
+            }
+        },
+    )
+
+    searcher = search.Searcher(
+        hass, device_registry, entity_registry, MOCK_ENTITY_SOURCES
+    )
+    assert searcher.async_search("floor", ground_floor.floor_id) == {
+        "area": {living_room_area.id},
+        "script": {"script.ground_floor_off"},
+    }
+
+    searcher = search.Searcher(
+        hass, device_registry, entity_registry, MOCK_ENTITY_SOURCES
+    )
+    assert searcher.async_search("label", label.label_id) == {
+        "entity": {"light.ceiling"},
+        "script": {"script.downstairs_on"},
+    }
+
+    searcher = search.Searcher(
+        hass, device_registry, entity_registry, MOCK_ENTITY_SOURCES
+    )
+    assert searcher.async_search("script", "script.downstairs_on") == {
+        "label": {label.label_id},
+    }
+
+
+async def test_index_follows_reload(hass: HomeAssistant) -> None:
+    """Test the references are updated when automations are reloaded."""
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": {
+                "alias": "hallway",
+                "trigger": {"platform": "state", "entity_id": "binary_sensor.door"},
+                "action": {"service": "light.turn_on", "entity_id": "light.hallway"},
+            }
+        },
+    )
+    assert await async_setup_component(
+        hass, "group", {"group": {"lights": {"entities": ["light.hallway"]}}}
+    )
+    await hass.async_block_till_done()
+
+    device_reg = dr.async_get(hass)
+    entity_reg = er.async_get(hass)
+
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.hallway") == {
+        "automation": {"automation.hallway"},
+        "group": {"group.lights"},
+    }
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            "automation": {
+                "alias": "hallway",
+                "trigger": {"platform": "state", "entity_id": "binary_sensor.door"},
+                "action": {"service": "light.turn_on", "entity_id": "light.porch"},
+            }
+        },
+    ):
+        await hass.services.async_call("automation", SERVICE_RELOAD, blocking=True)
+    await hass.services.async_call(
+        "group",
+        "set",
+        {"object_id": "lights", "entities": ["light.porch"]},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.hallway") == {}
+
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.porch") == {
+        "automation": {"automation.hallway"},
+        "group": {"group.lights"},
+    }
+
+
+async def test_ws_api_related_many(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test searching the related items of many items at once."""
+    assert await async_setup_component(hass, "search", {})
+
+    area_reg = ar.async_get(hass)
+    device_reg = dr.async_get(hass)
+
+    kitchen_area = area_reg.async_create("Kitchen")
+
+    hue_config_entry = MockConfigEntry(domain="hue")
+    hue_config_entry.add_to_hass(hass)
+
+    hue_device = device_reg.async_get_or_create(
+        config_entry_id=hue_config_entry.entry_id,
+        name="Light Strip",
+        identifiers=({"hue", "hue-1"}),
+    )
+
+    device_reg.async_update_device(hue_device.id, area_id=kitchen_area.id)
+
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "search/related_many",
+            "items": [
+                {"item_type": "device", "item_id": hue_device.id},
+                {"item_type": "area", "item_id": kitchen_area.id},
+                {"item_type": "entity", "item_id": "light.unknown"},
+            ],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == [
+        {
+            "config_entry": [hue_config_entry.entry_id],
+            "area": [kitchen_area.id],
+        },
+        {
+            "device": [hue_device.id],
+            "config_entry": [hue_config_entry.entry_id],
+        },
+        {},
+    ]
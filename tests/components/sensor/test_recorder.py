@@ -34,6 +34,7 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor.recorder import DATA_STATISTICS_AGGREGATOR
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -4026,6 +4027,193 @@ def test_compile_statistics_hourly_daily_monthly_summary(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_hourly_statistics_aggregated(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test statistics compiled from aggregated states match the history."""
+    # The recorder marks the last period as compiled when it starts
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=1
+    )
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    aggregator = hass.data[DATA_STATISTICS_AGGREGATOR]
+    with freeze_time(zero) as freezer:
+        four, states = record_states(hass, freezer, zero, "sensor.test1", attributes)
+    do_adhoc_statistics(hass, start=zero)
+    wait_recording_done(hass)
+    start = zero + timedelta(minutes=5)
+    end = start + timedelta(minutes=5)
+    # The state at the start of the first period is not known
+    assert (
+        aggregator.aggregate("sensor.test1", zero.timestamp(), start.timestamp())
+        is None
+    )
+
+    with freeze_time(zero) as freezer:
+        four, _states = record_states(hass, freezer, start, "sensor.test1", attributes)
+    states["sensor.test1"] += _states["sensor.test1"]
+    hist = history.get_significant_states(
+        hass, zero, four, hass.states.async_entity_ids()
+    )
+    assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
+    assert aggregator.aggregate("sensor.test1", start.timestamp(), end.timestamp()) == (
+        "°C",
+        -10.0,
+        30.0,
+        pytest.approx(13.333333),
+    )
+    # Only short term statistics periods are aggregated
+    assert (
+        aggregator.aggregate(
+            "sensor.test1",
+            start.timestamp() + 1,
+            end.timestamp() + 1,
+        )
+        is None
+    )
+
+    do_adhoc_statistics(hass, start=start)
+    wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(start).timestamp(),
+                "mean": pytest.approx(13.050847),
+                "min": pytest.approx(-10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "start": process_timestamp(start).timestamp(),
+                "end": process_timestamp(end).timestamp(),
+                "mean": pytest.approx(13.333333),
+                "min": pytest.approx(-10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ]
+    }
+
+    # States recorded out of order stop the sensor from being aggregated
+    with freeze_time(start) as freezer:
+        hass.states.set("sensor.test1", "20", attributes)
+        wait_recording_done(hass)
+    assert (
+        aggregator.aggregate("sensor.test1", start.timestamp(), end.timestamp()) is None
+    )
+
+
+def test_compile_missing_statistics_from_history_window(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test missed periods are compiled from the history of a window of periods."""
+    # The recorder marks the last period as compiled when it starts
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=1
+    )
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    # The aggregated states are lost when Home Assistant is restarted
+    hass.data.pop(DATA_STATISTICS_AGGREGATOR)
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    periods = [zero + timedelta(minutes=minutes) for minutes in (0, 5, 10)]
+    with freeze_time(zero) as freezer:
+        for start in periods:
+            record_states(hass, freezer, start, "sensor.test1", attributes)
+
+    with freeze_time(zero + timedelta(hours=2)), patch(
+        "homeassistant.components.sensor.recorder.history.get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        for start in periods:
+            do_adhoc_statistics(hass, start=start)
+        wait_recording_done(hass)
+    assert get_history.call_count == 1
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    # The state at the start of the first period is not known
+    assert [
+        (stat["min"], stat["max"], stat["mean"]) for stat in stats["sensor.test1"]
+    ] == [
+        (pytest.approx(-10.0), pytest.approx(30.0), pytest.approx(13.050847)),
+        (pytest.approx(-10.0), pytest.approx(30.0), pytest.approx(13.333333)),
+        (pytest.approx(-10.0), pytest.approx(30.0), pytest.approx(13.333333)),
+    ]
+
+
+def test_compile_hourly_statistics_aggregated_unavailable(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test aggregated statistics of a sensor which was unavailable."""
+    # The recorder marks the last period as compiled when it starts
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=1
+    )
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    aggregator = hass.data[DATA_STATISTICS_AGGREGATOR]
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    with freeze_time(zero) as freezer:
+        for minutes, state in (
+            (1, "10"),
+            # Unavailable across the start of the second period
+            (4, STATE_UNAVAILABLE),
+            (7, "20"),
+            (9, "30"),
+            # Unavailable within the third period
+            (11, STATE_UNAVAILABLE),
+            (13, "40"),
+        ):
+            freezer.move_to(zero + timedelta(minutes=minutes))
+            hass.states.set("sensor.test1", state, attributes)
+        wait_recording_done(hass)
+
+    periods = [zero + timedelta(minutes=minutes) for minutes in (5, 10, 15)]
+    # The mean of the second period starts with the first value after the
+    # sensor was unavailable, the unavailable state within the third period
+    # is skipped like it is when compiling from history
+    assert aggregator.aggregate(
+        "sensor.test1", periods[0].timestamp(), periods[1].timestamp()
+    ) == ("°C", 20.0, 30.0, pytest.approx(70 / 3))
+    assert aggregator.aggregate(
+        "sensor.test1", periods[1].timestamp(), periods[2].timestamp()
+    ) == ("°C", 30.0, 40.0, pytest.approx(34.0))
+
+    for start in periods[:2]:
+        do_adhoc_statistics(hass, start=start)
+    wait_recording_done(hass)
+    stats = statistics_during_period(hass, periods[0], period="5minute")
+    assert [
+        (stat["min"], stat["max"], stat["mean"]) for stat in stats["sensor.test1"]
+    ] == [
+        (pytest.approx(20.0), pytest.approx(30.0), pytest.approx(70 / 3)),
+        (pytest.approx(30.0), pytest.approx(40.0), pytest.approx(34.0)),
+    ]
+
+
 def record_states(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -429,6 +429,44 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_segment_shares_part_data(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test the parts of a complete segment are views of the segment data."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    hls_client = await hls_stream(stream)
+
+    segment = Segment(sequence=0, init=INIT_BYTES, _stream_outputs=[hls])
+    await hass.async_block_till_done()
+    segment.async_add_part(Part(duration=1, has_keyframe=True, data=b"part-0"), 0)
+    assert segment.get_data() == b"part-0"
+    segment.async_add_part(
+        Part(duration=1, has_keyframe=False, data=b"part-1"), SEGMENT_DURATION
+    )
+
+    data = segment.get_data()
+    assert data == b"part-0part-1"
+    assert segment.get_data() is data
+    assert [part.data for part in segment.parts] == [b"part-0", b"part-1"]
+    assert all(
+        isinstance(part.data, memoryview) and part.data.obj is data
+        for part in segment.parts
+    )
+    assert segment.data_size == len(data)
+
+    segment_response = await hls_client.get("/segment/0.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert await segment_response.read() == b"part-0part-1"
+    part_response = await hls_client.get("/segment/0.1.m4s")
+    assert part_response.status == HTTPStatus.OK
+    assert await part_response.read() == b"part-1"
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
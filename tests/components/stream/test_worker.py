@@ -41,6 +41,7 @@ from homeassistant.components.stream.const import (
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 from homeassistant.components.stream.core import Orientation, StreamSettings
+from homeassistant.components.stream.diagnostics import Diagnostics
 from homeassistant.components.stream.worker import (
     StreamEndedError,
     StreamState,
@@ -291,7 +292,9 @@ def run_worker(hass, stream, stream_source, stream_settings=None):
         {},
         stream_settings or hass.data[DOMAIN][ATTR_SETTINGS],
         stream_state,
-        KeyFrameConverter(hass, stream_settings, dynamic_stream_settings()),
+        KeyFrameConverter(
+            hass, stream_settings, dynamic_stream_settings(), stream._diagnostics
+        ),
         threading.Event(),
     )
 
@@ -1007,6 +1010,49 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_image_shared(hass: HomeAssistant, h264_video) -> None:
+    """Test requests for the image of a keyframe share one decode and encode."""
+    diagnostics = Diagnostics()
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        converter = KeyFrameConverter(
+            hass,
+            hass.data[DOMAIN][ATTR_SETTINGS],
+            dynamic_stream_settings(),
+            diagnostics,
+        )
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+
+    container = av.open(h264_video)
+    video_stream = container.streams.video[0]
+    keyframes = (
+        packet for packet in container.demux(video_stream) if packet.is_keyframe
+    )
+    converter.create_codec_context(video_stream.codec_context)
+    converter.stash_keyframe_packet(next(keyframes))
+
+    images = await asyncio.gather(*(converter.async_get_image() for _ in range(5)))
+    assert images == [EMPTY_8_6_JPEG] * 5
+    assert encode.call_count == 1
+
+    # Other sizes are encoded from the decoded frame once
+    for _ in range(3):
+        assert await converter.async_get_image(width=4, height=2) == EMPTY_8_6_JPEG
+    assert encode.call_count == 2
+    assert encode.call_args[0][0].shape == (2, 4, 3)
+    assert diagnostics.as_dict() == {"keyframe_decode": 1, "keyframe_image_reused": 6}
+
+    # The next keyframe is decoded again
+    converter.stash_keyframe_packet(next(keyframes))
+    assert await converter.async_get_image(width=4, height=2) == EMPTY_8_6_JPEG
+    assert encode.call_count == 3
+    assert diagnostics.as_dict()["keyframe_decode"] == 2
+    container.close()
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
@@ -3,12 +3,14 @@
 import asyncio
 from copy import deepcopy
 import logging
+from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 import voluptuous as vol
 
 from homeassistant import config_entries, loader
+from homeassistant.auth import EVENT_USER_UPDATED
 from homeassistant.components.device_automation import toggle_entity
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
@@ -16,6 +18,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import DATA_STATES_SNAPSHOT
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
@@ -1195,6 +1198,61 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_shared_snapshot(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribers share the serialized states until a state changes."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.not_permitted", "on")
+
+    async def _subscribe(msg_id: int) -> dict[str, Any]:
+        await websocket_client.send_json({"id": msg_id, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+        return msg["event"]["a"]
+
+    assert set(await _subscribe(7)) == {"light.permitted", "light.not_permitted"}
+    snapshot = hass.data[DATA_STATES_SNAPSHOT]
+    states_json = snapshot.async_states_json(hass_admin_user)
+    assert set(await _subscribe(8)) == {"light.permitted", "light.not_permitted"}
+    assert snapshot.async_states_json(hass_admin_user) is states_json
+
+    hass.states.async_set("light.permitted", "on")
+    assert snapshot.async_states_json(hass_admin_user) is not states_json
+    for msg_id in (7, 8):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["event"]["c"]["light.permitted"]["+"]["s"] == "on"
+    entities = await _subscribe(9)
+    assert entities["light.permitted"]["s"] == "on"
+
+    # Users that cannot read all entities get their own serialized states
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    assert set(await _subscribe(10)) == {"light.permitted"}
+    hass.states.async_set("light.not_permitted", "off")
+    hass.states.async_set("light.permitted", "off")
+    for msg_id in (7, 8, 9, 10):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+    assert msg["event"]["c"]["light.permitted"]["+"]["s"] == "off"
+    assert set(await _subscribe(11)) == {"light.permitted"}
+
+    # The read checks are dropped with the entities and the user changes
+    partition = snapshot._partitions[()]
+    assert set(partition.allowed) == {"light.permitted", "light.not_permitted"}
+    hass.states.async_remove("light.not_permitted")
+    assert set(partition.allowed) == {"light.permitted"}
+    hass.bus.async_fire(EVENT_USER_UPDATED, {"user_id": hass_admin_user.id})
+    assert not snapshot._partitions
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2510,6 +2568,34 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_storage_write_stats(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test getting the write stats of the stores."""
+    stats = {
+        "core.entity_registry": {
+            "writes": 2,
+            "errors": 0,
+            "bytes": 2048,
+            "latency": 0.25,
+            "max_latency": 0.2,
+        }
+    }
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_write_stats",
+        return_value=stats,
+    ):
+        await websocket_client.send_json({"id": 7, "type": "storage/write_stats"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == stats
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -1851,6 +1851,37 @@ async def test_entries_for_label(entity_registry: er.EntityRegistry) -> None:
     assert not er.async_entries_for_label(entity_registry, "")
 
 
+async def test_entries_for_label_and_platform_follow_updates(
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the label and platform indexes follow updates and removals."""
+    hue_entry = entity_registry.async_get_or_create(
+        domain="light", platform="hue", unique_id="123"
+    )
+    zha_entry = entity_registry.async_get_or_create(
+        domain="light", platform="zha", unique_id="123"
+    )
+    hue_entry = entity_registry.async_update_entity(
+        hue_entry.entity_id, labels={"label1"}
+    )
+
+    assert er.async_entries_for_platform(entity_registry, "hue") == [hue_entry]
+    assert er.async_entries_for_platform(entity_registry, "zha") == [zha_entry]
+    assert er.async_entries_for_label(entity_registry, "label1") == [hue_entry]
+
+    hue_entry = entity_registry.async_update_entity(
+        hue_entry.entity_id, labels={"label2"}
+    )
+    assert not er.async_entries_for_label(entity_registry, "label1")
+    assert er.async_entries_for_label(entity_registry, "label2") == [hue_entry]
+    assert er.async_entries_for_platform(entity_registry, "hue") == [hue_entry]
+
+    entity_registry.async_remove(hue_entry.entity_id)
+    assert not er.async_entries_for_label(entity_registry, "label2")
+    assert not er.async_entries_for_platform(entity_registry, "hue")
+    assert er.async_entries_for_platform(entity_registry, "zha") == [zha_entry]
+
+
 async def test_removing_categories(entity_registry: er.EntityRegistry) -> None:
     """Make sure we can clear categories."""
     entry = entity_registry.async_get_or_create(
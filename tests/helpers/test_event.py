@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -25,6 +26,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -1127,6 +1129,85 @@ async def test_track_template_result_none(hass: HomeAssistant) -> None:
     assert wildercard_runs == [(None, 5), (5, 10)]
 
 
+async def test_track_template_result_shared_renders(hass: HomeAssistant) -> None:
+    """Test trackers of the same template share renders for a state change."""
+    template_str = "{{ states('sensor.test') }}"
+    results: list[list[Any]] = [[], [], []]
+
+    def _tracker(idx: int, variables: dict[str, Any] | None):
+        @ha.callback
+        def _listener(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            results[idx].append(updates.pop().result)
+
+        return async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), variables)],
+            _listener,
+        )
+
+    info1 = _tracker(0, None)
+    info2 = _tracker(1, None)
+    info3 = _tracker(2, {"other": "variables"})
+    stats = async_get_template_render_stats(hass)[template_str]
+    assert stats.renders == 3
+    assert stats.shared_renders == 0
+
+    hass.states.async_set("sensor.test", "on")
+    await hass.async_block_till_done()
+    assert results == [["on"]] * 3
+    assert stats.renders == 5
+    assert stats.shared_renders == 1
+    assert stats.cpu_time > 0
+
+    info1.async_remove()
+    hass.states.async_set("sensor.test", "off")
+    await hass.async_block_till_done()
+    assert results[1:] == [["on", "off"]] * 2
+    assert stats.renders == 7
+    assert stats.shared_renders == 1
+
+    info2.async_remove()
+    info3.async_remove()
+    assert template_str not in async_get_template_render_stats(hass)
+
+
+async def test_track_template_result_shared_renders_variable_types(
+    hass: HomeAssistant,
+) -> None:
+    """Test renders are not shared for equal variables of different types."""
+    template_str = "{{ value }} {{ states('sensor.test') }}"
+    results: list[list[Any]] = [[], []]
+
+    def _tracker(idx: int, variables: dict[str, Any]):
+        @ha.callback
+        def _listener(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            results[idx].append(updates.pop().result)
+
+        return async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), variables)],
+            _listener,
+        )
+
+    info1 = _tracker(0, {"value": 1})
+    info2 = _tracker(1, {"value": True})
+    stats = async_get_template_render_stats(hass)[template_str]
+
+    hass.states.async_set("sensor.test", "on")
+    await hass.async_block_till_done()
+    assert results == [["1 on"], ["True on"]]
+    assert stats.shared_renders == 0
+
+    info1.async_remove()
+    info2.async_remove()
+
+
 async def test_track_template_result_super_template(hass: HomeAssistant) -> None:
     """Test tracking template with super template listening to same entity."""
     specific_runs = []
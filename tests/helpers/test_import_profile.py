@@ -0,0 +1,160 @@
+"""Test the integration import profile."""
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant import loader
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.import_profile import STORAGE_KEY, ImportProfile
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+def _mock_integration(domain: str, order: list[str]) -> Mock:
+    """Return a mock integration that records the imports."""
+
+    async def _async_get_component() -> None:
+        order.append(domain)
+
+    async def _async_get_platforms(platforms: list[str]) -> None:
+        order.extend(f"{domain}.{platform}" for platform in platforms)
+
+    integration = Mock(domain=domain, import_executor=True)
+    integration.async_get_component = _async_get_component
+    integration.async_get_platforms = _async_get_platforms
+    return integration
+
+
+async def test_profile_saved_and_loaded(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the timings are saved and update the predictions."""
+    hass.data[loader.DATA_COMPONENTS]["mock_light"] = Mock()
+    hass.data[loader.DATA_COMPONENTS]["mock_light.light"] = Mock()
+    hass.data[loader.DATA_COMPONENTS]["mock_light.config_flow"] = Mock()
+
+    profile = ImportProfile(hass)
+    await profile.async_load()
+    assert profile.predicted == {}
+    profile.async_update(
+        {"mock_light", "mock_sensor"}, {"mock_light": 2.0}, {"mock_light": 4.0}
+    )
+    assert profile.async_report() == {
+        "mock_light": {
+            "import_time": 2.0,
+            "predicted_import_time": None,
+            "setup_time": 4.0,
+            "predicted_setup_time": None,
+        },
+        "mock_sensor": {
+            "import_time": 0.0,
+            "predicted_import_time": None,
+            "setup_time": 0.0,
+            "predicted_setup_time": None,
+        },
+    }
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"] == {
+        "mock_light": {
+            "import_time": 2.0,
+            "setup_time": 4.0,
+            "platforms": ["config_flow", "light"],
+        },
+        "mock_sensor": {"import_time": 0.0, "setup_time": 0.0, "platforms": []},
+    }
+
+    profile = ImportProfile(hass)
+    await profile.async_load()
+    assert profile.predicted["mock_light"].import_time == 2.0
+    profile.async_update({"mock_light"}, {"mock_light": 1.0}, {"mock_light": 2.0})
+    assert profile.async_report() == {
+        "mock_light": {
+            "import_time": 1.0,
+            "predicted_import_time": 2.0,
+            "setup_time": 2.0,
+            "predicted_setup_time": 4.0,
+        },
+    }
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"]["mock_light"]["import_time"] == 1.5
+    assert hass_storage[STORAGE_KEY]["data"]["mock_light"]["setup_time"] == 3.0
+
+
+async def test_preimport_slowest_first(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations are imported by predicted import time."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "fast": {"import_time": 0.1, "setup_time": 5.0, "platforms": []},
+            "slow": {
+                "import_time": 3.0,
+                "setup_time": 0.1,
+                "platforms": ["config_flow", "sensor"],
+            },
+            "medium": {"import_time": 1.0, "setup_time": 0.1, "platforms": []},
+        },
+    }
+    profile = ImportProfile(hass)
+    await profile.async_load()
+
+    order: list[str] = []
+    integrations = [
+        _mock_integration(domain, order)
+        for domain in ("fast", "medium", "slow", "unknown")
+    ]
+    with patch(
+        "homeassistant.helpers.import_profile.requirements.async_get_integration_with_requirements",
+        AsyncMock(),
+    ):
+        await profile.async_preimport(integrations, 1)
+
+    assert order == ["slow", "slow.config_flow", "slow.sensor", "medium", "fast"]
+
+
+async def test_preimport_skips_missing_requirements(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations and platforms are not imported without requirements."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "broken": {"import_time": 3.0, "setup_time": 0.1, "platforms": []},
+            "working": {
+                "import_time": 1.0,
+                "setup_time": 0.1,
+                "platforms": ["broken", "config_flow"],
+            },
+        },
+    }
+    profile = ImportProfile(hass)
+    await profile.async_load()
+
+    async def _async_get_integration_with_requirements(
+        hass: HomeAssistant, domain: str
+    ) -> None:
+        if domain == "broken":
+            raise HomeAssistantError
+        if domain == "config_flow":
+            raise loader.IntegrationNotFound(domain)
+
+    order: list[str] = []
+    with patch(
+        "homeassistant.helpers.import_profile.requirements.async_get_integration_with_requirements",
+        _async_get_integration_with_requirements,
+    ):
+        await profile.async_preimport(
+            [_mock_integration(domain, order) for domain in ("broken", "working")], 2
+        )
+
+    assert order == ["working", "working.config_flow"]
@@ -3,9 +3,11 @@
 from collections.abc import Coroutine
 from datetime import datetime, timedelta
 import logging
+from pathlib import Path
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -16,10 +18,16 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
+    COMPACT_INTERVAL,
     DATA_RESTORE_STATE,
+    JOURNAL_KEY,
+    STATE_DUMP_INTERVAL,
     STORAGE_KEY,
+    ExtraStoredData,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
+    RestoreStateJournal,
     StoredState,
     async_get,
     async_load,
@@ -53,7 +61,6 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
 
     # Emulate a fresh load
     hass.data.pop(DATA_RESTORE_STATE)
@@ -67,6 +74,9 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     assert data.last_states == {}
+    # Let the dump at start finish before writing the states to load
+    await hass.async_block_till_done()
+    await data.store.async_save([state.as_dict() for state in stored_states])
 
     await async_load(hass)
     data = async_get(hass)
@@ -119,7 +129,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     entity.entity_id = "input_boolean.b1"
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -127,7 +137,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
@@ -135,7 +145,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -143,7 +153,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
         await hass.async_block_till_done()
@@ -167,7 +177,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     entity.entity_id = "input_boolean.b1"
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -176,7 +186,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
         await hass.async_block_till_done()
@@ -185,7 +195,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert not mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         await RestoreStateData.async_save_persistent_states(hass)
         await hass.async_block_till_done()
@@ -193,7 +203,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
         await hass.async_block_till_done()
@@ -201,7 +211,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -336,14 +346,24 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     for state in states:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with (
+        patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data,
+        patch(
+            "homeassistant.helpers.restore_state.RestoreStateJournal.async_append"
+        ) as mock_append,
+    ):
         await data.async_dump_states()
 
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    # Only the changes since the last dump are written
+    assert not mock_write_data.called
+    assert mock_append.mock_calls[0][1][0] == [
+        {"entity_id": "input_boolean.b1", "stored_state": None, "time": ANY}
+    ]
+    written_states = [
+        stored_state.as_dict() for stored_state in data.async_get_stored_states()
+    ]
     assert len(written_states) == 2
     state0 = json_round_trip(written_states[0])
     state1 = json_round_trip(written_states[1])
@@ -353,6 +373,181 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changes_to_journal(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Test only changed stored states are journaled until the next compaction."""
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity with extra data."""
+
+        extra: dict[str, Any] = {"value": 1}
+
+        @property
+        def extra_restore_state_data(self) -> ExtraStoredData:
+            """Return the extra data."""
+            return RestoredExtraData(dict(self.extra))
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for object_id in ("b0", "b1", "b2"):
+        entity = MockRestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.{object_id}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 3
+    assert JOURNAL_KEY not in hass_storage
+
+    # Nothing changed
+    await data.async_dump_states()
+    assert JOURNAL_KEY not in hass_storage
+
+    hass.states.async_set("input_boolean.b0", "off")
+    entities[1].extra = {"value": 2}
+    await data.async_dump_states()
+    assert [
+        (record["entity_id"], record["stored_state"]["state"]["state"])
+        for record in hass_storage[JOURNAL_KEY]
+    ] == [("input_boolean.b0", "off"), ("input_boolean.b1", "on")]
+    assert hass_storage[JOURNAL_KEY][1]["stored_state"]["extra_data"] == {"value": 2}
+    # The snapshot is not rewritten
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "on",
+        "on",
+        "on",
+    ]
+
+    # The journal is replayed on load
+    await data.async_load()
+    assert data.last_states["input_boolean.b0"].state.state == "off"
+    assert data.last_states["input_boolean.b1"].extra_data.as_dict() == {"value": 2}
+    assert data.last_states["input_boolean.b2"].state.state == "on"
+
+    # All stored states are written after loading
+    hass.states.async_set("input_boolean.b2", "off")
+    await data.async_dump_states()
+    assert JOURNAL_KEY not in hass_storage
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "off",
+        "on",
+        "off",
+    ]
+
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_KEY]) == 1
+
+    # And once a day
+    freezer.tick(COMPACT_INTERVAL)
+    await data.async_dump_states()
+    assert JOURNAL_KEY not in hass_storage
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "off",
+        "off",
+        "off",
+    ]
+
+    # Removed stored states are journaled
+    await entities[2].async_remove()
+    hass.states.async_set("input_boolean.b2", "off")
+    await data.async_dump_states()
+    assert hass_storage[JOURNAL_KEY] == [
+        {
+            "entity_id": "input_boolean.b2",
+            "stored_state": None,
+            "time": dt_util.utcnow().timestamp(),
+        }
+    ]
+    await data.async_load()
+    assert "input_boolean.b2" not in data.last_states
+
+
+async def test_compaction_interrupted(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the journal left by an interrupted compaction is not replayed."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await platform.async_add_entities([entity])
+
+    data = async_get(hass)
+    hass.states.async_set("input_boolean.b0", "on")
+    await data.async_dump_states()
+    freezer.tick(STATE_DUMP_INTERVAL)
+    hass.states.async_set("input_boolean.b0", "off")
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_KEY]) == 1
+
+    freezer.tick(COMPACT_INTERVAL)
+    hass.states.async_set("input_boolean.b0", "on")
+    with patch(
+        "homeassistant.helpers.restore_state.RestoreStateJournal._async_remove",
+        side_effect=OSError,
+    ):
+        await data.async_dump_states()
+    # The stored states are written before the journal is removed
+    assert hass_storage[STORAGE_KEY]["data"][0]["state"]["state"] == "on"
+    assert len(hass_storage[JOURNAL_KEY]) == 1
+
+    await data.async_load()
+    assert data.last_states["input_boolean.b0"].state.state == "on"
+
+    # The journal is removed by the next compaction
+    freezer.tick(STATE_DUMP_INTERVAL)
+    await data.async_dump_states()
+    assert JOURNAL_KEY not in hass_storage
+    freezer.tick(STATE_DUMP_INTERVAL)
+    hass.states.async_set("input_boolean.b0", "off")
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_KEY]) == 1
+    await data.async_load()
+    assert data.last_states["input_boolean.b0"].state.state == "off"
+
+
+async def test_journal_file(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test reading and writing the journal file."""
+    journal = RestoreStateJournal(hass)
+    journal.path = str(tmp_path / JOURNAL_KEY)
+    assert journal._read_records() == []
+
+    now = dt_util.utcnow()
+    stored_state = StoredState(State("input_boolean.b0", "on"), None, now)
+    journal._append_records(
+        [
+            {
+                "entity_id": "input_boolean.b0",
+                "stored_state": stored_state.as_dict(),
+                "time": now.timestamp(),
+            }
+        ]
+    )
+    journal._append_records(
+        [{"entity_id": "input_boolean.b1", "stored_state": None, "time": 0.0}]
+    )
+    # An interrupted write
+    with open(journal.path, "ab") as file:
+        file.write(b'{"entity_id": "input_')
+
+    records = journal._read_records()
+    assert [record["entity_id"] for record in records] == [
+        "input_boolean.b0",
+        "input_boolean.b1",
+    ]
+    assert StoredState.from_dict(records[0]["stored_state"]).last_seen == now
+
+    journal._remove()
+    journal._remove()
+    assert journal._read_records() == []
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
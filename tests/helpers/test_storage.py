@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+import threading
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -851,3 +852,143 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_writes_batched_across_stores(tmpdir: py.path.local) -> None:
+    """Test the writes of stores saved together are written in one batch."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        atomic_store = storage.Store(
+            hass, MOCK_VERSION, "storage-test-atomic", atomic_writes=True
+        )
+        private_store = storage.Store(
+            hass, MOCK_VERSION, "storage-test-private", True, atomic_writes=True
+        )
+        bad_store = storage.Store(hass, MOCK_VERSION, "storage-test-bad")
+
+        with patch(
+            "homeassistant.helpers.storage._write_batch",
+            wraps=storage._write_batch,
+        ) as mock_write_batch:
+            results = await asyncio.gather(
+                store.async_save(MOCK_DATA),
+                atomic_store.async_save(MOCK_DATA2),
+                private_store.async_save(MOCK_DATA),
+                bad_store.async_save({"bad": object()}),
+                return_exceptions=True,
+            )
+
+        assert results == [None, None, None, None]
+        assert len(mock_write_batch.mock_calls) == 1
+        for written_store, data in (
+            (store, MOCK_DATA),
+            (atomic_store, MOCK_DATA2),
+            (private_store, MOCK_DATA),
+        ):
+            written = await hass.async_add_executor_job(
+                storage.json_util.load_json, written_store.path
+            )
+            assert written["data"] == data
+        assert os.stat(atomic_store.path).st_mode & 0o777 == 0o644
+        assert os.stat(private_store.path).st_mode & 0o777 == 0o600
+        assert not os.path.exists(bad_store.path)
+
+        stats = storage.async_get_write_stats(hass)
+        assert stats[MOCK_KEY]["writes"] == 1
+        assert stats[MOCK_KEY]["errors"] == 0
+        assert stats[MOCK_KEY]["bytes"] == os.path.getsize(store.path)
+        assert stats["storage-test-bad"]["errors"] == 1
+        assert stats["storage-test-bad"]["bytes"] == 0
+
+        await hass.async_stop(force=True)
+
+
+async def test_writes_during_batch_batched(tmpdir: py.path.local) -> None:
+    """Test writes requested while a batch is written are written together."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+        stores = [
+            storage.Store(hass, MOCK_VERSION, f"storage-test-{idx}", atomic_writes=True)
+            for idx in range(4)
+        ]
+        writing = threading.Event()
+        release = threading.Event()
+        batches: list[list[str]] = []
+        orig_write_batch = storage._write_batch
+
+        def write_batch(batch):
+            batches.append([pending.store.key for pending in batch])
+            writing.set()
+            release.wait()
+            return orig_write_batch(batch)
+
+        with (
+            patch("homeassistant.helpers.storage._write_batch", write_batch),
+            patch("homeassistant.util.file.os.fsync", wraps=os.fsync) as mock_fsync,
+        ):
+            first = hass.async_create_task(stores[0].async_save(MOCK_DATA))
+            await hass.async_add_executor_job(writing.wait)
+            others = [
+                hass.async_create_task(store.async_save(MOCK_DATA2))
+                for store in stores[1:]
+            ]
+            writer = storage._async_get_writer(hass)
+            while len(writer._pending) < 3:
+                await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, *others)
+
+        assert batches == [
+            ["storage-test-0"],
+            ["storage-test-1", "storage-test-2", "storage-test-3"],
+        ]
+        # Every file and the storage directory once per batch
+        assert len(mock_fsync.mock_calls) == 4 + 2
+        for store, data in zip(stores, (MOCK_DATA, *[MOCK_DATA2] * 3), strict=True):
+            written = await hass.async_add_executor_job(
+                storage.json_util.load_json, store.path
+            )
+            assert written["data"] == data
+        stats = storage.async_get_write_stats(hass)["storage-test-1"]
+        assert stats["writes"] == 1
+        assert stats["max_latency"] >= 0
+
+        await hass.async_stop(force=True)
+
+
+async def test_write_batch_failed(hass: HomeAssistant) -> None:
+    """Test the writes of a batch fail when the batch can't be written."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    writer = storage._async_get_writer(hass)
+
+    with patch(
+        "homeassistant.helpers.storage._write_batch", side_effect=RuntimeError
+    ), pytest.raises(RuntimeError):
+        await writer.async_write(store, {"data": MOCK_DATA})
+    assert storage.async_get_write_stats(hass)[MOCK_KEY]["errors"] == 1
+
+    writing = asyncio.Event()
+
+    async def add_executor_job(*args):
+        writing.set()
+        await asyncio.Event().wait()
+
+    with patch.object(hass, "async_add_executor_job", add_executor_job):
+        write = hass.async_create_task(writer.async_write(store, {"data": MOCK_DATA}))
+        await writing.wait()
+        waiting = hass.async_create_task(
+            writer.async_write(store, {"data": MOCK_DATA2})
+        )
+        await asyncio.sleep(0)
+        writer._flush_task.cancel()
+        with pytest.raises(HomeAssistantError):
+            await write
+        with pytest.raises(HomeAssistantError):
+            await waiting
+    assert writer._flush_task is None
+    assert storage.async_get_write_stats(hass)[MOCK_KEY]["errors"] == 3
@@ -8,6 +8,7 @@ import json
 import logging
 import math
 import random
+import sys
 from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
@@ -21,6 +22,7 @@ from homeassistant.components import group
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -289,6 +291,103 @@ async def test_import(hass: HomeAssistant) -> None:
         ).async_render()
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled templates are persisted and reused after a restart."""
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert bytecode_cache.hits == 0
+    assert bytecode_cache.misses == 1
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]
+    assert len(stored["data"]["templates"]) == 1
+
+    # Simulate a restart with new environments
+    hass.data.pop("template.environment")
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == 4
+    assert bytecode_cache.hits == 1
+    assert bytecode_cache.misses == 1
+    assert bytecode_cache.compile_time_saved > 0
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]
+    assert len(stored["data"]["templates"]) == 2
+
+    # Templates not compiled during startup are pruned
+    stored["data"]["templates"]["unused"] = [0.1, ""]
+    hass.data.pop("template.environment")
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == 4
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]
+    assert len(stored["data"]["templates"]) == 1
+
+    # Templates compiled after startup are persisted once compiled again
+    assert template.Template("{{ 3 + 3 }}", hass).async_render() == 6
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]
+    assert len(stored["data"]["templates"]) == 1
+    hass.data["template.environment"].template_cache.clear()
+    assert template.Template("{{ 3 + 3 }}", hass).async_render() == 6
+    assert bytecode_cache.hits == 2
+    assert bytecode_cache.misses == 1
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]
+    assert len(stored["data"]["templates"]) == 2
+
+    # Compiled templates of another build are discarded
+    stored["data"]["build"] = "0.0.0"
+    hass.data.pop("template.environment")
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == 4
+    assert bytecode_cache.hits == 0
+    assert bytecode_cache.misses == 1
+
+    # Compiled templates of another Python version are discarded
+    with patch.object(sys, "version", "0.0.0"):
+        assert template._bytecode_build() != stored["data"]["build"]
+
+
+async def test_bytecode_cache_size(hass: HomeAssistant) -> None:
+    """Test the number of compiled templates kept is limited."""
+    with patch.object(template, "BYTECODE_CACHE_SIZE", 2):
+        bytecode_cache = template.TemplateBytecodeCache(hass)
+    hass.data[template._BYTECODE_CACHE] = bytecode_cache
+    for number in range(3):
+        assert template.Template(f"{{{{ {number} }}}}", hass).async_render() == number
+    assert bytecode_cache.misses == 3
+    assert len(bytecode_cache._data_to_save()["templates"]) == 2
+    await hass.async_block_till_done()
+
+
 async def test_import_change(hass: HomeAssistant) -> None:
     """Test that a change in HassLoader results in updated imports."""
     await template.async_load_custom_templates(hass)
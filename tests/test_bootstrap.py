@@ -614,6 +614,29 @@ async def test_setup_hass(
     assert len(mock_process_ha_config_upgrade.mock_calls) == 1
 
     assert hass == async_get_hass()
+    assert hass.import_executor._max_workers == 1
+
+
+@pytest.mark.parametrize("hass_config", [{"browser": {}}])
+async def test_setup_hass_import_workers(
+    mock_hass_config: None,
+    mock_enable_logging: Mock,
+    mock_is_virtual_env: Mock,
+    mock_mount_local_lib_path: AsyncMock,
+    mock_ensure_config_exists: AsyncMock,
+    mock_process_ha_config_upgrade: Mock,
+) -> None:
+    """Test the size of the import executor is set from the runtime config."""
+    hass = await bootstrap.async_setup_hass(
+        runner.RuntimeConfig(
+            config_dir=get_test_config_dir(),
+            skip_pip=True,
+            recovery_mode=False,
+            import_workers=2,
+        ),
+    )
+
+    assert hass.import_executor._max_workers == 2
 
 
 @pytest.mark.parametrize("hass_config", [{"browser": {}, "frontend": {}}])
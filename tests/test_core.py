@@ -1142,6 +1142,93 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can route events by a key of the event data."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    index = {"light.kitchen"}
+    unsub = hass.bus.async_listen_keyed(
+        "test", listener, "entity_id", index, run_immediately=True
+    )
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 1
+
+    # The index is not copied
+    index.add("light.living_room")
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    assert len(calls) == 2
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 2
+    assert "test" not in hass.bus.async_listeners()
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(EVENT_STATE_REPORTED, listener, "entity_id", index)
+
+
+async def test_eventbus_dispatch_updates_with_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test listeners added or removed while firing apply to the next event."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(("listener", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        calls.append(("match_all", event.event_type))
+        unsub_match_all()
+
+    @ha.callback
+    def reported_listener(event):
+        """Mock state reported listener."""
+        calls.append(("reported", event.event_type))
+
+    unsub = hass.bus.async_listen("test", listener, run_immediately=True)
+    unsub_match_all = hass.bus.async_listen(
+        MATCH_ALL, match_all_listener, run_immediately=True
+    )
+    unsub_reported = hass.bus.async_listen(
+        EVENT_STATE_REPORTED,
+        reported_listener,
+        event_filter=ha.callback(lambda event_data: True),
+        run_immediately=True,
+    )
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test")
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {})
+    assert calls == [
+        ("listener", "test"),
+        ("match_all", "test"),
+        ("listener", "test"),
+        ("reported", EVENT_STATE_CHANGED),
+    ]
+
+    unsub()
+    unsub_reported()
+    calls.clear()
+    hass.bus.async_fire("test")
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {})
+    assert calls == []
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -7,7 +7,12 @@ from unittest.mock import patch
 import py
 import pytest
 
-from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
+from homeassistant.util.file import (
+    WriteError,
+    write_utf8_file,
+    write_utf8_file_atomic,
+    write_utf8_files_atomic,
+)
 
 
 @pytest.mark.parametrize("func", [write_utf8_file, write_utf8_file_atomic])
@@ -88,3 +93,45 @@ def test_write_utf8_file_atomic_fails(tmpdir: py.path.local) -> None:
         write_utf8_file_atomic(test_file, '{"some":"data"}', False)
 
     assert not os.path.exists(test_file)
+
+
+def test_write_utf8_files_atomic(tmpdir: py.path.local) -> None:
+    """Test writing files together, each all or nothing."""
+    test_dir = tmpdir.mkdir("files")
+    test_file = Path(test_dir / "test.json")
+    private_file = Path(test_dir / "private.json")
+    missing_dir_file = Path(test_dir / "missing" / "test.json")
+
+    with patch("homeassistant.util.file.os.fsync", wraps=os.fsync) as mock_fsync:
+        errors = write_utf8_files_atomic(
+            [
+                (str(test_file), '{"some":"data"}', False, "w"),
+                (str(missing_dir_file), '{"some":"data"}', False, "w"),
+                (str(private_file), b'{"some":"data"}', True, "wb"),
+            ]
+        )
+
+    assert errors[0] is None
+    assert isinstance(errors[1], WriteError)
+    assert errors[2] is None
+    # The two files and their directory once
+    assert len(mock_fsync.mock_calls) == 3
+    for path, mode in ((test_file, 0o644), (private_file, 0o600)):
+        with open(path) as fh:
+            assert fh.read() == '{"some":"data"}'
+        assert os.stat(path).st_mode & 0o777 == mode
+    assert not os.path.exists(missing_dir_file)
+
+
+def test_write_utf8_files_atomic_fails_at_rename(tmpdir: py.path.local) -> None:
+    """Test a file that fails to be renamed is cleaned up."""
+    test_dir = tmpdir.mkdir("files")
+    test_file = Path(test_dir / "test.json")
+
+    with patch("homeassistant.util.file.os.replace", side_effect=OSError):
+        errors = write_utf8_files_atomic(
+            [(str(test_file), '{"some":"data"}', False, "w")]
+        )
+
+    assert isinstance(errors[0], WriteError)
+    assert os.listdir(test_dir) == []